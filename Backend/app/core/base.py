@@ -3,4 +3,8 @@ from sqlalchemy import Integer
 
 
 class Base(DeclarativeBase):
+    # Fetch server-generated values (created/updated) with RETURNING on flush,
+    # so they never need a lazy refresh, which an AsyncSession can't do
+    __mapper_args__ = {"eager_defaults": True}
+
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
@@ -1,23 +1,93 @@
+import time
+from typing import Optional
 from .settings import settings
-from sqlalchemy import create_engine
+from fastapi import Request
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 from .logger import logger
+from .pool_metrics import PoolMetrics, timed_pool
 
 import Backend.app.models.auth
 import Backend.app.models.absence
 import Backend.app.models.care_visit
 import Backend.app.models.customer
+import Backend.app.models.email_outbox
 import Backend.app.models.employee
 import Backend.app.models.measure
-import Backend.app.models.schedule  # noqa: F401
+import Backend.app.models.schedule
+import Backend.app.models.schedule_template  # noqa: F401
 
 
-engine = create_engine(f"{settings.DB_URL}", echo=settings.DEBUG)
+def _pool_options() -> dict:
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT_SECONDS,
+        "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+
+def _statement_timeout() -> str:
+    return str(settings.DB_STATEMENT_TIMEOUT_MS)
+
+
+engine = create_engine(
+    f"{settings.DB_URL}",
+    echo=settings.DEBUG,
+    poolclass=timed_pool(QueuePool, PoolMetrics()),
+    connect_args={"options": f"-c statement_timeout={_statement_timeout()}"},
+    **_pool_options(),
+)
 
 # SessionLocal for scripts and standalone usage
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
+def async_url(url: str) -> URL:
+    """The same database through the asyncpg driver"""
+    return make_url(url).set(drivername="postgresql+asyncpg")
+
+
+def _create_async_engine(url: str) -> AsyncEngine:
+    return create_async_engine(
+        async_url(url),
+        echo=settings.DEBUG,
+        poolclass=timed_pool(AsyncAdaptedQueuePool, PoolMetrics()),
+        connect_args={"server_settings": {"statement_timeout": _statement_timeout()}},
+        **_pool_options(),
+    )
+
+
+# Routers use the async engine, so queries await instead of blocking the loop
+async_engine = _create_async_engine(settings.DB_URL)
+AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False)
+
+# List/get routes read from the replica when DB_READ_URL is set. Read
+# sessions are read-only on the primary too, so a route that writes through
+# get_async_read_db fails in development rather than only against a replica.
+replica_engine: Optional[AsyncEngine] = (
+    _create_async_engine(settings.DB_READ_URL) if settings.DB_READ_URL else None
+)
+async_read_engine = (replica_engine or async_engine).execution_options(
+    postgresql_readonly=True
+)
+primary_read_engine = async_engine.execution_options(postgresql_readonly=True)
+AsyncReadSessionLocal = async_sessionmaker(async_read_engine, expire_on_commit=False)
+
+# Unix time until which the client's reads go to the primary, set by the
+# read_your_writes middleware after a request committed
+READ_PRIMARY_COOKIE = "read_primary_until"
+
+
 def init_db():
     from .base import Base
 
@@ -37,5 +107,59 @@ def get_db():
         raise e
 
 
+def track_writes(session: AsyncSession, request: Request) -> None:
+    """Flag request.state.db_committed once the session commits"""
+    session.info["request_state"] = request.state
+
+
+@event.listens_for(Session, "after_commit")
+def _mark_committed(session: Session) -> None:
+    state = session.info.get("request_state")
+    if state is not None:
+        state.db_committed = True
+
+
+def reads_from_primary(cookie: Optional[str]) -> bool:
+    """Whether the READ_PRIMARY_COOKIE value is still within its window"""
+    try:
+        return cookie is not None and float(cookie) > time.time()
+    except ValueError:
+        return False
+
+
+async def get_async_db(request: Request):
+    """
+    AsyncSession for routers. The CRUD functions are shared with the sync
+    session and run through AsyncSession.run_sync, e.g.
+    await db.run_sync(get_customers, skip=0, limit=100)
+    """
+    try:
+        async with AsyncSessionLocal() as session:
+            track_writes(session, request)
+            yield session
+    except Exception as e:
+        logger.error(f"❌ Error getting database session: {e}")
+        raise e
+
+
+async def get_async_read_db(request: Request):
+    """
+    Read-only AsyncSession for list and get routes. Uses the replica when
+    DB_READ_URL is set, except for clients that committed a write within
+    the last READ_YOUR_WRITES_SECONDS, which read their writes from the primary.
+    """
+    bind = async_read_engine
+    if replica_engine is not None and reads_from_primary(
+        request.cookies.get(READ_PRIMARY_COOKIE)
+    ):
+        bind = primary_read_engine
+    try:
+        async with AsyncReadSessionLocal(bind=bind) as session:
+            yield session
+    except Exception as e:
+        logger.error(f"❌ Error getting database session: {e}")
+        raise e
+
+
 if __name__ == "__main__":
     init_db()
@@ -56,3 +56,16 @@ class Gender(str, Enum):
     MALE = "male"
     FEMALE = "female"
     UNSPECIFIED = "unspecified"
+
+
+class OutboxStatus(str, Enum):
+    PENDING = "pending"
+    SENT = "sent"
+    FAILED = "failed"
+
+
+class InviteStatus(str, Enum):
+    INVITED = "invited"
+    EXISTS = "exists"
+    DUPLICATE = "duplicate"
+    INVALID = "invalid"
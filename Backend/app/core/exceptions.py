@@ -32,3 +32,15 @@ class ScheduleNotFoundError(Exception):
     def __init__(self, schedule_id: int):
         self.schedule_id = schedule_id
         super().__init__(f"Schedule with ID {schedule_id} not found")
+
+
+class ScheduleTemplateNotFoundError(Exception):
+    def __init__(self, template_id: int):
+        self.template_id = template_id
+        super().__init__(f"Schedule template with ID {template_id} not found")
+
+
+class InvalidCursorError(ValueError):
+    def __init__(self, cursor: str):
+        self.cursor = cursor
+        super().__init__(f"Invalid cursor: {cursor}")
@@ -0,0 +1,66 @@
+from datetime import datetime, UTC
+from threading import Lock
+import time
+from typing import Optional
+
+from .settings import settings
+
+
+class LastSeenBuffer:
+    """
+    Write-behind buffer of last-seen timestamps per user and token.
+
+    Authentication only records the time in memory; a background task
+    writes the buffered times with one UPDATE per table when the buffer is
+    due (flush_seconds since the last flush, or max_entries buffered).
+    """
+
+    def __init__(self, flush_seconds: int, max_entries: int):
+        self.flush_seconds = flush_seconds
+        self.max_entries = max_entries
+        self._users: dict[int, datetime] = {}
+        self._tokens: dict[int, datetime] = {}
+        self._last_flush = time.monotonic()
+        self._lock = Lock()
+
+    def touch(self, user_id: int, token_id: Optional[int] = None) -> None:
+        now = datetime.now(UTC).replace(tzinfo=None)
+        with self._lock:
+            self._users[user_id] = now
+            if token_id is not None:
+                self._tokens[token_id] = now
+
+    def merge(self, users: dict[int, datetime], tokens: dict[int, datetime]) -> None:
+        """Put back entries from a failed flush, keeping the newest time"""
+        with self._lock:
+            for target, seen in ((self._users, users), (self._tokens, tokens)):
+                for key, timestamp in seen.items():
+                    if key not in target or target[key] < timestamp:
+                        target[key] = timestamp
+
+    def drain(self) -> tuple[dict[int, datetime], dict[int, datetime]]:
+        with self._lock:
+            users, self._users = self._users, {}
+            tokens, self._tokens = self._tokens, {}
+            self._last_flush = time.monotonic()
+        return users, tokens
+
+    def is_due(self) -> bool:
+        with self._lock:
+            pending = len(self._users) + len(self._tokens)
+            if not pending:
+                return False
+            return (
+                pending >= self.max_entries
+                or time.monotonic() - self._last_flush >= self.flush_seconds
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._users) + len(self._tokens)
+
+
+last_seen = LastSeenBuffer(
+    flush_seconds=settings.LAST_SEEN_FLUSH_SECONDS,
+    max_entries=settings.LAST_SEEN_MAX_ENTRIES,
+)
@@ -0,0 +1,23 @@
+import base64
+import binascii
+from datetime import date
+
+from .exceptions import InvalidCursorError
+
+# Response header carrying the cursor of the next page, absent on the last page
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(day: date, row_id: int) -> str:
+    """Opaque cursor for keyset pagination on (date, id)"""
+    raw = f"{day.isoformat()}:{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[date, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        day, row_id = base64.urlsafe_b64decode(padded).decode().split(":")
+        return date.fromisoformat(day), int(row_id)
+    except (ValueError, binascii.Error):
+        raise InvalidCursorError(cursor)
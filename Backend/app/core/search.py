@@ -0,0 +1,65 @@
+import weakref
+from typing import Any
+
+from sqlalchemy import ColumnElement, func, literal, or_, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+# Shorter text queries match too much of every table to be worth running
+SEARCH_MIN_QUERY_LENGTH = 2
+
+# Whether pg_trgm is installed, per engine; the migration skips it where the
+# server doesn't ship the extension, so the answer can differ between databases
+_trigram_support: "weakref.WeakKeyDictionary[Engine, bool]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def trigram_enabled(db: Session) -> bool:
+    engine = db.get_bind()
+    if isinstance(engine, Engine) and engine in _trigram_support:
+        return _trigram_support[engine]
+    enabled = db.execute(
+        text("SELECT EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm')")
+    ).scalar_one()
+    if isinstance(engine, Engine):
+        _trigram_support[engine] = enabled
+    return enabled
+
+
+def _contains_pattern(query: str) -> str:
+    escaped = query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def text_search(
+    query: str, columns: list[Any], trigram: bool
+) -> tuple[ColumnElement[bool], ColumnElement[Any] | None]:
+    """
+    Match condition and relevance for a free-text query over columns. With
+    pg_trgm the substring match is served by the GIN trigram indexes and
+    word similarity also catches misspellings; rows rank by their best
+    matching column. Without the extension it is a plain ILIKE and there
+    is no rank.
+    """
+    pattern = _contains_pattern(query)
+    conditions = [column.ilike(pattern, escape="\\") for column in columns]
+    if not trigram:
+        return or_(*conditions), None
+
+    term = literal(query)
+    conditions += [term.op("<%")(column) for column in columns]
+    rank = func.greatest(*(func.word_similarity(term, column) for column in columns))
+    return or_(*conditions), rank
+
+
+def search_term(query: str | None) -> str | None:
+    """The stripped query, None when empty; too short a query is a ValueError"""
+    query = (query or "").strip()
+    if not query:
+        return None
+    if len(query) < SEARCH_MIN_QUERY_LENGTH:
+        raise ValueError(
+            f"Search query must be at least {SEARCH_MIN_QUERY_LENGTH} characters"
+        )
+    return query
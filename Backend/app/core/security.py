@@ -1,17 +1,22 @@
 import base64
 from random import SystemRandom
 from typing import Annotated, List
-from datetime import datetime, UTC
+from datetime import datetime, timedelta, UTC
 
+import jwt
 from passlib.context import CryptContext
 from sqlalchemy import select
 from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status, Depends
 from fastapi.security import OAuth2PasswordBearer
 
 from ..models.auth import Token, User
 from .enums import RoleType
-from .db_setup import get_db
+from .db_setup import get_async_db
+from .settings import settings
+from .token_cache import token_cache, revocation_list, CachedPrincipal
+from .last_seen import last_seen
 
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/token")
@@ -19,6 +24,8 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/token")
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 DEFAULT_ENTROPY = 32
+# A reused token must stay valid at least this long after login
+TOKEN_REUSE_MIN_REMAINING = timedelta(hours=1)
 _sysrand = SystemRandom()
 
 
@@ -44,14 +51,93 @@ def token_url_safe(nbytes=None):
     return base64.urlsafe_b64encode(tok).rstrip(b"=").decode("ascii")
 
 
-def create_database_token(user_id: int, db: Session):
+def create_database_token(user_id: int, db: Session, client_id: str | None = None):
+    """
+    With TOKEN_REUSE and a client_id, a login from a client that already
+    holds a valid token gets that token back instead of a new row.
+    """
+    if settings.TOKEN_REUSE and client_id:
+        valid_until = datetime.now(UTC).replace(tzinfo=None) + TOKEN_REUSE_MIN_REMAINING
+        existing = (
+            db.execute(
+                select(Token)
+                .where(
+                    Token.user_id == user_id,
+                    Token.client_id == client_id,
+                    Token.expire_date > valid_until,
+                )
+                .order_by(Token.expire_date.desc())
+                .limit(1)
+            )
+            .scalars()
+            .first()
+        )
+        if existing:
+            return existing
+
     token = token_url_safe()
-    new_token = Token(token=token, user_id=user_id)
+    new_token = Token(token=token, user_id=user_id, client_id=client_id)
     db.add(new_token)
     db.commit()
     return new_token
 
 
+def create_access_token(user: User, session_token: Token) -> str:
+    """
+    Short-lived signed token carrying what authorization needs, so requests
+    can be authenticated without a database lookup. "sid" points at the
+    database token it was issued from (the refresh token).
+    """
+    now = datetime.now(UTC)
+    employee = user.employee
+    payload = {
+        "sub": str(user.id),
+        "name": user.username,
+        "email": user.email,
+        "su": bool(user.is_superuser),
+        "emp": employee.id if employee else None,
+        "role": RoleType(employee.role).value if employee and employee.role else None,
+        "sid": session_token.id,
+        "jti": token_url_safe(16),
+        "iat": now,
+        "exp": now + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES),
+    }
+    return jwt.encode(payload, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+
+
+def decode_access_token(token_str: str) -> dict:
+    try:
+        return jwt.decode(
+            token_str, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
+        )
+    except jwt.ExpiredSignatureError:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token has expired",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    except jwt.InvalidTokenError:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
+def issue_tokens(user: User, db: Session, client_id: str | None = None) -> dict:
+    """Login response for the configured TOKEN_MODE"""
+    session_token = create_database_token(user.id, db, client_id)
+    if settings.TOKEN_MODE != "jwt":
+        return {"access_token": session_token.token, "token_type": "bearer"}
+
+    return {
+        "access_token": create_access_token(user, session_token),
+        "refresh_token": session_token.token,
+        "token_type": "bearer",
+        "expires_in": settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+    }
+
+
 def verify_token_access(token_str: str, db: Session) -> Token:
     current_time = datetime.now(UTC)
 
@@ -85,33 +171,60 @@ def verify_token_access(token_str: str, db: Session) -> Token:
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    token_cache.set(
+        token_str, CachedPrincipal.from_user(token.user, expire_date, token.id)
+    )
     return token
 
 
 async def get_current_token(
-    token: Annotated[str, Depends(oauth2_scheme)], db: Session = Depends(get_db)
+    token: Annotated[str, Depends(oauth2_scheme)],
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     oauth2_scheme automatically extracts the token from the authentication header
     Used when we simply want to return the token, instead of returning a user. E.g for logout
     """
-    token = verify_token_access(token_str=token, db=db)  # type: ignore
-    return token
+    return await db.run_sync(lambda session: verify_token_access(token, session))
 
 
 # User
 
 
 async def get_current_user(
-    token: Annotated[str, Depends(oauth2_scheme)], db: Session = Depends(get_db)
+    token: Annotated[str, Depends(oauth2_scheme)],
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     oauth2_scheme automatically extracts the token from the authentication header
-    Below, we get the current user based on that token
+    Below, we get the current user based on that token.
+    Recently verified tokens are served from token_cache without a query.
+    Activity is recorded in the last_seen buffer, which is written behind.
     """
-    token = verify_token_access(token_str=token, db=db)  # type: ignore
-    user = token.user  # type: ignore
-    return user
+    if settings.TOKEN_MODE == "jwt":
+        claims = decode_access_token(token)
+        if revocation_list.is_stale():
+            await db.run_sync(revocation_list.reload)
+        if revocation_list.is_revoked(claims["jti"]):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Token has been revoked",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        principal = CachedPrincipal.from_claims(claims)
+        last_seen.touch(principal.user_id, principal.token_id)
+        return principal.to_user()
+
+    principal = token_cache.get(token)
+    if principal:
+        last_seen.touch(principal.user_id, principal.token_id)
+        return principal.to_user()
+
+    session_token = await db.run_sync(
+        lambda session: verify_token_access(token, session)
+    )
+    last_seen.touch(session_token.user_id, session_token.id)
+    return session_token.user
 
 
 async def get_current_superuser(
@@ -0,0 +1,140 @@
+from typing import Any, Generic, Literal, Optional, Sequence, TypeVar
+
+import msgpack
+import orjson
+from fastapi import Query, Request, Response
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, TypeAdapter
+
+SchemaT = TypeVar("SchemaT", bound=BaseModel)
+
+# Compact list representation: {"fields": [...], "rows": [[...], ...]}
+COLUMNAR_MEDIA_TYPE = "application/vnd.timepiece.columnar+json"
+# The same document as MessagePack
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+
+ListFormat = Literal["json", "columnar", "msgpack"]
+_ACCEPT_FORMATS: dict[str, ListFormat] = {
+    "application/json": "json",
+    "application/*": "json",
+    "*/*": "json",
+    COLUMNAR_MEDIA_TYPE: "columnar",
+    MSGPACK_MEDIA_TYPE: "msgpack",
+    "application/x-msgpack": "msgpack",
+}
+
+
+def _accepted_format(accept: str) -> ListFormat:
+    """
+    The format with the highest q value in an Accept header. JSON wins ties
+    and stays the answer when nothing acceptable is recognised; q=0 means
+    the client refuses that type.
+    """
+    quality: dict[ListFormat, float] = {}
+    for media_range in accept.split(","):
+        media_type, *params = media_range.split(";")
+        format = _ACCEPT_FORMATS.get(media_type.strip().lower())
+        if format is None:
+            continue
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        quality[format] = max(q, quality.get(format, 0.0))
+
+    best: ListFormat = "json"
+    for format, q in quality.items():
+        if q > 0 and q > quality.get(best, 0.0):
+            best = format
+    return best
+
+
+def list_format(
+    request: Request,
+    format: Optional[ListFormat] = Query(
+        None,
+        description="json (default), columnar (field names once, then row "
+        "arrays) or msgpack (columnar as MessagePack); also negotiated via Accept",
+    ),
+) -> ListFormat:
+    """Representation of a list response, from ?format= or the Accept header"""
+    if format is not None:
+        return format
+    return _accepted_format(request.headers.get("accept", ""))
+
+
+class FastJSONResponse(ORJSONResponse):
+    """JSON rendered by orjson; bytes from a ListSerializer are sent as they are"""
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return super().render(content)
+
+
+class ListSerializer(Generic[SchemaT]):
+    """
+    Precompiled list[schema] TypeAdapter for list endpoints. ORM rows are
+    validated once and pydantic-core writes the JSON bytes directly; through
+    response_model, FastAPI validates, dumps to Python objects and then
+    encodes those again with json.dumps.
+    """
+
+    def __init__(self, schema: type[SchemaT]):
+        self.adapter = TypeAdapter(list[schema])
+        self.columns = list(schema.model_fields)
+        self.fields = frozenset(self.columns)
+
+    def _source(self, row: Any) -> Any:
+        # A loaded ORM instance keeps its column values in __dict__; reading
+        # them from there skips an instrumented getattr per field. Rows with
+        # expired or deferred fields are read through their attributes.
+        values = getattr(row, "__dict__", None)
+        if values is not None and self.fields <= values.keys():
+            return values
+        return row
+
+    def validate(self, rows: Sequence[Any]) -> list[SchemaT]:
+        return self.adapter.validate_python(
+            [self._source(row) for row in rows], from_attributes=True
+        )
+
+    def dump_json(self, rows: Sequence[Any]) -> bytes:
+        return self.adapter.dump_json(self.validate(rows))
+
+    def dump_columnar(self, rows: Sequence[Any]) -> dict[str, Any]:
+        """Field names once, then one array of values per row"""
+        items = self.adapter.dump_python(self.validate(rows), mode="json")
+        return {
+            "fields": self.columns,
+            "rows": [[item[column] for column in self.columns] for item in items],
+        }
+
+    def response(
+        self,
+        rows: Sequence[Any],
+        headers: Optional[dict[str, str]] = None,
+        format: ListFormat = "json",
+    ) -> Response:
+        """
+        The list in the negotiated format. Plain JSON stays the default
+        contract; Vary tells caches that the body depends on Accept.
+        """
+        headers = {**(headers or {}), "Vary": "Accept"}
+        if format == "columnar":
+            return Response(
+                orjson.dumps(self.dump_columnar(rows)),
+                media_type=COLUMNAR_MEDIA_TYPE,
+                headers=headers,
+            )
+        if format == "msgpack":
+            return Response(
+                msgpack.packb(self.dump_columnar(rows)),
+                media_type=MSGPACK_MEDIA_TYPE,
+                headers=headers,
+            )
+        return FastJSONResponse(self.dump_json(rows), headers=headers)
@@ -1,5 +1,6 @@
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import SecretStr
+from typing import Literal, Optional
 
 
 class Settings(BaseSettings):
@@ -11,12 +12,51 @@ class Settings(BaseSettings):
     ALGORITHM: str
     ACCESS_TOKEN_EXPIRE_MINUTES: int
     DEBUG: bool = False
+    # Connection pool, per engine (sync and async)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    # Seconds to wait for a free connection before answering 503
+    DB_POOL_TIMEOUT_SECONDS: float = 5
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    # Server-side statement_timeout (0 disables)
+    DB_STATEMENT_TIMEOUT_MS: int = 30000
+    # Optional read replica for list/get routes (same pool settings)
+    DB_READ_URL: Optional[str] = None
+    # After a client commits, its reads stay on the primary this long
+    READ_YOUR_WRITES_SECONDS: int = 5
     BASE_URL: str = "http://localhost:3000"
+    TOKEN_CACHE_SIZE: int = 1024
+    TOKEN_CACHE_TTL_SECONDS: int = 60
+    # "database": opaque tokens looked up per request
+    # "jwt": short-lived signed access tokens plus database refresh tokens
+    TOKEN_MODE: Literal["database", "jwt"] = "database"
+    REVOCATION_REFRESH_SECONDS: int = 30
+    # Hand out a user's still valid token again when they log in from the
+    # same client_id, instead of adding a row per login
+    TOKEN_REUSE: bool = False
+    # How often expired tokens are purged (0 disables the job)
+    TOKEN_PURGE_INTERVAL_SECONDS: int = 3600
+    TOKEN_PURGE_BATCH_SIZE: int = 1000
+    # Last-seen times are written every N seconds or once M are buffered
+    LAST_SEEN_FLUSH_SECONDS: int = 30
+    LAST_SEEN_MAX_ENTRIES: int = 500
+    # Concurrent bcrypt hashes; further password checks queue behind them
+    PASSWORD_HASH_WORKERS: int = 4
     SMTP_SERVER: str = "smtp.gmail.com"
     SMTP_PORT: int = 587
     SMTP_USERNAME: str = "test@example.com"
     SMTP_PASSWORD: SecretStr = SecretStr("fake-password")
     SMTP_FROM: str = "test@example.com"
+    SMTP_STARTTLS: bool = True
+    SMTP_USE_CREDENTIALS: bool = True
+    SMTP_TIMEOUT_SECONDS: float = 10
+    # Outbox worker: emails per SMTP batch, and retries with exponential
+    # backoff (EMAIL_RETRY_BASE_SECONDS * 2**attempt) before giving up
+    EMAIL_OUTBOX_POLL_SECONDS: float = 2
+    EMAIL_BATCH_SIZE: int = 50
+    EMAIL_MAX_ATTEMPTS: int = 5
+    EMAIL_RETRY_BASE_SECONDS: int = 30
     model_config = SettingsConfigDict(env_file=".env")
 
 
@@ -0,0 +1,220 @@
+import hashlib
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, UTC
+from threading import Lock
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from ..models.auth import User, RevokedToken
+from ..models.employee import Employee
+from .settings import settings
+
+
+def hash_token(token_str: str) -> str:
+    """Cache key for a bearer token, so raw tokens are never kept in memory"""
+    return hashlib.sha256(token_str.encode()).hexdigest()
+
+
+@dataclass(frozen=True)
+class CachedPrincipal:
+    """What authentication needs to know about a token's user"""
+
+    user_id: int
+    username: Optional[str]
+    email: str
+    is_superuser: bool
+    is_active: bool
+    employee_id: Optional[int]
+    role: Optional[str]
+    expire_date: datetime
+    token_id: Optional[int] = None
+
+    @classmethod
+    def from_user(
+        cls, user: User, expire_date: datetime, token_id: Optional[int] = None
+    ) -> "CachedPrincipal":
+        employee = user.employee
+        return cls(
+            user_id=user.id,
+            username=user.username,
+            email=user.email,
+            is_superuser=bool(user.is_superuser),
+            is_active=bool(user.is_active),
+            employee_id=employee.id if employee else None,
+            role=employee.role if employee else None,
+            expire_date=expire_date,
+            token_id=token_id,
+        )
+
+    @classmethod
+    def from_claims(cls, claims: dict) -> "CachedPrincipal":
+        return cls(
+            user_id=int(claims["sub"]),
+            username=claims.get("name"),
+            email=claims.get("email", ""),
+            is_superuser=bool(claims.get("su")),
+            is_active=True,
+            employee_id=claims.get("emp"),
+            role=claims.get("role"),
+            expire_date=datetime.fromtimestamp(claims["exp"], UTC),
+            token_id=claims.get("sid"),
+        )
+
+    def to_user(self) -> User:
+        """Detached User (and Employee) carrying the cached fields"""
+        user = User(
+            id=self.user_id,
+            username=self.username,
+            email=self.email,
+            is_superuser=self.is_superuser,
+            is_active=self.is_active,
+        )
+        if self.employee_id is not None:
+            user.employee = Employee(
+                id=self.employee_id, role=self.role, is_active=self.is_active
+            )
+        return user
+
+
+class TokenCache:
+    """
+    Bounded LRU cache of verified tokens with a TTL.
+
+    The cache is per process, so entries are dropped explicitly when a user
+    logs out or their status/role changes, and the TTL bounds how long other
+    worker processes can serve a stale entry.
+    """
+
+    def __init__(self, maxsize: int, ttl_seconds: int):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, tuple[float, CachedPrincipal]] = OrderedDict()
+        self._lock = Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.maxsize > 0 and self.ttl_seconds > 0
+
+    def get(self, token_str: str) -> Optional[CachedPrincipal]:
+        if not self.enabled:
+            return None
+
+        key = hash_token(token_str)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            cached_until, principal = entry
+            if (
+                cached_until <= time.monotonic()
+                or principal.expire_date <= datetime.now(UTC)
+            ):
+                del self._entries[key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return principal
+
+    def set(self, token_str: str, principal: CachedPrincipal) -> None:
+        if not self.enabled:
+            return
+
+        key = hash_token(token_str)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, principal)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate_token(self, token_str: str) -> None:
+        with self._lock:
+            self._entries.pop(hash_token(token_str), None)
+
+    def invalidate_user(self, user_id: int) -> None:
+        with self._lock:
+            for key in [
+                key
+                for key, (_, principal) in self._entries.items()
+                if principal.user_id == user_id
+            ]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+            }
+
+
+class RevocationList:
+    """
+    In-memory copy of revoked_tokens.
+
+    Revocations made by this process apply immediately; callers reload the
+    table when is_stale() (every refresh_seconds) to pick up revocations
+    from other processes, so checking a signed token normally costs no query.
+    """
+
+    def __init__(self, refresh_seconds: int):
+        self.refresh_seconds = refresh_seconds
+        self._revoked: dict[str, datetime] = {}
+        self._loaded_at: Optional[float] = None
+        self._lock = Lock()
+
+    def is_stale(self) -> bool:
+        return (
+            self._loaded_at is None
+            or time.monotonic() - self._loaded_at >= self.refresh_seconds
+        )
+
+    def is_revoked(self, jti: str) -> bool:
+        return jti in self._revoked
+
+    def revoke(self, jti: str, expires_at: datetime) -> None:
+        with self._lock:
+            self._revoked[jti] = expires_at
+
+    def reload(self, db: Session) -> None:
+        now = datetime.now(UTC).replace(tzinfo=None)
+        rows = db.execute(
+            select(RevokedToken.jti, RevokedToken.expires_at).where(
+                RevokedToken.expires_at > now
+            )
+        ).tuples()
+        with self._lock:
+            self._revoked = dict(rows.all())
+            self._loaded_at = time.monotonic()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._revoked.clear()
+            self._loaded_at = None
+
+
+token_cache = TokenCache(
+    maxsize=settings.TOKEN_CACHE_SIZE, ttl_seconds=settings.TOKEN_CACHE_TTL_SECONDS
+)
+
+revocation_list = RevocationList(refresh_seconds=settings.REVOCATION_REFRESH_SECONDS)
@@ -1,7 +1,7 @@
 from typing import Optional
 from datetime import date
 from sqlalchemy.orm import Session
-from sqlalchemy import select
+from sqlalchemy import select, func, literal, literal_column, Date
 from sqlalchemy.exc import IntegrityError
 
 from ..models.absence import Absence
@@ -11,6 +11,56 @@ from ..core.exceptions import EmployeeNotFoundError
 from ..core.enums import AbsenceType
 
 
+EXCLUSION_VIOLATION = "23P01"
+
+
+def _period(start, end):
+    """Inclusive daterange, matching the expression indexed on absences"""
+    return func.daterange(start, end, literal_column("'[]'"))
+
+
+def absence_overlaps(start_date: Optional[date], end_date: Optional[date]):
+    """Absences overlapping [start_date, end_date]; a missing bound is open"""
+    return _period(Absence.start_date, Absence.end_date).op("&&")(
+        _period(literal(start_date, Date), literal(end_date, Date))
+    )
+
+
+def absence_covers(day: date):
+    """Absences that include the given day"""
+    return _period(Absence.start_date, Absence.end_date).op("@>")(literal(day, Date))
+
+
+def _overlap_error(
+    db: Session,
+    employee_id: int,
+    start_date: date,
+    end_date: date,
+    exclude_id: Optional[int] = None,
+) -> Optional[ValueError]:
+    stmt = (
+        select(Absence.start_date, Absence.end_date)
+        .where(
+            Absence.employee_id == employee_id,
+            absence_overlaps(start_date, end_date),
+        )
+        .limit(1)
+    )
+    if exclude_id is not None:
+        stmt = stmt.where(Absence.id != exclude_id)
+
+    conflict = db.execute(stmt).first()
+    if not conflict:
+        return None
+    return ValueError(
+        f"Absence overlaps with existing absence period from {conflict.start_date} to {conflict.end_date}"
+    )
+
+
+def _is_overlap_violation(error: IntegrityError) -> bool:
+    return getattr(error.orig, "pgcode", None) == EXCLUSION_VIOLATION
+
+
 def create_absence(db: Session, data: AbsenceBaseSchema) -> Absence:
     # Validate dates
     if data.start_date > data.end_date:
@@ -22,18 +72,11 @@ def create_absence(db: Session, data: AbsenceBaseSchema) -> Absence:
     if not employee:
         raise EmployeeNotFoundError(data.employee_id)
 
-    # Check for overlapping absences
-    overlapping_stmt = select(Absence).where(
-        Absence.employee_id == data.employee_id,
-        Absence.start_date <= data.end_date,
-        Absence.end_date >= data.start_date,
-    )
-    existing_absences = db.execute(overlapping_stmt).scalars().all()
-
-    if existing_absences:
-        raise ValueError(
-            f"Absence overlaps with existing absence period from {existing_absences[0].start_date} to {existing_absences[0].end_date}"
-        )
+    # Fast path for a friendly message; ex_absence_employee_period is what
+    # actually prevents overlaps, also between concurrent requests
+    overlap = _overlap_error(db, data.employee_id, data.start_date, data.end_date)
+    if overlap:
+        raise overlap
 
     try:
         absence = Absence(
@@ -48,8 +91,12 @@ def create_absence(db: Session, data: AbsenceBaseSchema) -> Absence:
         db.commit()
         db.refresh(absence)
         return absence
-    except IntegrityError:
+    except IntegrityError as e:
         db.rollback()
+        if _is_overlap_violation(e):
+            raise _overlap_error(
+                db, data.employee_id, data.start_date, data.end_date
+            ) or ValueError("Absence overlaps with an existing absence") from e
         raise
 
 
@@ -63,6 +110,10 @@ def get_absences(
     skip: int = 0,
     limit: int = 100,
 ) -> list[Absence]:
+    if start_date is not None and end_date is not None and start_date > end_date:
+        # Nothing overlaps an inverted range, and daterange() would reject it
+        return []
+
     query = select(Absence).order_by(Absence.start_date)
 
     if employee_id is not None:
@@ -71,17 +122,14 @@ def get_absences(
     if absence_type is not None:
         query = query.where(Absence.absence_type == absence_type)
 
-    if start_date is not None:
-        query = query.where(Absence.end_date >= start_date)
-
-    if end_date is not None:
-        query = query.where(Absence.start_date <= end_date)
+    if start_date is not None or end_date is not None:
+        query = query.where(absence_overlaps(start_date, end_date))
 
     if active_only:
         from datetime import datetime
 
         today = datetime.now().date()
-        query = query.where((Absence.start_date <= today) & (Absence.end_date >= today))
+        query = query.where(absence_covers(today))
 
     query = query.offset(skip).limit(limit)
     return list(db.execute(query).scalars().all())
@@ -134,6 +182,10 @@ def update_absence(
         db.commit()
         db.refresh(absence)
         return absence
-    except IntegrityError:
+    except IntegrityError as e:
         db.rollback()
+        if _is_overlap_violation(e):
+            raise _overlap_error(
+                db, absence.employee_id, final_start_date, final_end_date, absence_id
+            ) or ValueError("Absence overlaps with an existing absence") from e
         raise
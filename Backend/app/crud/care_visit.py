@@ -1,12 +1,21 @@
 from typing import Optional
-from sqlalchemy import select
+from sqlalchemy import Select, select, insert, update, delete, func, and_, or_, exists
 from sqlalchemy.orm import Session
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import IntegrityError
 from datetime import date as date_type
 
-from ..core.enums import VisitStatus
+from ..core.enums import VisitStatus, ShiftType
+from ..core.logger import logger
 from ..models.care_visit import CareVisit
+from ..models.customer import Customer, CustomerMeasure
+from ..models.employee import EmployeeCareVisit
+from ..models.measure import Measure, MeasureCareVisit
+from ..models.schedule import Schedule
 from ..schemas.care_visit import CareVisitBaseSchema, CareVisitUpdateSchema
+from ..services.visit_planner import expand_occurrences
+
+MAX_GENERATION_DAYS = 93
 
 
 def create_care_visit(db: Session, data: CareVisitBaseSchema) -> CareVisit:
@@ -28,19 +37,16 @@ def create_care_visit(db: Session, data: CareVisitBaseSchema) -> CareVisit:
         raise
 
 
-def get_care_visits(
-    db: Session,
+def filter_care_visits(
+    query: Select,
     date: Optional[date_type] = None,
     start_date: Optional[date_type] = None,
     end_date: Optional[date_type] = None,
     status: Optional[VisitStatus] = None,
     customer_id: Optional[int] = None,
     schedule_id: Optional[int] = None,
-    skip: int = 0,
-    limit: int = 100,
-) -> list[CareVisit]:
-    query = select(CareVisit).order_by(CareVisit.date)
-
+) -> Select:
+    """The care visit list filters, shared by listing and export"""
     if date is not None:
         query = query.where(CareVisit.date == date)
 
@@ -59,6 +65,49 @@ def get_care_visits(
     if schedule_id is not None:
         query = query.where(CareVisit.schedule_id == schedule_id)
 
+    return query
+
+
+def get_care_visits(
+    db: Session,
+    date: Optional[date_type] = None,
+    start_date: Optional[date_type] = None,
+    end_date: Optional[date_type] = None,
+    status: Optional[VisitStatus] = None,
+    customer_id: Optional[int] = None,
+    schedule_id: Optional[int] = None,
+    skip: int = 0,
+    limit: int = 100,
+    after: Optional[tuple[date_type, int]] = None,
+) -> list[CareVisit]:
+    """
+    Visits ordered by (date, id). Pass the (date, id) of the last visit of a
+    page as after to seek to the next page, instead of an OFFSET that reads
+    and discards every row before it.
+    """
+    query = select(CareVisit).order_by(CareVisit.date, CareVisit.id)
+
+    if after is not None:
+        after_date, after_id = after
+        # date >= is the index range (ix_care_visit_date or the status,
+        # customer or schedule composites); the OR only breaks ties within it
+        query = query.where(
+            CareVisit.date >= after_date,
+            or_(
+                CareVisit.date > after_date,
+                CareVisit.id > after_id,
+            ),
+        )
+
+    query = filter_care_visits(
+        query,
+        date=date,
+        start_date=start_date,
+        end_date=end_date,
+        status=status,
+        customer_id=customer_id,
+        schedule_id=schedule_id,
+    )
     query = query.offset(skip).limit(limit)
     return list(db.execute(query).scalars().all())
 
@@ -112,6 +161,7 @@ def get_upcoming_visits(
     days_ahead: int = 7,
     skip: int = 0,
     limit: int = 100,
+    after: Optional[tuple[date_type, int]] = None,
 ) -> list[CareVisit]:
     """Get upcoming visits within specified days"""
     from datetime import datetime, timedelta
@@ -128,6 +178,7 @@ def get_upcoming_visits(
         schedule_id=schedule_id,
         skip=skip,
         limit=limit,
+        after=after,
     )
 
 
@@ -138,6 +189,7 @@ def get_completed_visits(
     days_back: int = 30,
     skip: int = 0,
     limit: int = 100,
+    after: Optional[tuple[date_type, int]] = None,
 ) -> list[CareVisit]:
     """Get completed visits from recent period"""
     from datetime import datetime, timedelta
@@ -154,6 +206,7 @@ def get_completed_visits(
         schedule_id=schedule_id,
         skip=skip,
         limit=limit,
+        after=after,
     )
 
 
@@ -163,6 +216,7 @@ def get_overdue_visits(
     schedule_id: Optional[int] = None,
     skip: int = 0,
     limit: int = 100,
+    after: Optional[tuple[date_type, int]] = None,
 ) -> list[CareVisit]:
     """Get visits that should have been completed but weren't"""
     from datetime import datetime
@@ -177,4 +231,386 @@ def get_overdue_visits(
         schedule_id=schedule_id,
         skip=skip,
         limit=limit,
+        after=after,
+    )
+
+
+def _plan_rows(db: Session, *criteria):
+    """Active measure plans with their effective duration"""
+    return db.execute(
+        select(
+            CustomerMeasure.id,
+            CustomerMeasure.customer_id,
+            CustomerMeasure.measure_id,
+            CustomerMeasure.frequency,
+            CustomerMeasure.days_of_week,
+            CustomerMeasure.occurrences_per_week,
+            func.coalesce(
+                CustomerMeasure.customer_duration, Measure.default_duration
+            ).label("duration"),
+        )
+        .join(Customer, Customer.id == CustomerMeasure.customer_id)
+        .join(Measure, Measure.id == CustomerMeasure.measure_id)
+        .where(Customer.is_active, Measure.is_active, *criteria)
+    ).all()
+
+
+def _expand_plans(
+    plans, start_date: date_type, end_date: date_type, skip_invalid: bool = True
+) -> dict[tuple[int, date_type], dict[int, int]]:
+    """
+    Expand plans to {(customer_id, date): {measure_id: duration}}. A plan the
+    planner can't read is logged and skipped, or raised with skip_invalid=False.
+    """
+    planned: dict[tuple[int, date_type], dict[int, int]] = {}
+    for plan in plans:
+        try:
+            dates = expand_occurrences(
+                plan.frequency,
+                plan.days_of_week,
+                plan.occurrences_per_week,
+                start_date,
+                end_date,
+            )
+        except ValueError as e:
+            if not skip_invalid:
+                raise ValueError(f"Customer measure {plan.id}: {e}") from e
+            logger.warning(f"Skipping customer measure {plan.id}: {e}")
+            continue
+
+        for visit_date in dates:
+            measures = planned.setdefault((plan.customer_id, visit_date), {})
+            measures[plan.measure_id] = measures.get(plan.measure_id, 0) + (
+                plan.duration
+            )
+
+    return planned
+
+
+def _get_or_create_schedule_ids(
+    db: Session, dates: set[date_type]
+) -> tuple[dict[date_type, int], int]:
+    """Schedule id per date, creating DAY schedules for dates without one"""
+    schedule_ids = dict(
+        db.execute(
+            select(Schedule.date, Schedule.id)
+            .where(Schedule.date.in_(dates))
+            .order_by(Schedule.id)
+        )
+        .tuples()
+        .all()
+    )
+
+    missing_dates = sorted(dates - schedule_ids.keys())
+    if not missing_dates:
+        return schedule_ids, 0
+
+    # Another request may create the same dates concurrently; those rows
+    # are skipped by ON CONFLICT and looked up afterwards instead.
+    created = dict(
+        db.execute(
+            pg_insert(Schedule)
+            .values(
+                [
+                    {"date": visit_date, "shift_type": ShiftType.DAY}
+                    for visit_date in missing_dates
+                ]
+            )
+            .on_conflict_do_nothing(index_elements=["date"])
+            .returning(Schedule.date, Schedule.id)
+        )
+        .tuples()
+        .all()
+    )
+    schedule_ids.update(created)
+
+    raced_dates = set(missing_dates) - created.keys()
+    if raced_dates:
+        schedule_ids.update(
+            db.execute(
+                select(Schedule.date, Schedule.id).where(Schedule.date.in_(raced_dates))
+            )
+            .tuples()
+            .all()
+        )
+
+    return schedule_ids, len(created)
+
+
+def _insert_planned_visits(
+    db: Session, to_create: dict[tuple[int, date_type], dict[int, int]]
+) -> tuple[int, int, int]:
+    """
+    Bulk insert planned visits and their measure links.
+    Returns (visits created, measures linked, schedules created).
+    """
+    schedule_ids, schedules_created = _get_or_create_schedule_ids(
+        db, {visit_date for _, visit_date in to_create}
+    )
+
+    keys = sorted(to_create, key=lambda key: (key[1], key[0]))
+    visit_rows = db.execute(
+        insert(CareVisit).returning(CareVisit.id, sort_by_parameter_order=True),
+        [
+            {
+                "date": visit_date,
+                "status": VisitStatus.PLANNED.value,
+                "duration": sum(to_create[(customer_id, visit_date)].values()),
+                "schedule_id": schedule_ids[visit_date],
+                "customer_id": customer_id,
+            }
+            for customer_id, visit_date in keys
+        ],
+    )
+    visit_ids = visit_rows.scalars().all()
+
+    links = [
+        {"measure_id": measure_id, "care_visit_id": visit_id}
+        for key, visit_id in zip(keys, visit_ids)
+        for measure_id in to_create[key]
+    ]
+    db.execute(insert(MeasureCareVisit), links)
+
+    return len(keys), len(links), schedules_created
+
+
+def generate_care_visits(
+    db: Session, start_date: date_type, end_date: date_type
+) -> dict:
+    """
+    Materialize every active customer's measure plans into care visits for
+    the given period.
+
+    Plans are expanded in memory and written with set-based inserts in one
+    transaction: one visit per customer and day, linked to all measures that
+    fall on that day. Days where the customer already has a visit are left
+    untouched, so the same period can safely be generated again. Missing
+    schedules for the period are created as DAY shifts.
+    """
+    if start_date > end_date:
+        raise ValueError("Start date cannot be after end date")
+
+    if (end_date - start_date).days >= MAX_GENERATION_DAYS:
+        raise ValueError(
+            f"Cannot generate visits for more than {MAX_GENERATION_DAYS} days at once"
+        )
+
+    planned = _expand_plans(_plan_rows(db), start_date, end_date)
+
+    existing = set(
+        db.execute(
+            select(CareVisit.customer_id, CareVisit.date).where(
+                CareVisit.date >= start_date, CareVisit.date <= end_date
+            )
+        )
+        .tuples()
+        .all()
     )
+    to_create = {key: value for key, value in planned.items() if key not in existing}
+
+    result = {
+        "start_date": start_date,
+        "end_date": end_date,
+        "visits_created": 0,
+        "measures_linked": 0,
+        "schedules_created": 0,
+        "skipped_existing": len(planned) - len(to_create),
+    }
+
+    if not to_create:
+        return result
+
+    try:
+        visits_created, measures_linked, schedules_created = _insert_planned_visits(
+            db, to_create
+        )
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise
+
+    result["visits_created"] = visits_created
+    result["measures_linked"] = measures_linked
+    result["schedules_created"] = schedules_created
+
+    logger.info(
+        f"Generated {visits_created} care visits between {start_date} and {end_date}"
+    )
+    return result
+
+
+def replan_customer_measure_visits(
+    db: Session, customer_id: int, measure_id: int
+) -> dict:
+    """
+    Re-plan a customer's future visits for one measure after its plan changed.
+
+    The desired occurrences are diffed against the planned visits from today
+    up to the last day already generated for the customer, and only the
+    difference is written: measure links are added or removed, visits are
+    created for new days, emptied visits are deleted and durations are
+    refreshed where they changed. Visits that are no longer planned
+    (completed, canceled, ...) are never touched.
+
+    Does not commit, the caller commits together with the plan change. A
+    plan that can't be expanded raises ValueError instead of being read as
+    "no visits", which would unlink every planned visit for the measure.
+    """
+    result = {
+        "visits_created": 0,
+        "visits_deleted": 0,
+        "visits_updated": 0,
+        "links_added": 0,
+        "links_removed": 0,
+    }
+
+    today = date_type.today()
+    horizon_end = db.execute(
+        select(func.max(CareVisit.date)).where(
+            CareVisit.customer_id == customer_id, CareVisit.date >= today
+        )
+    ).scalar_one()
+
+    if horizon_end is None:
+        return result
+
+    plans = _plan_rows(
+        db,
+        CustomerMeasure.customer_id == customer_id,
+        CustomerMeasure.measure_id == measure_id,
+    )
+    desired = {
+        visit_date: measures
+        for (_, visit_date), measures in _expand_plans(
+            plans, today, horizon_end, skip_invalid=False
+        ).items()
+    }
+
+    visits = db.execute(
+        select(
+            CareVisit.id,
+            CareVisit.date,
+            CareVisit.status,
+            MeasureCareVisit.care_visit_id.is_not(None).label("linked"),
+        )
+        .outerjoin(
+            MeasureCareVisit,
+            and_(
+                MeasureCareVisit.care_visit_id == CareVisit.id,
+                MeasureCareVisit.measure_id == measure_id,
+            ),
+        )
+        .where(
+            CareVisit.customer_id == customer_id,
+            CareVisit.date >= today,
+            CareVisit.date <= horizon_end,
+        )
+        .order_by(CareVisit.id)
+    ).all()
+
+    planned_by_date: dict[date_type, int] = {}
+    linked: dict[int, date_type] = {}
+    locked_dates: set[date_type] = set()
+    for visit in visits:
+        if visit.status != VisitStatus.PLANNED.value:
+            locked_dates.add(visit.date)
+            continue
+        planned_by_date.setdefault(visit.date, visit.id)
+        if visit.linked:
+            linked[visit.id] = visit.date
+
+    linked_dates = set(linked.values())
+    to_unlink = [
+        visit_id for visit_id, visit_date in linked.items() if visit_date not in desired
+    ]
+    to_link = [
+        planned_by_date[visit_date]
+        for visit_date in desired
+        if visit_date in planned_by_date and visit_date not in linked_dates
+    ]
+    to_create = {
+        (customer_id, visit_date): measures
+        for visit_date, measures in desired.items()
+        if visit_date not in planned_by_date and visit_date not in locked_dates
+    }
+
+    try:
+        deleted_ids: set[int] = set()
+        if to_unlink:
+            db.execute(
+                delete(MeasureCareVisit).where(
+                    MeasureCareVisit.measure_id == measure_id,
+                    MeasureCareVisit.care_visit_id.in_(to_unlink),
+                )
+            )
+            deleted_ids = set(
+                db.execute(
+                    delete(CareVisit)
+                    .where(
+                        CareVisit.id.in_(to_unlink),
+                        ~exists().where(MeasureCareVisit.care_visit_id == CareVisit.id),
+                        ~exists().where(
+                            EmployeeCareVisit.care_visit_id == CareVisit.id
+                        ),
+                    )
+                    .returning(CareVisit.id)
+                )
+                .scalars()
+                .all()
+            )
+            result["links_removed"] = len(to_unlink)
+            result["visits_deleted"] = len(deleted_ids)
+
+        if to_link:
+            db.execute(
+                insert(MeasureCareVisit),
+                [
+                    {"measure_id": measure_id, "care_visit_id": visit_id}
+                    for visit_id in to_link
+                ],
+            )
+            result["links_added"] = len(to_link)
+
+        if to_create:
+            visits_created, links_added, _ = _insert_planned_visits(db, to_create)
+            result["visits_created"] = visits_created
+            result["links_added"] += links_added
+
+        changed_ids = (set(linked) | set(to_link)) - deleted_ids
+        if changed_ids:
+            new_duration = func.coalesce(
+                select(
+                    func.sum(
+                        func.coalesce(
+                            CustomerMeasure.customer_duration, Measure.default_duration
+                        )
+                    )
+                )
+                .select_from(MeasureCareVisit)
+                .join(
+                    CustomerMeasure,
+                    and_(
+                        CustomerMeasure.measure_id == MeasureCareVisit.measure_id,
+                        CustomerMeasure.customer_id == CareVisit.customer_id,
+                    ),
+                )
+                .join(Measure, Measure.id == MeasureCareVisit.measure_id)
+                .where(MeasureCareVisit.care_visit_id == CareVisit.id)
+                .scalar_subquery(),
+                0,
+            )
+            updated = db.execute(
+                update(CareVisit)
+                .where(
+                    CareVisit.id.in_(changed_ids),
+                    CareVisit.duration.is_distinct_from(new_duration),
+                )
+                .values(duration=new_duration)
+                .execution_options(synchronize_session=False)
+            )
+            result["visits_updated"] = updated.rowcount
+    except IntegrityError:
+        db.rollback()
+        raise
+
+    return result
@@ -1,23 +1,25 @@
 from typing import Optional
 from sqlalchemy.orm import Session
-from sqlalchemy import select, or_
+from sqlalchemy import select, or_, exists
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import IntegrityError
 
 from ..schemas.customer import CustomerBaseSchema, CustomerUpdateSchema
 from ..models.customer import Customer
 from ..core.enums import CareLevel
 from ..core.exceptions import CustomerNotFoundError
+from ..core.search import (
+    SEARCH_MIN_QUERY_LENGTH,
+    search_term,
+    text_search,
+    trigram_enabled,
+)
 
 
 def create_customer(db: Session, data: CustomerBaseSchema) -> Customer:
-    stmt = select(Customer).where(Customer.key_number == data.key_number)
-    existing_customer = db.execute(stmt).scalar_one_or_none()
-
-    if existing_customer:
-        raise ValueError("Key number already exists")
-
-    try:
-        customer = Customer(
+    stmt = (
+        pg_insert(Customer)
+        .values(
             first_name=data.first_name,
             last_name=data.last_name,
             key_number=data.key_number,
@@ -27,9 +29,16 @@ def create_customer(db: Session, data: CustomerBaseSchema) -> Customer:
             approved_hours=data.approved_hours,
             is_active=data.is_active,
         )
-        db.add(customer)
+        .on_conflict_do_nothing(index_elements=["key_number"])
+        .returning(Customer)
+    )
+
+    try:
+        customer = db.execute(stmt).scalar_one_or_none()
+        if not customer:
+            db.rollback()
+            raise ValueError("Key number already exists")
         db.commit()
-        db.refresh(customer)
         return customer
     except IntegrityError:
         db.rollback()
@@ -128,24 +137,31 @@ def search_customers(
     query: str | None = None,
     care_level: CareLevel | None = None,
     is_active: bool | None = None,
+    skip: int = 0,
+    limit: int | None = None,
 ) -> list[Customer]:
+    """
+    Customers matching query on name or address, best match first, or with
+    the query as their key number. A key number may be a single digit; other
+    queries need SEARCH_MIN_QUERY_LENGTH characters.
+    """
     stmt = select(Customer)
-
-    if query:
-        # Build search conditions for text fields
-        text_conditions = [
-            Customer.first_name.ilike(f"%{query}%"),
-            Customer.last_name.ilike(f"%{query}%"),
-            Customer.address.ilike(f"%{query}%"),
-        ]
-
-        try:
-            key_number_query = int(query)
-            stmt = stmt.where(
-                or_(*text_conditions, Customer.key_number == key_number_query)
-            )
-        except ValueError:
-            stmt = stmt.where(or_(*text_conditions))
+    order_by = [Customer.last_name, Customer.first_name, Customer.id]
+
+    query = (query or "").strip()
+    if query.isdigit() and len(query) < SEARCH_MIN_QUERY_LENGTH:
+        stmt = stmt.where(Customer.key_number == int(query))
+    elif term := search_term(query):
+        condition, rank = text_search(
+            term,
+            [Customer.first_name, Customer.last_name, Customer.address],
+            trigram_enabled(db),
+        )
+        if term.isdigit():
+            condition = or_(condition, Customer.key_number == int(term))
+        stmt = stmt.where(condition)
+        if rank is not None:
+            order_by.insert(0, rank.desc())
 
     if care_level:
         stmt = stmt.where(Customer.care_level == care_level)
@@ -153,9 +169,10 @@ def search_customers(
     if is_active is not None:
         stmt = stmt.where(Customer.is_active == is_active)
 
+    stmt = stmt.order_by(*order_by).offset(skip).limit(limit)
     return list(db.execute(stmt).scalars().all())
 
 
 def customer_exists(db: Session, key_number: int) -> bool:
-    stmt = select(Customer).where(Customer.key_number == key_number)
-    return db.execute(stmt).scalar_one_or_none() is not None
+    stmt = select(exists().where(Customer.key_number == key_number))
+    return db.execute(stmt).scalar()
@@ -2,8 +2,20 @@ from sqlalchemy.orm import Session
 from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 
+from ..core.logger import logger
 from ..models.customer import CustomerMeasure
-from ..schemas.relations import CustomerMeasureCreateSchema
+from ..schemas.relations import (
+    CustomerMeasureCreateSchema,
+    CustomerMeasureUpdateSchema,
+)
+from .care_visit import replan_customer_measure_visits
+
+
+def _replan(db: Session, customer_id: int, measure_id: int) -> None:
+    """Planerar om kundens framtida besök för insatsen i samma transaktion."""
+    db.flush()
+    result = replan_customer_measure_visits(db, customer_id, measure_id)
+    logger.info(f"Replanned measure {measure_id} for customer {customer_id}: {result}")
 
 
 def get_customer_measures(db: Session, customer_id: int) -> list[dict]:
@@ -68,6 +80,7 @@ def create_customer_measure(
     Raises:
         IntegrityError: Om measure_id eller customer_id inte existerar,
                        eller om kombinationen redan finns (duplicate)
+        ValueError: Om en plan för insatsen inte kan tolkas vid omplaneringen
     """
     try:
         customer_measure = CustomerMeasure(
@@ -84,12 +97,65 @@ def create_customer_measure(
         )
 
         db.add(customer_measure)
+        _replan(db, customer_id, data.measure_id)
         db.commit()
         db.refresh(customer_measure)
 
         return customer_measure
 
-    except IntegrityError:
+    except (IntegrityError, ValueError):
+        db.rollback()
+        raise
+
+
+def update_customer_measure(
+    db: Session,
+    customer_id: int,
+    customer_measure_id: int,
+    data: CustomerMeasureUpdateSchema,
+) -> CustomerMeasure | None:
+    """
+    Uppdaterar en kundinsats och planerar om kundens framtida besök.
+
+    Endast planerade besök för just den här insatsen räknas om, genomförda
+    och inställda besök lämnas orörda.
+
+    Args:
+        db: Databas session
+        customer_id: ID för kunden som äger insatsen
+        customer_measure_id: ID för customer_measure som ska uppdateras
+        data: Schema med de fält som ska ändras
+
+    Returns:
+        Uppdaterad CustomerMeasure, eller None om den inte existerar för kunden
+
+    Raises:
+        IntegrityError: Om ett nytt measure_id inte existerar
+        ValueError: Om en plan för insatsen inte kan tolkas vid omplaneringen
+    """
+    stmt = select(CustomerMeasure).where(
+        CustomerMeasure.id == customer_measure_id,
+        CustomerMeasure.customer_id == customer_id,
+    )
+    customer_measure = db.execute(stmt).scalar_one_or_none()
+
+    if not customer_measure:
+        return None
+
+    previous_measure_id = customer_measure.measure_id
+
+    for field, value in data.model_dump(exclude_unset=True).items():
+        setattr(customer_measure, field, value)
+
+    try:
+        _replan(db, customer_id, customer_measure.measure_id)
+        if previous_measure_id != customer_measure.measure_id:
+            _replan(db, customer_id, previous_measure_id)
+        db.commit()
+        db.refresh(customer_measure)
+        return customer_measure
+
+    except (IntegrityError, ValueError):
         db.rollback()
         raise
 
@@ -109,6 +175,7 @@ def delete_customer_measure(db: Session, customer_measure_id: int) -> bool:
     Raises:
         IntegrityError: Om customer_measure används i andra tabeller
                        (t.ex. refererad i schedules)
+        ValueError: Om en plan för insatsen inte kan tolkas vid omplaneringen
     """
     stmt = select(CustomerMeasure).where(CustomerMeasure.id == customer_measure_id)
     customer_measure = db.execute(stmt).scalar_one_or_none()
@@ -118,9 +185,10 @@ def delete_customer_measure(db: Session, customer_measure_id: int) -> bool:
 
     try:
         db.delete(customer_measure)
+        _replan(db, customer_measure.customer_id, customer_measure.measure_id)
         db.commit()
         return True
 
-    except IntegrityError:
+    except (IntegrityError, ValueError):
         db.rollback()
         raise
@@ -0,0 +1,68 @@
+from datetime import datetime, timedelta, UTC
+from typing import List
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+from ..core.enums import OutboxStatus
+from ..models import EmailOutbox
+
+
+def _utcnow() -> datetime:
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+def enqueue_email(
+    db: Session, recipient: str, subject: str, body: str, subtype: str = "html"
+) -> EmailOutbox:
+    """Add an email to the outbox; it is committed with the caller's transaction"""
+    email = EmailOutbox(
+        recipient=recipient, subject=subject, body=body, subtype=subtype
+    )
+    db.add(email)
+    return email
+
+
+def enqueue_emails(db: Session, emails: List[tuple[str, str, str]]) -> None:
+    """Add (recipient, subject, body) emails with one INSERT, uncommitted"""
+    db.execute(
+        insert(EmailOutbox),
+        [
+            {"recipient": recipient, "subject": subject, "body": body}
+            for recipient, subject, body in emails
+        ],
+    )
+
+
+def claim_outbox_batch(db: Session, limit: int) -> List[EmailOutbox]:
+    """
+    Pending emails that are due, oldest first. The rows stay locked until
+    the caller commits, and SKIP LOCKED lets several workers share the outbox.
+    """
+    stmt = (
+        select(EmailOutbox)
+        .where(EmailOutbox.status == OutboxStatus.PENDING.value)
+        .where(EmailOutbox.next_attempt_at <= _utcnow())
+        .order_by(EmailOutbox.id)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    return list(db.execute(stmt).scalars().all())
+
+
+def mark_email_sent(email: EmailOutbox) -> None:
+    email.attempts += 1
+    email.status = OutboxStatus.SENT.value
+    email.sent_at = _utcnow()
+    email.last_error = None
+
+
+def mark_email_failed(
+    email: EmailOutbox, error: str, max_attempts: int, retry_base_seconds: int
+) -> None:
+    """Schedule a retry with exponential backoff, or give up after max_attempts"""
+    email.attempts += 1
+    email.last_error = error
+    if email.attempts >= max_attempts:
+        email.status = OutboxStatus.FAILED.value
+        return
+    delay = retry_base_seconds * 2 ** (email.attempts - 1)
+    email.next_attempt_at = _utcnow() + timedelta(seconds=delay)
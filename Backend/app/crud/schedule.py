@@ -1,9 +1,30 @@
+import calendar
 from typing import Optional
-from datetime import date as date_type
-from sqlalchemy.orm import Session
-from sqlalchemy import select, and_
+from datetime import date as date_type, timedelta
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import (
+    select,
+    insert,
+    and_,
+    exists,
+    func,
+    literal,
+    true,
+    values,
+    column,
+    Table,
+    MetaData,
+    Column,
+    Integer,
+    Date,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import IntegrityError
-from ..schemas.schedule import ScheduleBaseSchema, ScheduleUpdateSchema
+from ..schemas.schedule import (
+    ScheduleBaseSchema,
+    ScheduleUpdateSchema,
+    ScheduleCopySchema,
+)
 from ..schemas.relations import ScheduleMeasureCreateSchema
 from ..models.schedule import (
     Schedule,
@@ -19,25 +40,32 @@ from ..core.exceptions import (
     EmployeeNotFoundError,
     MeasureNotFoundError,
 )
-from ..models.measure import Measure
-from ..core.enums import ShiftType
+from ..models.measure import Measure, MeasureCareVisit
+from ..models.care_visit import CareVisit
+from ..models.employee import Employee, EmployeeCareVisit
+from ..models.absence import Absence
+from ..core.enums import ShiftType, VisitStatus
 from ..core.exceptions import CustomerNotFoundError
 
+MAX_COPY_DAYS = 93
 
-def create_schedule(db: Session, data: ScheduleBaseSchema) -> Schedule:
-    stmt = select(Schedule).where(Schedule.date == data.date)
-    existing_schedule = db.execute(stmt).scalar_one_or_none()
 
-    if existing_schedule:
-        raise ValueError(f"Schedule for date {data.date} already exists.")
-
-    try:
-        schedule = Schedule(
+def create_schedule(db: Session, data: ScheduleBaseSchema) -> Schedule:
+    stmt = (
+        pg_insert(Schedule)
+        .values(
             date=data.date, shift_type=data.shift_type, custom_shift=data.custom_shift
         )
-        db.add(schedule)
+        .on_conflict_do_nothing(index_elements=["date"])
+        .returning(Schedule)
+    )
+
+    try:
+        schedule = db.execute(stmt).scalar_one_or_none()
+        if not schedule:
+            db.rollback()
+            raise ValueError(f"Schedule for date {data.date} already exists.")
         db.commit()
-        db.refresh(schedule)
         return schedule
     except IntegrityError:
         db.rollback()
@@ -71,11 +99,114 @@ def get_schedules(
     return list(db.execute(query).scalars().all())
 
 
+def get_schedule_calendar(db: Session, year: int, month: int) -> list[dict]:
+    """
+    Every schedule in a month with its employee, customer, measure and care
+    visit counts (also per visit status), computed in one query.
+    """
+    first_day = date_type(year, month, 1)
+    last_day = date_type(year, month, calendar.monthrange(year, month)[1])
+    month_ids = select(Schedule.id).where(Schedule.date.between(first_day, last_day))
+
+    def _count_per_schedule(model, *extra_columns):
+        return (
+            select(model.schedule_id, func.count().label("total"), *extra_columns)
+            .where(model.schedule_id.in_(month_ids))
+            .group_by(model.schedule_id)
+            .subquery()
+        )
+
+    employees = _count_per_schedule(ScheduleEmployee)
+    customers = _count_per_schedule(ScheduleCustomer)
+    measures = _count_per_schedule(ScheduleMeasure)
+    visits = _count_per_schedule(
+        CareVisit,
+        *[
+            func.count()
+            .filter(CareVisit.status == visit_status.value)
+            .label(visit_status.value)
+            for visit_status in VisitStatus
+        ],
+    )
+
+    stmt = (
+        select(
+            Schedule,
+            func.coalesce(employees.c.total, 0).label("employee_count"),
+            func.coalesce(customers.c.total, 0).label("customer_count"),
+            func.coalesce(measures.c.total, 0).label("measure_count"),
+            func.coalesce(visits.c.total, 0).label("visit_count"),
+            *[
+                func.coalesce(visits.c[visit_status.value], 0).label(visit_status.value)
+                for visit_status in VisitStatus
+            ],
+        )
+        .outerjoin(employees, employees.c.schedule_id == Schedule.id)
+        .outerjoin(customers, customers.c.schedule_id == Schedule.id)
+        .outerjoin(measures, measures.c.schedule_id == Schedule.id)
+        .outerjoin(visits, visits.c.schedule_id == Schedule.id)
+        .where(Schedule.date.between(first_day, last_day))
+        .order_by(Schedule.date)
+    )
+
+    return [
+        {
+            "id": row.Schedule.id,
+            "date": row.Schedule.date,
+            "shift_type": row.Schedule.shift_type,
+            "custom_shift": row.Schedule.custom_shift,
+            "created": row.Schedule.created,
+            "employee_count": row.employee_count,
+            "customer_count": row.customer_count,
+            "measure_count": row.measure_count,
+            "visit_count": row.visit_count,
+            "visits_by_status": {
+                visit_status: row._mapping[visit_status.value]
+                for visit_status in VisitStatus
+            },
+        }
+        for row in db.execute(stmt)
+    ]
+
+
 def get_schedule_by_id(db: Session, schedule_id: int) -> Optional[Schedule]:
     stmt = select(Schedule).where(Schedule.id == schedule_id)
     return db.execute(stmt).scalar_one_or_none()
 
 
+def _schedule_with_relations_query():
+    """
+    Schedule with employees, customers, measures and care visits (with their
+    measures and employees). One query per collection regardless of size;
+    the many-to-one hops are joined into those queries.
+    """
+    return select(Schedule).options(
+        selectinload(Schedule.employees)
+        .joinedload(ScheduleEmployee.employee)
+        .joinedload(Employee.user),
+        selectinload(Schedule.customers).joinedload(ScheduleCustomer.customer),
+        selectinload(Schedule.measures).joinedload(ScheduleMeasure.measure),
+        selectinload(Schedule.care_visits).options(
+            selectinload(CareVisit.measures).joinedload(MeasureCareVisit.measure),
+            selectinload(CareVisit.employees)
+            .joinedload(EmployeeCareVisit.employee)
+            .joinedload(Employee.user),
+        ),
+    )
+
+
+def get_schedule_with_relations(db: Session, schedule_id: int) -> Optional[Schedule]:
+    stmt = _schedule_with_relations_query().where(Schedule.id == schedule_id)
+    return db.execute(stmt).scalar_one_or_none()
+
+
+def get_schedule_with_relations_by_date(
+    db: Session, date: date_type
+) -> Optional[Schedule]:
+    stmt = _schedule_with_relations_query().where(Schedule.date == date)
+    return db.execute(stmt).scalar_one_or_none()
+
+
 def update_schedule(
     db: Session, schedule_id: int, data: ScheduleUpdateSchema
 ) -> Optional[Schedule]:
@@ -117,62 +248,367 @@ def duplicate_schedule(
     if not source_schedule:
         return None
 
-    stmt = select(Schedule).where(Schedule.date == target_date)
-    if db.execute(stmt).scalar_one_or_none():
-        raise ValueError(f"Schedule for {target_date} already exists.")
-
-    try:
-        new_schedule = Schedule(
+    stmt = (
+        pg_insert(Schedule)
+        .values(
             date=target_date,
             shift_type=source_schedule.shift_type,
             custom_shift=source_schedule.custom_shift,
         )
-        db.add(new_schedule)
+        .on_conflict_do_nothing(index_elements=["date"])
+        .returning(Schedule)
+    )
+
+    try:
+        new_schedule = db.execute(stmt).scalar_one_or_none()
+        if not new_schedule:
+            db.rollback()
+            raise ValueError(f"Schedule for {target_date} already exists.")
         db.commit()
-        db.refresh(new_schedule)
         return new_schedule
     except IntegrityError:
         db.rollback()
         raise
 
 
-def assign_employee_to_schedule(
-    db: Session, schedule_id: int, employee_id: int
-) -> None:
-    # Verify schedule exists
-    schedule = get_schedule_by_id(db, schedule_id)
-    if not schedule:
-        raise ScheduleNotFoundError(schedule_id)
+def _copy_map_table(name: str, *columns: str) -> Table:
+    """Transaction scoped table used to map source ids to new ids"""
+    return Table(
+        name,
+        MetaData(),
+        *[Column(name, Date if name == "date" else Integer) for name in columns],
+        prefixes=["TEMPORARY"],
+        postgresql_on_commit="DROP",
+    )
+
+
+def copy_schedules(db: Session, data: ScheduleCopySchema) -> dict:
+    """
+    Deep copy the schedules in a source period onto a target period.
+
+    The source period (a single day or e.g. a whole week) is repeated over the
+    target period. Employee, customer and measure assignments are copied along
+    with the schedules and, optionally, the care visits with their measures
+    and employees (reset to planned). Everything is copied server-side with
+    INSERT ... SELECT statements in one transaction.
 
-    # Verify employee exists
-    employee_stmt = (
-        select(User).join(User.employee).where(User.employee.id == employee_id)
+    With skip_absent_employees, employees with an absence covering the target
+    day are left out of both the schedule and the visits.
+    """
+    source_end_date = data.source_end_date or data.source_start_date
+    period_days = (source_end_date - data.source_start_date).days + 1
+    target_end_date = data.target_end_date or (
+        data.target_start_date + timedelta(days=period_days - 1)
     )
-    employee = db.execute(employee_stmt).scalar_one_or_none()
-    if not employee:
-        raise EmployeeNotFoundError(employee_id)
 
-    # Check if assignment already exists
-    existing = db.execute(
-        select(ScheduleEmployee).where(
-            ScheduleEmployee.schedule_id == schedule_id,
-            ScheduleEmployee.employee_id == employee_id,
+    if source_end_date < data.source_start_date:
+        raise ValueError("Source start date cannot be after source end date")
+
+    if target_end_date < data.target_start_date:
+        raise ValueError("Target start date cannot be after target end date")
+
+    if (target_end_date - data.target_start_date).days >= MAX_COPY_DAYS:
+        raise ValueError(f"Cannot copy onto more than {MAX_COPY_DAYS} days at once")
+
+    if (
+        data.target_start_date <= source_end_date
+        and target_end_date >= data.source_start_date
+    ):
+        raise ValueError("Source and target periods cannot overlap")
+
+    first_offset = (data.target_start_date - data.source_start_date).days
+    last_offset = (target_end_date - data.source_start_date).days
+    offsets = values(column("day_offset", Integer), name="copy_offsets").data(
+        [(offset,) for offset in range(first_offset, last_offset + 1, period_days)]
+    )
+    target_date = Schedule.date + offsets.c.day_offset
+
+    schedule_map = _copy_map_table(
+        "schedule_copy_map", "old_id", "new_id", "day_offset", "date"
+    )
+    visit_map = _copy_map_table("visit_copy_map", "old_id", "new_id", "schedule_id")
+
+    result = {
+        "schedules": [],
+        "employees_copied": 0,
+        "employees_skipped": 0,
+        "customers_copied": 0,
+        "measures_copied": 0,
+        "care_visits_copied": 0,
+    }
+
+    try:
+        connection = db.connection()
+        schedule_map.create(connection)
+
+        db.execute(
+            insert(schedule_map).from_select(
+                ["old_id", "new_id", "day_offset", "date"],
+                select(
+                    Schedule.id,
+                    func.nextval(func.pg_get_serial_sequence("schedules", "id")),
+                    offsets.c.day_offset,
+                    target_date,
+                )
+                .select_from(Schedule)
+                .join(offsets, true())
+                .where(
+                    Schedule.date >= data.source_start_date,
+                    Schedule.date <= source_end_date,
+                    target_date <= target_end_date,
+                ),
+            )
         )
-    ).scalar_one_or_none()
 
-    if existing:
-        raise ValueError(
-            f"Employee {employee_id} already assigned to schedule {schedule_id}"
+        conflicts = (
+            db.execute(
+                select(Schedule.date)
+                .join(schedule_map, schedule_map.c.date == Schedule.date)
+                .order_by(Schedule.date)
+            )
+            .scalars()
+            .all()
         )
+        if conflicts:
+            raise ValueError(
+                f"Schedules already exist for {', '.join(map(str, conflicts))}"
+            )
 
-    try:
-        assignment = ScheduleEmployee(schedule_id=schedule_id, employee_id=employee_id)
-        db.add(assignment)
+        db.execute(
+            insert(Schedule).from_select(
+                ["id", "date", "shift_type", "custom_shift"],
+                select(
+                    schedule_map.c.new_id,
+                    schedule_map.c.date,
+                    Schedule.shift_type,
+                    Schedule.custom_shift,
+                ).join(Schedule, Schedule.id == schedule_map.c.old_id),
+            )
+        )
+
+        def not_absent(employee_id, on_date):
+            return ~exists().where(
+                Absence.employee_id == employee_id,
+                Absence.start_date <= on_date,
+                Absence.end_date >= on_date,
+            )
+
+        employees = select(schedule_map.c.new_id, ScheduleEmployee.employee_id).join(
+            ScheduleEmployee, ScheduleEmployee.schedule_id == schedule_map.c.old_id
+        )
+        if data.skip_absent_employees:
+            candidates = db.execute(
+                select(func.count()).select_from(employees.subquery())
+            ).scalar_one()
+            employees = employees.where(
+                not_absent(ScheduleEmployee.employee_id, schedule_map.c.date)
+            )
+        result["employees_copied"] = db.execute(
+            insert(ScheduleEmployee).from_select(
+                ["schedule_id", "employee_id"], employees
+            )
+        ).rowcount
+        if data.skip_absent_employees:
+            result["employees_skipped"] = candidates - result["employees_copied"]
+
+        result["customers_copied"] = db.execute(
+            insert(ScheduleCustomer).from_select(
+                ["schedule_id", "customer_id"],
+                select(schedule_map.c.new_id, ScheduleCustomer.customer_id).join(
+                    ScheduleCustomer,
+                    ScheduleCustomer.schedule_id == schedule_map.c.old_id,
+                ),
+            )
+        ).rowcount
+
+        result["measures_copied"] = db.execute(
+            insert(ScheduleMeasure).from_select(
+                [
+                    "schedule_id",
+                    "measure_id",
+                    "time_of_day",
+                    "custom_duration",
+                    "notes",
+                ],
+                select(
+                    schedule_map.c.new_id,
+                    ScheduleMeasure.measure_id,
+                    ScheduleMeasure.time_of_day,
+                    ScheduleMeasure.custom_duration,
+                    ScheduleMeasure.notes,
+                ).join(
+                    ScheduleMeasure,
+                    ScheduleMeasure.schedule_id == schedule_map.c.old_id,
+                ),
+            )
+        ).rowcount
+
+        if data.include_care_visits:
+            visit_map.create(connection)
+            db.execute(
+                insert(visit_map).from_select(
+                    ["old_id", "new_id", "schedule_id"],
+                    select(
+                        CareVisit.id,
+                        func.nextval(func.pg_get_serial_sequence("care_visits", "id")),
+                        schedule_map.c.new_id,
+                    ).join(CareVisit, CareVisit.schedule_id == schedule_map.c.old_id),
+                )
+            )
+
+            result["care_visits_copied"] = db.execute(
+                insert(CareVisit).from_select(
+                    [
+                        "id",
+                        "date",
+                        "status",
+                        "duration",
+                        "notes",
+                        "schedule_id",
+                        "customer_id",
+                    ],
+                    select(
+                        visit_map.c.new_id,
+                        CareVisit.date + schedule_map.c.day_offset,
+                        literal(VisitStatus.PLANNED.value),
+                        CareVisit.duration,
+                        CareVisit.notes,
+                        visit_map.c.schedule_id,
+                        CareVisit.customer_id,
+                    )
+                    .join(CareVisit, CareVisit.id == visit_map.c.old_id)
+                    .join(
+                        schedule_map, schedule_map.c.new_id == visit_map.c.schedule_id
+                    ),
+                )
+            ).rowcount
+
+            db.execute(
+                insert(MeasureCareVisit).from_select(
+                    ["measure_id", "care_visit_id"],
+                    select(MeasureCareVisit.measure_id, visit_map.c.new_id).join(
+                        MeasureCareVisit,
+                        MeasureCareVisit.care_visit_id == visit_map.c.old_id,
+                    ),
+                )
+            )
+
+            visit_employees = (
+                select(
+                    EmployeeCareVisit.employee_id,
+                    visit_map.c.new_id,
+                    EmployeeCareVisit.is_primary,
+                    EmployeeCareVisit.notes,
+                )
+                .join(
+                    EmployeeCareVisit,
+                    EmployeeCareVisit.care_visit_id == visit_map.c.old_id,
+                )
+                .join(schedule_map, schedule_map.c.new_id == visit_map.c.schedule_id)
+            )
+            if data.skip_absent_employees:
+                visit_employees = visit_employees.where(
+                    not_absent(EmployeeCareVisit.employee_id, schedule_map.c.date)
+                )
+            db.execute(
+                insert(EmployeeCareVisit).from_select(
+                    ["employee_id", "care_visit_id", "is_primary", "notes"],
+                    visit_employees,
+                )
+            )
+
+        result["schedules"] = list(
+            db.execute(
+                select(Schedule)
+                .where(Schedule.id.in_(select(schedule_map.c.new_id)))
+                .order_by(Schedule.date)
+            )
+            .scalars()
+            .all()
+        )
         db.commit()
+    except (ValueError, IntegrityError):
+        db.rollback()
+        raise
+
+    return result
+
+
+def _assign_one(
+    db: Session,
+    schedule_id: int,
+    model: type,
+    column_name: str,
+    target_id_column,
+    target_id: int,
+    not_found_error: type[Exception],
+    **extra,
+) -> None:
+    """
+    Insert one assignment in a single statement.
+
+    The row is only inserted when both the schedule and the target exist and
+    the assignment is new (ON CONFLICT DO NOTHING). Only when nothing was
+    inserted is a second query made to find out why.
+    """
+    values = {"schedule_id": schedule_id, column_name: target_id, **extra}
+    stmt = (
+        pg_insert(model)
+        .from_select(
+            list(values),
+            select(
+                *[
+                    literal(value, getattr(model, key).type)
+                    for key, value in values.items()
+                ]
+            )
+            .where(exists().where(Schedule.id == schedule_id))
+            .where(exists().where(target_id_column == target_id)),
+        )
+        .on_conflict_do_nothing(index_elements=["schedule_id", column_name])
+        .returning(model.id)
+    )
+
+    try:
+        inserted = db.execute(stmt).scalar_one_or_none()
+        if inserted:
+            db.commit()
+            return
+
+        schedule_found, target_found = db.execute(
+            select(
+                exists().where(Schedule.id == schedule_id),
+                exists().where(target_id_column == target_id),
+            )
+        ).one()
+        db.rollback()
     except IntegrityError:
         db.rollback()
         raise
 
+    if not schedule_found:
+        raise ScheduleNotFoundError(schedule_id)
+    if not target_found:
+        raise not_found_error(target_id)
+    raise ValueError(
+        f"{target_id_column.class_.__name__} {target_id} already assigned "
+        f"to schedule {schedule_id}"
+    )
+
+
+def assign_employee_to_schedule(
+    db: Session, schedule_id: int, employee_id: int
+) -> None:
+    _assign_one(
+        db,
+        schedule_id,
+        ScheduleEmployee,
+        "employee_id",
+        Employee.id,
+        employee_id,
+        EmployeeNotFoundError,
+    )
+
 
 def remove_employee_from_schedule(
     db: Session, schedule_id: int, employee_id: int
@@ -214,36 +650,15 @@ def get_schedule_employees(db: Session, schedule_id: int) -> list[User]:
 def assign_customer_to_schedule(
     db: Session, schedule_id: int, customer_id: int
 ) -> None:
-    # Verify schedule exists
-    schedule = get_schedule_by_id(db, schedule_id)
-    if not schedule:
-        raise ScheduleNotFoundError(schedule_id)
-
-    # Verify customer exists
-    customer_stmt = select(Customer).where(Customer.id == customer_id)
-    customer = db.execute(customer_stmt).scalar_one_or_none()
-    if not customer:
-        raise CustomerNotFoundError(customer_id)  # Not EmployeeNotFoundError
-
-    existing = db.execute(
-        select(ScheduleCustomer).where(
-            ScheduleCustomer.schedule_id == schedule_id,
-            ScheduleCustomer.customer_id == customer_id,
-        )
-    ).scalar_one_or_none()
-
-    if existing:
-        raise ValueError(
-            f"Customer {customer_id} already assigned to schedule {schedule_id}"
-        )
-
-    try:
-        assignment = ScheduleCustomer(schedule_id=schedule_id, customer_id=customer_id)
-        db.add(assignment)
-        db.commit()
-    except IntegrityError:
-        db.rollback()
-        raise
+    _assign_one(
+        db,
+        schedule_id,
+        ScheduleCustomer,
+        "customer_id",
+        Customer.id,
+        customer_id,
+        CustomerNotFoundError,
+    )
 
 
 def remove_customer_from_schedule(
@@ -285,43 +700,18 @@ def get_schedule_customers(db: Session, schedule_id: int) -> list[Customer]:
 def assign_measure_to_schedule(
     db: Session, schedule_id: int, data: ScheduleMeasureCreateSchema
 ) -> None:
-    # Verify schedule exists
-    schedule = get_schedule_by_id(db, schedule_id)
-    if not schedule:
-        raise ScheduleNotFoundError(schedule_id)
-
-    # Verify measure exists
-    measure_stmt = select(Measure).where(Measure.id == data.measure_id)
-    measure = db.execute(measure_stmt).scalar_one_or_none()
-    if not measure:
-        raise MeasureNotFoundError(data.measure_id)
-
-    # Check if assignment already exists
-    existing = db.execute(
-        select(ScheduleMeasure).where(
-            ScheduleMeasure.schedule_id == schedule_id,
-            ScheduleMeasure.measure_id == data.measure_id,
-        )
-    ).scalar_one_or_none()
-
-    if existing:
-        raise ValueError(
-            f"Measure {data.measure_id} already assigned to schedule {schedule_id}"
-        )
-
-    try:
-        assignment = ScheduleMeasure(
-            schedule_id=schedule_id,
-            measure_id=data.measure_id,
-            time_of_day=data.time_of_day,
-            custom_duration=data.custom_duration,
-            notes=data.notes,
-        )
-        db.add(assignment)
-        db.commit()
-    except IntegrityError:
-        db.rollback()
-        raise
+    _assign_one(
+        db,
+        schedule_id,
+        ScheduleMeasure,
+        "measure_id",
+        Measure.id,
+        data.measure_id,
+        MeasureNotFoundError,
+        time_of_day=data.time_of_day,
+        custom_duration=data.custom_duration,
+        notes=data.notes,
+    )
 
 
 def remove_measure_from_schedule(
@@ -356,3 +746,99 @@ def get_schedule_measures(db: Session, schedule_id: int) -> list[ScheduleMeasure
     )
 
     return list(measures)
+
+
+def _batch_assign(
+    db: Session,
+    schedule_id: int,
+    model: type,
+    column_name: str,
+    target_id_column,
+    rows: list[dict],
+) -> dict:
+    """
+    Insert many assignments onto a schedule in one statement.
+
+    Existence of the schedule and of all targets is checked with one query
+    each, duplicates are skipped by ON CONFLICT DO NOTHING and the ids the
+    statement actually returned are reported as inserted.
+    """
+    if not db.execute(select(exists().where(Schedule.id == schedule_id))).scalar():
+        raise ScheduleNotFoundError(schedule_id)
+
+    # Last occurrence of an id in the request wins
+    rows = list({row[column_name]: row for row in rows}.values())
+    requested = [row[column_name] for row in rows]
+    if not requested:
+        return {"inserted": [], "already_assigned": []}
+
+    found = set(
+        db.execute(select(target_id_column).where(target_id_column.in_(requested)))
+        .scalars()
+        .all()
+    )
+    missing = [target_id for target_id in requested if target_id not in found]
+    if missing:
+        raise ValueError(
+            f"{target_id_column.class_.__name__} not found: "
+            f"{', '.join(str(target_id) for target_id in missing)}"
+        )
+
+    stmt = (
+        pg_insert(model)
+        .values([{"schedule_id": schedule_id, **row} for row in rows])
+        .on_conflict_do_nothing(index_elements=["schedule_id", column_name])
+        .returning(getattr(model, column_name))
+    )
+    try:
+        inserted = set(db.execute(stmt).scalars().all())
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise
+
+    return {
+        "inserted": [target_id for target_id in requested if target_id in inserted],
+        "already_assigned": [
+            target_id for target_id in requested if target_id not in inserted
+        ],
+    }
+
+
+def assign_employees_to_schedule(
+    db: Session, schedule_id: int, employee_ids: list[int]
+) -> dict:
+    return _batch_assign(
+        db,
+        schedule_id,
+        ScheduleEmployee,
+        "employee_id",
+        Employee.id,
+        [{"employee_id": employee_id} for employee_id in employee_ids],
+    )
+
+
+def assign_customers_to_schedule(
+    db: Session, schedule_id: int, customer_ids: list[int]
+) -> dict:
+    return _batch_assign(
+        db,
+        schedule_id,
+        ScheduleCustomer,
+        "customer_id",
+        Customer.id,
+        [{"customer_id": customer_id} for customer_id in customer_ids],
+    )
+
+
+def assign_measures_to_schedule(
+    db: Session, schedule_id: int, measures: list[ScheduleMeasureCreateSchema]
+) -> dict:
+    return _batch_assign(
+        db,
+        schedule_id,
+        ScheduleMeasure,
+        "measure_id",
+        Measure.id,
+        [measure.model_dump() for measure in measures],
+    )
@@ -0,0 +1,255 @@
+from typing import Optional
+from datetime import date as date_type, timedelta
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import select, insert
+from sqlalchemy.exc import IntegrityError
+from ..schemas.schedule_template import (
+    ScheduleTemplateBaseSchema,
+    ScheduleTemplateApplySchema,
+)
+from ..models.schedule import Schedule, ScheduleEmployee, ScheduleMeasure
+from ..models.schedule_template import (
+    ScheduleTemplate,
+    ScheduleTemplateShift,
+    ScheduleTemplateEmployee,
+    ScheduleTemplateMeasure,
+)
+from ..models.employee import Employee
+from ..models.measure import Measure
+from ..core.exceptions import (
+    ScheduleTemplateNotFoundError,
+    EmployeeNotFoundError,
+    MeasureNotFoundError,
+)
+
+MAX_APPLY_DAYS = 186
+
+
+def _verify_references(db: Session, data: ScheduleTemplateBaseSchema) -> None:
+    """Check all referenced employees and measures exist, one query per type"""
+    employee_ids = {e for shift in data.shifts for e in shift.employee_ids}
+    if employee_ids:
+        found = set(
+            db.execute(select(Employee.id).where(Employee.id.in_(employee_ids)))
+            .scalars()
+            .all()
+        )
+        missing = sorted(employee_ids - found)
+        if missing:
+            raise EmployeeNotFoundError(missing[0])
+
+    measure_ids = {m.measure_id for shift in data.shifts for m in shift.measures}
+    if measure_ids:
+        found = set(
+            db.execute(select(Measure.id).where(Measure.id.in_(measure_ids)))
+            .scalars()
+            .all()
+        )
+        missing = sorted(measure_ids - found)
+        if missing:
+            raise MeasureNotFoundError(missing[0])
+
+
+def create_schedule_template(
+    db: Session, data: ScheduleTemplateBaseSchema
+) -> ScheduleTemplate:
+    stmt = select(ScheduleTemplate).where(ScheduleTemplate.name == data.name)
+    if db.execute(stmt).scalar_one_or_none():
+        raise ValueError(f"Schedule template '{data.name}' already exists.")
+
+    _verify_references(db, data)
+
+    try:
+        template = ScheduleTemplate(
+            name=data.name,
+            weeks=data.weeks,
+            shifts=[
+                ScheduleTemplateShift(
+                    week_offset=shift.week_offset,
+                    weekday=shift.weekday,
+                    shift_type=shift.shift_type,
+                    custom_shift=shift.custom_shift,
+                    employees=[
+                        ScheduleTemplateEmployee(employee_id=employee_id)
+                        for employee_id in dict.fromkeys(shift.employee_ids)
+                    ],
+                    measures=[
+                        ScheduleTemplateMeasure(**measure.model_dump())
+                        for measure in shift.measures
+                    ],
+                )
+                for shift in data.shifts
+            ],
+        )
+        db.add(template)
+        db.commit()
+        return get_schedule_template_by_id(db, template.id)
+    except IntegrityError:
+        db.rollback()
+        raise
+
+
+def get_schedule_templates(
+    db: Session, skip: int = 0, limit: int = 100
+) -> list[ScheduleTemplate]:
+    stmt = (
+        select(ScheduleTemplate)
+        .options(
+            selectinload(ScheduleTemplate.shifts).selectinload(
+                ScheduleTemplateShift.employees
+            ),
+            selectinload(ScheduleTemplate.shifts).selectinload(
+                ScheduleTemplateShift.measures
+            ),
+        )
+        .order_by(ScheduleTemplate.name)
+        .offset(skip)
+        .limit(limit)
+    )
+    return list(db.execute(stmt).scalars().all())
+
+
+def get_schedule_template_by_id(
+    db: Session, template_id: int
+) -> Optional[ScheduleTemplate]:
+    stmt = (
+        select(ScheduleTemplate)
+        .options(
+            selectinload(ScheduleTemplate.shifts).selectinload(
+                ScheduleTemplateShift.employees
+            ),
+            selectinload(ScheduleTemplate.shifts).selectinload(
+                ScheduleTemplateShift.measures
+            ),
+        )
+        .where(ScheduleTemplate.id == template_id)
+    )
+    return db.execute(stmt).scalar_one_or_none()
+
+
+def delete_schedule_template(db: Session, template_id: int) -> bool:
+    template = get_schedule_template_by_id(db, template_id)
+    if not template:
+        return False
+    try:
+        db.delete(template)
+        db.commit()
+        return True
+    except IntegrityError:
+        db.rollback()
+        raise
+
+
+def apply_schedule_template(
+    db: Session, template_id: int, data: ScheduleTemplateApplySchema
+) -> dict:
+    """
+    Roll a template out over [start_date, end_date].
+
+    Weeks are counted from the Monday of rotation_start_date (week_offset 0)
+    and wrap around after template.weeks weeks, so a two week template
+    alternates between its two weeks for as long as the range runs. Days
+    without a shift in the template are left empty.
+
+    Schedules, employee assignments and measures are written with one
+    batched INSERT each in a single transaction.
+    """
+    template = get_schedule_template_by_id(db, template_id)
+    if not template:
+        raise ScheduleTemplateNotFoundError(template_id)
+
+    if data.start_date > data.end_date:
+        raise ValueError("Start date cannot be after end date")
+
+    if (data.end_date - data.start_date).days >= MAX_APPLY_DAYS:
+        raise ValueError(
+            f"Cannot apply a template to more than {MAX_APPLY_DAYS} days at once"
+        )
+
+    rotation_start = data.rotation_start_date or data.start_date
+    rotation_monday = rotation_start - timedelta(days=rotation_start.weekday())
+    shifts = {(shift.week_offset, shift.weekday): shift for shift in template.shifts}
+
+    planned: list[tuple[date_type, ScheduleTemplateShift]] = []
+    current = data.start_date
+    while current <= data.end_date:
+        week_offset = ((current - rotation_monday).days // 7) % template.weeks
+        shift = shifts.get((week_offset, current.weekday()))
+        if shift:
+            planned.append((current, shift))
+        current += timedelta(days=1)
+
+    result = {"schedules": [], "employees_assigned": 0, "measures_assigned": 0}
+    if not planned:
+        return result
+
+    existing = (
+        db.execute(
+            select(Schedule.date)
+            .where(Schedule.date.in_([day for day, _ in planned]))
+            .order_by(Schedule.date)
+        )
+        .scalars()
+        .all()
+    )
+    if existing:
+        raise ValueError(
+            f"Schedules already exist for {', '.join(str(d) for d in existing)}"
+        )
+
+    try:
+        schedule_ids = (
+            db.execute(
+                insert(Schedule).returning(Schedule.id, sort_by_parameter_order=True),
+                [
+                    {
+                        "date": day,
+                        "shift_type": shift.shift_type,
+                        "custom_shift": shift.custom_shift,
+                    }
+                    for day, shift in planned
+                ],
+            )
+            .scalars()
+            .all()
+        )
+
+        employee_rows = []
+        measure_rows = []
+        for schedule_id, (_, shift) in zip(schedule_ids, planned):
+            employee_rows.extend(
+                {"schedule_id": schedule_id, "employee_id": employee.employee_id}
+                for employee in shift.employees
+            )
+            measure_rows.extend(
+                {
+                    "schedule_id": schedule_id,
+                    "measure_id": measure.measure_id,
+                    "time_of_day": measure.time_of_day,
+                    "custom_duration": measure.custom_duration,
+                    "notes": measure.notes,
+                }
+                for measure in shift.measures
+            )
+
+        if employee_rows:
+            db.execute(insert(ScheduleEmployee), employee_rows)
+        if measure_rows:
+            db.execute(insert(ScheduleMeasure), measure_rows)
+
+        result["schedules"] = list(
+            db.execute(
+                select(Schedule)
+                .where(Schedule.id.in_(schedule_ids))
+                .order_by(Schedule.date)
+            )
+            .scalars()
+            .all()
+        )
+        result["employees_assigned"] = len(employee_rows)
+        result["measures_assigned"] = len(measure_rows)
+        db.commit()
+        return result
+    except IntegrityError:
+        db.rollback()
+        raise
@@ -1,16 +1,29 @@
 import secrets
 from typing import List
-from sqlalchemy import select, or_
-from sqlalchemy.orm import Session
+from sqlalchemy import (
+    select,
+    or_,
+    insert,
+    delete,
+    update,
+    values,
+    column,
+    Integer,
+    DateTime,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session, contains_eager
 from sqlalchemy.exc import IntegrityError
-from pydantic import EmailStr
-from datetime import date
+from pydantic import EmailStr, TypeAdapter, ValidationError
+from datetime import date, datetime, UTC
 from ..core.exceptions import UserNotFoundError
 from ..core.logger import logger
-from ..core.enums import RoleType
-from ..models import User, Employee, Token
+from ..core.search import search_term, text_search, trigram_enabled
+from ..core.enums import InviteStatus, RoleType
+from ..models import User, Employee, Token, RevokedToken
 from ..schemas.user import (
     UserInviteSchema,
+    UserInviteBatchSchema,
     UserCompleteRegistrationSchema,
     UserLoginSchema,
 )
@@ -21,27 +34,38 @@ from ..core.security import (
     verify_password,
     create_database_token,
 )
+from ..core.token_cache import token_cache, revocation_list
+from ..services.email_service import invitation_email
+from .email_outbox import enqueue_email, enqueue_emails
 
+_email_adapter = TypeAdapter(EmailStr)
 
-def invite_user(db: Session, user_data: UserInviteSchema):
-    stmt = select(User).where(User.email == user_data.email)
-    if db.execute(stmt).scalar_one_or_none():
-        raise ValueError(f"Email {user_data.email} already exists")
 
-    try:
-        registration_token = token_url_safe()
-
-        new_user = User(
+def invite_user(db: Session, user_data: UserInviteSchema):
+    stmt = (
+        pg_insert(User)
+        .values(
             email=user_data.email,
             is_superuser=user_data.is_superuser,
-            registration_token=registration_token,
+            registration_token=token_url_safe(),
             is_active=False,
             registration_completed=False,
         )
+        .on_conflict_do_nothing(index_elements=["email"])
+        .returning(User)
+    )
 
-        new_employee = Employee(user=new_user)
-
-        db.add(new_employee)
+    try:
+        new_user = db.execute(stmt).scalar_one_or_none()
+        if not new_user:
+            db.rollback()
+            raise ValueError(f"Email {user_data.email} already exists")
+
+        db.execute(insert(Employee).values(user_id=new_user.id))
+        # Queued in the same transaction, sent by the outbox worker
+        enqueue_email(
+            db, new_user.email, *invitation_email(new_user.registration_token)
+        )
         db.commit()
 
         logger.info(f"Created user invitation for {user_data.email}")
@@ -52,6 +76,88 @@ def invite_user(db: Session, user_data: UserInviteSchema):
         raise
 
 
+def invite_users(
+    db: Session, user_data: UserInviteBatchSchema
+) -> List[tuple[str, InviteStatus]]:
+    """
+    Invite many users in one transaction: one query for the emails that
+    already exist, then bulk inserts for users, employees and the outbox.
+    Returns a status per submitted email, in the submitted order.
+    """
+    results: List[tuple[str, InviteStatus]] = []
+    seen: set[str] = set()
+    for raw in user_data.emails:
+        try:
+            email = _email_adapter.validate_python(raw.strip())
+        except ValidationError:
+            results.append((raw, InviteStatus.INVALID))
+            continue
+        if email in seen:
+            results.append((email, InviteStatus.DUPLICATE))
+            continue
+        seen.add(email)
+        results.append((email, InviteStatus.INVITED))
+
+    if not seen:
+        return results
+
+    existing = set(
+        db.execute(select(User.email).where(User.email.in_(seen))).scalars().all()
+    )
+    new_emails = [
+        email
+        for email, result in results
+        if result == InviteStatus.INVITED and email not in existing
+    ]
+
+    invited: set[str] = set()
+    try:
+        if new_emails:
+            # ON CONFLICT covers emails invited concurrently since the lookup
+            rows = db.execute(
+                pg_insert(User)
+                .values(
+                    [
+                        {
+                            "email": email,
+                            "is_superuser": user_data.is_superuser,
+                            "registration_token": token_url_safe(),
+                            "is_active": False,
+                            "registration_completed": False,
+                        }
+                        for email in new_emails
+                    ]
+                )
+                .on_conflict_do_nothing(index_elements=["email"])
+                .returning(User.id, User.email, User.registration_token)
+            ).all()
+            if rows:
+                db.execute(insert(Employee), [{"user_id": row.id} for row in rows])
+                enqueue_emails(
+                    db,
+                    [
+                        (row.email, *invitation_email(row.registration_token))
+                        for row in rows
+                    ],
+                )
+            invited = {row.email for row in rows}
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise
+
+    logger.info(f"Created {len(invited)} user invitations")
+    return [
+        (
+            email,
+            InviteStatus.EXISTS
+            if result == InviteStatus.INVITED and email not in invited
+            else result,
+        )
+        for email, result in results
+    ]
+
+
 def complete_registration(db: Session, user_data: UserCompleteRegistrationSchema):
     stmt = select(User).where(User.registration_token == user_data.registration_token)
     existing_user = db.execute(stmt).scalar_one_or_none()
@@ -107,10 +213,98 @@ def login_user(db: Session, user_data: UserLoginSchema) -> Token | None:
 
 
 def logout_user(db: Session, token: Token) -> None:
+    token_cache.invalidate_token(token.token)
     db.delete(token)
     db.commit()
 
 
+def revoke_access_token(db: Session, claims: dict) -> None:
+    """Log out a signed access token: revoke it and delete its refresh token"""
+    expires_at = datetime.fromtimestamp(claims["exp"], UTC).replace(tzinfo=None)
+    revocation_list.revoke(claims["jti"], expires_at)
+
+    try:
+        db.execute(
+            pg_insert(RevokedToken)
+            .values(jti=claims["jti"], expires_at=expires_at)
+            .on_conflict_do_nothing(index_elements=["jti"])
+        )
+        db.execute(
+            delete(RevokedToken).where(
+                RevokedToken.expires_at < datetime.now(UTC).replace(tzinfo=None)
+            )
+        )
+        if claims.get("sid"):
+            db.execute(delete(Token).where(Token.id == claims["sid"]))
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise
+
+
+def purge_expired_tokens(db: Session, batch_size: int = 1000) -> int:
+    """
+    Delete expired tokens in chunks of batch_size, committing each chunk so
+    no single transaction holds locks on a large part of the table.
+    Returns the number of deleted tokens.
+    """
+    now = datetime.now(UTC).replace(tzinfo=None)
+    expired_ids = (
+        select(Token.id).where(Token.expire_date <= now).limit(batch_size)
+    ).scalar_subquery()
+
+    purged = 0
+    while True:
+        deleted = db.execute(
+            delete(Token)
+            .where(Token.id.in_(expired_ids))
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        db.commit()
+        purged += deleted
+        if deleted < batch_size:
+            return purged
+
+
+def _seen_values(seen: dict[int, datetime]):
+    return values(
+        column("id", Integer), column("seen", DateTime), name="seen_values"
+    ).data(list(seen.items()))
+
+
+def record_last_seen(
+    db: Session, users: dict[int, datetime], tokens: dict[int, datetime]
+) -> None:
+    """
+    Write buffered last-seen times with one multi-row UPDATE per table.
+    Rows already holding a newer time are left alone.
+    """
+    try:
+        if users:
+            seen = _seen_values(users)
+            db.execute(
+                update(User)
+                .where(User.id == seen.c.id)
+                .where(or_(User.last_seen.is_(None), User.last_seen < seen.c.seen))
+                # Activity is not an edit, so keep "updated" as it is
+                .values(last_seen=seen.c.seen, updated=User.updated)
+                .execution_options(synchronize_session=False)
+            )
+        if tokens:
+            seen = _seen_values(tokens)
+            db.execute(
+                update(Token)
+                .where(Token.id == seen.c.id)
+                .where(or_(Token.last_seen.is_(None), Token.last_seen < seen.c.seen))
+                .values(last_seen=seen.c.seen)
+                .execution_options(synchronize_session=False)
+            )
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise
+
+
 def delete_user(db: Session, user_id: int) -> bool:
     stmt = select(User).where(User.id == user_id)
     user = db.execute(stmt).scalar_one_or_none()
@@ -120,6 +314,7 @@ def delete_user(db: Session, user_id: int) -> bool:
 
     db.delete(user)
     db.commit()
+    token_cache.invalidate_user(user_id)
     return True
 
 
@@ -140,6 +335,7 @@ def update_user(db: Session, user_id: int, update_data: EmployeeUpdateSchema):
         setattr(employee, field, value)
 
     db.commit()
+    token_cache.invalidate_user(user_id)
     db.refresh(user)
     return user
 
@@ -159,6 +355,7 @@ def set_user_status(db: Session, user_id: int, is_active: bool) -> User:
         if user.employee:
             user.employee.is_active = is_active
         db.commit()
+        token_cache.invalidate_user(user_id)
         db.refresh(user)
         return user
     except IntegrityError:
@@ -249,6 +446,7 @@ def change_user_role(db: Session, user_id: int, new_role: RoleType) -> bool:
     try:
         user.employee.role = new_role
         db.commit()
+        token_cache.invalidate_user(user_id)
         return True
     except Exception:
         db.rollback()
@@ -260,25 +458,33 @@ def search_users(
     query: str | None = None,
     role: RoleType | None = None,
     is_active: bool | None = None,
+    skip: int = 0,
+    limit: int | None = None,
 ) -> list[User]:
-    stmt = select(User)
-
-    if query:
-        stmt = stmt.join(User.employee).where(
-            or_(
-                User.email.ilike(f"%{query}%"),
-                User.username.ilike(f"%{query}%"),
-                User.employee.first_name.ilike(f"%{query}%"),
-                User.employee.last_name.ilike(f"%{query}%"),
-            )
+    """
+    Users matching query on email, username or employee name, best match
+    first; queries need SEARCH_MIN_QUERY_LENGTH characters
+    """
+    stmt = select(User).outerjoin(User.employee).options(contains_eager(User.employee))
+    order_by = [User.id]
+
+    if term := search_term(query):
+        condition, rank = text_search(
+            term,
+            [User.email, User.username, Employee.first_name, Employee.last_name],
+            trigram_enabled(db),
         )
+        stmt = stmt.where(condition)
+        if rank is not None:
+            order_by.insert(0, rank.desc())
 
     if role:
-        stmt = stmt.join(User.employee).where(User.employee.role == role)
+        stmt = stmt.where(Employee.role == role)
 
     if is_active is not None:
         stmt = stmt.where(User.is_active == is_active)
 
+    stmt = stmt.order_by(*order_by).offset(skip).limit(limit)
     return list(db.execute(stmt).scalars().all())
 
 
@@ -290,12 +496,11 @@ def get_employees_by_role(db: Session, role: RoleType) -> list[User]:
 def get_available_employees(db: Session, date: date) -> list[User]:
     """Get employees who are not on absence for the given date"""
     from ..models.absence import Absence
+    from .absence import absence_covers
 
     # Subquery to find employee IDs who are on absence on the given date
     absent_employee_ids = (
-        select(Absence.employee_id)
-        .where(Absence.start_date <= date, Absence.end_date >= date)
-        .subquery()
+        select(Absence.employee_id).where(absence_covers(date)).subquery()
     )
 
     # Get active employees who are not in the absent list
@@ -310,3 +515,108 @@ def get_available_employees(db: Session, date: date) -> list[User]:
     )
 
     return list(available_employees)
+
+
+MAX_AVAILABILITY_DAYS = 93
+
+
+def get_employee_availability(db: Session, start_date: date, end_date: date) -> dict:
+    """
+    Availability matrix for all active employees over [start_date, end_date].
+
+    Each employee gets two strings with one character per day:
+    - available: "1" when employed and not absent that day
+    - assigned: "1" when already on that day's schedule
+
+    Built from three queries (employees, overlapping absences, assignments)
+    whatever the length of the period.
+    """
+    from ..models.absence import Absence
+    from ..models.schedule import Schedule, ScheduleEmployee
+    from .absence import absence_overlaps
+
+    if start_date > end_date:
+        raise ValueError("Start date cannot be after end date")
+
+    days = (end_date - start_date).days + 1
+    if days > MAX_AVAILABILITY_DAYS:
+        raise ValueError(
+            f"Cannot load availability for more than {MAX_AVAILABILITY_DAYS} days"
+        )
+
+    employees = db.execute(
+        select(
+            Employee.id,
+            Employee.user_id,
+            Employee.first_name,
+            Employee.last_name,
+            Employee.start_date,
+            Employee.end_date,
+        )
+        .join(Employee.user)
+        .where(
+            User.is_active,
+            Employee.is_active,
+            or_(Employee.start_date.is_(None), Employee.start_date <= end_date),
+            or_(Employee.end_date.is_(None), Employee.end_date >= start_date),
+        )
+        .order_by(Employee.last_name, Employee.first_name, Employee.id)
+    ).all()
+
+    available = {}
+    for employee in employees:
+        first = (
+            max((employee.start_date - start_date).days, 0)
+            if employee.start_date
+            else 0
+        )
+        last = (
+            min((employee.end_date - start_date).days, days - 1)
+            if employee.end_date
+            else days - 1
+        )
+        row = bytearray(b"0" * days)
+        row[first : last + 1] = b"1" * (last - first + 1)
+        available[employee.id] = row
+    assigned = {employee_id: bytearray(b"0" * days) for employee_id in available}
+
+    if available:
+        absences = db.execute(
+            select(Absence.employee_id, Absence.start_date, Absence.end_date).where(
+                Absence.employee_id.in_(available),
+                absence_overlaps(start_date, end_date),
+            )
+        ).all()
+        for absence in absences:
+            first = max((absence.start_date - start_date).days, 0)
+            last = min((absence.end_date - start_date).days, days - 1)
+            available[absence.employee_id][first : last + 1] = b"0" * (last - first + 1)
+
+        assignments = db.execute(
+            select(ScheduleEmployee.employee_id, Schedule.date)
+            .join(Schedule, Schedule.id == ScheduleEmployee.schedule_id)
+            .where(
+                ScheduleEmployee.employee_id.in_(available),
+                Schedule.date.between(start_date, end_date),
+            )
+        ).all()
+        for assignment in assignments:
+            day = (assignment.date - start_date).days
+            assigned[assignment.employee_id][day : day + 1] = b"1"
+
+    return {
+        "start_date": start_date,
+        "end_date": end_date,
+        "days": days,
+        "employees": [
+            {
+                "employee_id": employee.id,
+                "user_id": employee.user_id,
+                "first_name": employee.first_name,
+                "last_name": employee.last_name,
+                "available": available[employee.id].decode(),
+                "assigned": assigned[employee.id].decode(),
+            }
+            for employee in employees
+        ],
+    }
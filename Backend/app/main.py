@@ -1,20 +1,99 @@
+import asyncio
+import time
 import uvicorn
-from .core.db_setup import init_db
-from fastapi import FastAPI
+from .core.db_setup import (
+    READ_PRIMARY_COOKIE,
+    init_db,
+    async_engine,
+    replica_engine,
+)
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+from sqlalchemy import exc
 from contextlib import asynccontextmanager
 from .core.logger import logger
-from .routers import auth, user, customer, schedule, measure, care_visit, absence
+from .core.pagination import NEXT_CURSOR_HEADER
+from .core.serialization import FastJSONResponse
+from .core.password_pool import password_pool
+from .core.settings import settings
+from .services.token_purge import purge_tokens_periodically
+from .services.last_seen import flush_last_seen, flush_last_seen_periodically
+from .services.email_outbox import deliver_outbox_periodically
+from .services.email_service import smtp_sender
+from .routers import (
+    auth,
+    user,
+    employee,
+    customer,
+    schedule,
+    schedule_template,
+    measure,
+    care_visit,
+    absence,
+    internal,
+)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("Starting Timepiece API...")
     init_db()
+    purge_task = None
+    if settings.TOKEN_PURGE_INTERVAL_SECONDS > 0:
+        purge_task = asyncio.create_task(
+            purge_tokens_periodically(settings.TOKEN_PURGE_INTERVAL_SECONDS)
+        )
+    flush_task = asyncio.create_task(flush_last_seen_periodically())
+    outbox_task = asyncio.create_task(deliver_outbox_periodically())
     yield
+    tasks = [task for task in (purge_task, flush_task, outbox_task) if task]
+    for task in tasks:
+        task.cancel()
+    # The outbox worker finishes a batch in flight before returning, so the
+    # shared SMTP connection is idle by the time it is closed below
+    await asyncio.gather(*tasks, return_exceptions=True)
+    try:
+        await asyncio.to_thread(flush_last_seen)
+    except Exception as e:
+        logger.error(f"❌ Flushing last-seen times on shutdown failed: {e}")
+    password_pool.shutdown()
+    await asyncio.to_thread(smtp_sender.close)
+    await async_engine.dispose()
+    if replica_engine is not None:
+        await replica_engine.dispose()
+
+
+app = FastAPI(
+    title="Timepiece", lifespan=lifespan, default_response_class=FastJSONResponse
+)
+
+
+@app.exception_handler(exc.TimeoutError)
+async def pool_timeout_handler(request: Request, error: exc.TimeoutError):
+    """No free database connection within DB_POOL_TIMEOUT_SECONDS"""
+    logger.warning(f"Database pool exhausted on {request.method} {request.url.path}")
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "Database is busy, please try again"},
+        headers={"Retry-After": "1"},
+    )
 
 
-app = FastAPI(title="Timepiece", lifespan=lifespan)
+@app.middleware("http")
+async def read_your_writes(request: Request, call_next):
+    """Keep a client's reads on the primary for a moment after it committed"""
+    response = await call_next(request)
+    if replica_engine is not None and getattr(request.state, "db_committed", False):
+        window = settings.READ_YOUR_WRITES_SECONDS
+        response.set_cookie(
+            READ_PRIMARY_COOKIE,
+            str(time.time() + window),
+            max_age=window,
+            httponly=True,
+            samesite="lax",
+        )
+    return response
 
 
 app.add_middleware(
@@ -23,15 +102,19 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
 app.include_router(auth.router)
 app.include_router(user.router)
+app.include_router(employee.router)
 app.include_router(customer.router)
 app.include_router(schedule.router)
+app.include_router(schedule_template.router)
 app.include_router(measure.router)
 app.include_router(care_visit.router)
 app.include_router(absence.router)
+app.include_router(internal.router)
 
 
 @app.get("/")
@@ -8,16 +8,24 @@ from .schedule import (
     ScheduleEmployee,
     ScheduleArchive,
 )
+from .schedule_template import (
+    ScheduleTemplate,
+    ScheduleTemplateShift,
+    ScheduleTemplateEmployee,
+    ScheduleTemplateMeasure,
+)
 from .care_visit import CareVisit
 from .absence import Absence
 from .employee import Employee
-from .auth import User, Token
+from .auth import User, Token, RevokedToken
+from .email_outbox import EmailOutbox
 
 
 __all__ = [
     "Base",
     "User",
     "Token",
+    "RevokedToken",
     "Employee",
     "Customer",
     "CustomerMeasure",
@@ -28,6 +36,11 @@ __all__ = [
     "ScheduleMeasure",
     "ScheduleEmployee",
     "ScheduleArchive",
+    "ScheduleTemplate",
+    "ScheduleTemplateShift",
+    "ScheduleTemplateEmployee",
+    "ScheduleTemplateMeasure",
     "CareVisit",
     "Absence",
+    "EmailOutbox",
 ]
@@ -1,6 +1,7 @@
 from ..core.base import Base
 from ..core.enums import AbsenceType
-from sqlalchemy import ForeignKey, DateTime, Date, String, Integer, func, Index
+from sqlalchemy import ForeignKey, DateTime, Date, String, Integer, func, Index, text
+from sqlalchemy.dialects.postgresql import ExcludeConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from datetime import datetime, date
 from typing import TYPE_CHECKING
@@ -33,6 +34,19 @@ class Absence(Base):
         Index("ix_absence_start_date", "start_date"),
         Index("ix_absence_end_date", "end_date"),
         Index("ix_absence_employee_dates", "employee_id", "start_date", "end_date"),
+        Index(
+            "ix_absence_period",
+            text("daterange(start_date, end_date, '[]')"),
+            postgresql_using="gist",
+        ),
+        # No two absences for the same employee may overlap. The employee id
+        # is wrapped in a range so plain GiST can index it without btree_gist.
+        ExcludeConstraint(
+            (text("int4range(employee_id, employee_id, '[]')"), "&&"),
+            (text("daterange(start_date, end_date, '[]')"), "&&"),
+            name="ex_absence_employee_period",
+            using="gist",
+        ),
     )
 
     employee: Mapped["Employee"] = relationship(back_populates="absences")
@@ -6,7 +6,16 @@ if TYPE_CHECKING:
     from .employee import Employee
 
 from sqlalchemy.orm import mapped_column, Mapped, relationship
-from sqlalchemy import DateTime, String, Text, Boolean, func, ForeignKey, Integer
+from sqlalchemy import (
+    DateTime,
+    String,
+    Text,
+    Boolean,
+    func,
+    ForeignKey,
+    Integer,
+    Index,
+)
 
 
 class Token(Base):
@@ -22,12 +31,28 @@ class Token(Base):
     expire_date: Mapped[datetime] = mapped_column(
         DateTime,
         nullable=False,
+        index=True,
         default=lambda: datetime.now(timezone.utc) + timedelta(hours=24),
     )
+    # Device/app the token was issued to, so logins from it can reuse the token
+    client_id: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
+    last_seen: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     # Relationships
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"))
     user: Mapped["User"] = relationship(back_populates="tokens")
 
+    __table_args__ = (Index("ix_tokens_user_id_client_id", "user_id", "client_id"),)
+
+
+class RevokedToken(Base):
+    """Signed access tokens revoked before they expire (e.g. on logout)"""
+
+    __tablename__ = "revoked_tokens"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    jti: Mapped[str] = mapped_column(String(64), unique=True, nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)
+
 
 class User(Base):
     __tablename__ = "users"
@@ -47,6 +72,7 @@ class User(Base):
         String, unique=True, nullable=True
     )
     registration_completed: Mapped[bool] = mapped_column(Boolean, default=False)
+    last_seen: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
 
     created: Mapped[datetime] = mapped_column(
         DateTime, nullable=False, server_default=func.now()
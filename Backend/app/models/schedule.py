@@ -1,7 +1,17 @@
 from ..core.base import Base
 from ..core.enums import ShiftType
 
-from sqlalchemy import ForeignKey, DateTime, String, Integer, func, Text, Date, Enum
+from sqlalchemy import (
+    ForeignKey,
+    DateTime,
+    String,
+    Integer,
+    func,
+    Text,
+    Date,
+    Enum,
+    UniqueConstraint,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from datetime import datetime, date as date_type
 from typing import TYPE_CHECKING, List
@@ -18,7 +28,7 @@ class Schedule(Base):
     __tablename__ = "schedules"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    date: Mapped[date_type] = mapped_column(Date, nullable=False)
+    date: Mapped[date_type] = mapped_column(Date, nullable=False, unique=True)
     shift_type: Mapped[ShiftType | None] = mapped_column(Enum(ShiftType), nullable=True)
     custom_shift: Mapped[str | None] = mapped_column(String(50), nullable=True)
 
@@ -77,6 +87,9 @@ class ScheduleArchive(Base):
 
 class ScheduleEmployee(Base):
     __tablename__ = "schedule_employee"
+    __table_args__ = (
+        UniqueConstraint("schedule_id", "employee_id", name="uq_schedule_employee"),
+    )
 
     schedule_id: Mapped[int] = mapped_column(
         ForeignKey("schedules.id"), primary_key=True
@@ -91,6 +104,9 @@ class ScheduleEmployee(Base):
 
 class ScheduleMeasure(Base):
     __tablename__ = "schedule_measure"
+    __table_args__ = (
+        UniqueConstraint("schedule_id", "measure_id", name="uq_schedule_measure"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
 
@@ -115,6 +131,9 @@ class ScheduleMeasure(Base):
 
 class ScheduleCustomer(Base):
     __tablename__ = "schedule_customer"
+    __table_args__ = (
+        UniqueConstraint("schedule_id", "customer_id", name="uq_schedule_customer"),
+    )
 
     schedule_id: Mapped[int] = mapped_column(
         ForeignKey("schedules.id"), primary_key=True
@@ -0,0 +1,95 @@
+from ..core.base import Base
+from ..core.enums import ShiftType
+
+from sqlalchemy import (
+    ForeignKey,
+    DateTime,
+    String,
+    Integer,
+    func,
+    Enum,
+    UniqueConstraint,
+)
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from datetime import datetime
+from typing import List
+
+
+class ScheduleTemplate(Base):
+    __tablename__ = "schedule_templates"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    name: Mapped[str] = mapped_column(String(100), nullable=False, unique=True)
+    weeks: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
+
+    shifts: Mapped[List["ScheduleTemplateShift"]] = relationship(
+        back_populates="template",
+        cascade="all, delete-orphan",
+        order_by="[ScheduleTemplateShift.week_offset, ScheduleTemplateShift.weekday]",
+    )
+
+    created: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, server_default=func.now()
+    )
+
+    def __repr__(self) -> str:
+        return f"<ScheduleTemplate {self.name} ({self.weeks} weeks)>"
+
+
+class ScheduleTemplateShift(Base):
+    __tablename__ = "schedule_template_shifts"
+    __table_args__ = (UniqueConstraint("template_id", "week_offset", "weekday"),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    template_id: Mapped[int] = mapped_column(
+        ForeignKey("schedule_templates.id", ondelete="CASCADE"), nullable=False
+    )
+    week_offset: Mapped[int] = mapped_column(Integer, nullable=False)
+    weekday: Mapped[int] = mapped_column(Integer, nullable=False)
+    shift_type: Mapped[ShiftType | None] = mapped_column(Enum(ShiftType), nullable=True)
+    custom_shift: Mapped[str | None] = mapped_column(String(50), nullable=True)
+
+    template: Mapped["ScheduleTemplate"] = relationship(back_populates="shifts")
+    employees: Mapped[List["ScheduleTemplateEmployee"]] = relationship(
+        back_populates="shift", cascade="all, delete-orphan"
+    )
+    measures: Mapped[List["ScheduleTemplateMeasure"]] = relationship(
+        back_populates="shift", cascade="all, delete-orphan"
+    )
+
+    @property
+    def employee_ids(self) -> list[int]:
+        return [employee.employee_id for employee in self.employees]
+
+    def __repr__(self) -> str:
+        shift_info = self.shift_type.value if self.shift_type else self.custom_shift
+        return f"<ScheduleTemplateShift week={self.week_offset} weekday={self.weekday} ({shift_info})>"
+
+
+class ScheduleTemplateEmployee(Base):
+    __tablename__ = "schedule_template_employee"
+    __table_args__ = (UniqueConstraint("template_shift_id", "employee_id"),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    template_shift_id: Mapped[int] = mapped_column(
+        ForeignKey("schedule_template_shifts.id", ondelete="CASCADE"), nullable=False
+    )
+    employee_id: Mapped[int] = mapped_column(ForeignKey("employee.id"), nullable=False)
+
+    shift: Mapped["ScheduleTemplateShift"] = relationship(back_populates="employees")
+
+
+class ScheduleTemplateMeasure(Base):
+    __tablename__ = "schedule_template_measure"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    template_shift_id: Mapped[int] = mapped_column(
+        ForeignKey("schedule_template_shifts.id", ondelete="CASCADE"), nullable=False
+    )
+    measure_id: Mapped[int] = mapped_column(ForeignKey("measures.id"), nullable=False)
+
+    time_of_day: Mapped[str] = mapped_column(String(20), nullable=True)
+    custom_duration: Mapped[int] = mapped_column(Integer, nullable=True)
+    notes: Mapped[str] = mapped_column(String(255), nullable=True)
+
+    shift: Mapped["ScheduleTemplateShift"] = relationship(back_populates="measures")
@@ -1,5 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
 from datetime import date
 from sqlalchemy.exc import IntegrityError
@@ -14,22 +14,24 @@ from ..crud.absence import (
     delete_absence,
     get_absence_by_id,
 )
-from ..core.db_setup import get_db
+from ..core.db_setup import get_async_db, get_async_read_db
 from ..dependencies import require_admin
 from ..core.logger import logger
+from ..core.serialization import ListFormat, ListSerializer, list_format
 
 
 router = APIRouter(prefix="/absences", tags=["Absences"])
+absence_list = ListSerializer(AbsenceOutSchema)
 
 
 @router.post("/", response_model=AbsenceOutSchema, status_code=status.HTTP_201_CREATED)
 async def create_absence_endpoint(
     data: AbsenceBaseSchema,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(require_admin),
 ):
     try:
-        new_absence = create_absence(db, data)
+        new_absence = await db.run_sync(create_absence, data)
         logger.info(f"{current_user.username} created a new absence: {new_absence.id}")
         return new_absence
     except ValueError as e:
@@ -51,11 +53,12 @@ async def list_absences(
     active_only: Optional[bool] = Query(None, description="Show only current absences"),
     skip: int = Query(0, ge=0, description="Number of records to skip for pagination"),
     limit: int = Query(100, le=1000, description="Max number of records to return"),
-    db: Session = Depends(get_db),
+    output: ListFormat = Depends(list_format),
+    db: AsyncSession = Depends(get_async_read_db),
     current_user: User = Depends(require_admin),
 ):
-    absences = get_absences(
-        db=db,
+    absences = await db.run_sync(
+        get_absences,
         employee_id=employee_id,
         absence_type=absence_type,
         start_date=start_date,
@@ -68,7 +71,7 @@ async def list_absences(
         f"Admin {current_user.username} listed {len(absences)} absences "
         f"(skip={skip}, limit={limit})"
     )
-    return absences
+    return absence_list.response(absences, format=output)
 
 
 @router.get(
@@ -76,10 +79,10 @@ async def list_absences(
 )
 async def get_absence(
     absence_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
     current_user: User = Depends(require_admin),
 ):
-    absence = get_absence_by_id(db, absence_id=absence_id)
+    absence = await db.run_sync(get_absence_by_id, absence_id=absence_id)
 
     if not absence:
         raise HTTPException(
@@ -96,11 +99,11 @@ async def get_absence(
 async def update_absence_endpoint(
     absence_id: int,
     data: AbsenceUpdateSchema,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(require_admin),
 ):
     try:
-        absence = update_absence(db, absence_id=absence_id, data=data)
+        absence = await db.run_sync(update_absence, absence_id=absence_id, data=data)
 
         if not absence:
             raise HTTPException(
@@ -122,13 +125,13 @@ async def update_absence_endpoint(
 @router.delete("/{absence_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_absence_endpoint(
     absence_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(require_admin),
 ):
     logger.info(f"Admin {current_user.username} is deleting absence {absence_id}")
 
     try:
-        success = delete_absence(db, absence_id=absence_id)
+        success = await db.run_sync(delete_absence, absence_id=absence_id)
 
         if not success:
             raise HTTPException(
@@ -1,29 +1,45 @@
 from typing import Annotated
+from pydantic import ValidationError
 from sqlalchemy.orm import Session
-from fastapi import APIRouter, status, Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, status, Depends, HTTPException, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordRequestForm
 
+from ..core.enums import InviteStatus
 from ..core.logger import logger
-from ..core.db_setup import get_db
+from ..core.db_setup import get_db, get_async_db
+from ..core.settings import settings
 from ..core.security import (
-    get_current_token,
+    oauth2_scheme,
     get_current_superuser,
-    create_database_token,
+    verify_token_access,
+    decode_access_token,
+    create_access_token,
+    issue_tokens,
 )
-from ..models import User, Token
+from ..core.token_cache import token_cache
+from ..core.password_pool import password_pool
+from ..models import User
+from ..schemas.token import RefreshTokenSchema
 from ..schemas.user import (
     UserCompleteRegistrationSchema,
     UserOutSchema,
     UserInviteSchema,
+    UserInviteBatchSchema,
+    UserInviteBatchOutSchema,
+    UserInviteResultSchema,
     UserLoginSchema,
 )
 from ..crud.user import (
     complete_registration,
     authenticate_user,
     invite_user,
+    invite_users,
     logout_user,
+    revoke_access_token,
 )
-from ..services.email_service import EmailService
 
 router = APIRouter(tags=["auth"], prefix="/auth")
 
@@ -31,29 +47,72 @@ router = APIRouter(tags=["auth"], prefix="/auth")
 @router.post("/invite", status_code=status.HTTP_201_CREATED)
 async def invite_user_endpoint(
     user_data: UserInviteSchema,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_superuser),
 ):
-    new_user = invite_user(db, user_data)
+    new_user = await db.run_sync(invite_user, user_data)
 
     if not new_user.registration_token:
         raise HTTPException(
             status_code=500, detail="Failed to generate registration token"
         )
 
-    email_service = EmailService()
-    await email_service.send_invitation_email(
-        to_email=user_data.email, token=new_user.registration_token
+    return {"message": "Invitation queued", "email": user_data.email}
+
+
+async def _read_invite_batch(request: Request) -> UserInviteBatchSchema:
+    body = await request.body()
+    try:
+        if request.headers.get("content-type", "").startswith("text/csv"):
+            return UserInviteBatchSchema.from_csv(body.decode())
+        return UserInviteBatchSchema.model_validate_json(body)
+    except UnicodeDecodeError:
+        raise HTTPException(status_code=400, detail="CSV must be UTF-8")
+    except ValidationError as e:
+        raise RequestValidationError(e.errors())
+
+
+@router.post(
+    "/invite:batch",
+    status_code=status.HTTP_200_OK,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": UserInviteBatchSchema.model_json_schema()
+                },
+                "text/csv": {"schema": {"type": "string"}},
+            },
+        }
+    },
+)
+async def invite_users_endpoint(
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_superuser),
+) -> UserInviteBatchOutSchema:
+    """
+    Invite up to 500 users: a JSON body, or text/csv with one email per row.
+    Each email is reported as invited, exists, duplicate or invalid.
+    """
+    batch = await _read_invite_batch(request)
+    results = await db.run_sync(invite_users, batch)
+    return UserInviteBatchOutSchema(
+        invited=sum(result == InviteStatus.INVITED for _, result in results),
+        results=[
+            UserInviteResultSchema(email=email, status=result)
+            for email, result in results
+        ],
     )
 
-    return {"message": "Invitation sent", "email": user_data.email}
-
 
 @router.post("/complete-registration", status_code=status.HTTP_201_CREATED)
 async def complete_registration_endpoint(
     user: UserCompleteRegistrationSchema, db: Session = Depends(get_db)
 ) -> UserOutSchema:
-    new_user = complete_registration(db, user)
+    # Password endpoints keep a sync session: their CRUD runs on a worker thread
+    new_user = await password_pool.run(complete_registration, db, user)
     return UserOutSchema.model_validate(new_user)
 
 
@@ -61,33 +120,59 @@ async def complete_registration_endpoint(
 async def login_endpoint(
     user_data: UserLoginSchema, db: Session = Depends(get_db)
 ) -> dict:
-    user = authenticate_user(db, user_data)
+    user = await password_pool.run(authenticate_user, db, user_data)
     if not user:
         raise HTTPException(status_code=401, detail="Invalid credentials")
 
-    token = create_database_token(user.id, db)
-    return {"access_token": token.token, "token_type": "bearer"}
+    return await run_in_threadpool(issue_tokens, user, db, user_data.client_id)
 
 
 @router.delete("/logout", status_code=status.HTTP_204_NO_CONTENT)
 async def logout(
-    current_token: Token = Depends(get_current_token), db: Session = Depends(get_db)
+    token: Annotated[str, Depends(oauth2_scheme)],
+    db: AsyncSession = Depends(get_async_db),
 ):
-    logout_user(db, current_token)
+    if settings.TOKEN_MODE == "jwt":
+        await db.run_sync(revoke_access_token, decode_access_token(token))
+    else:
+        await db.run_sync(
+            lambda session: logout_user(session, verify_token_access(token, session))
+        )
     logger.info("User logged out successfully")
     return
 
 
+@router.post("/refresh")
+async def refresh_access_token(
+    data: RefreshTokenSchema, db: AsyncSession = Depends(get_async_db)
+) -> dict:
+    if settings.TOKEN_MODE != "jwt":
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Token refresh is only available with signed access tokens",
+        )
+
+    session_token = await db.run_sync(
+        lambda session: verify_token_access(data.refresh_token, session)
+    )
+    return {
+        "access_token": create_access_token(session_token.user, session_token),
+        "refresh_token": data.refresh_token,
+        "token_type": "bearer",
+        "expires_in": settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+    }
+
+
 @router.post("/token")
 async def login_oauth2(
     form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
     db: Session = Depends(get_db),
-) -> dict[str, str]:
+) -> dict:
     login_data = UserLoginSchema(
         username=form_data.username, password=form_data.password
     )
 
-    user = authenticate_user(db, login_data)
+    user = await password_pool.run(authenticate_user, db, login_data)
     if not user:
         logger.warning(f"Failed login attempt for username: '{form_data.username}'")
         raise HTTPException(
@@ -96,6 +181,20 @@ async def login_oauth2(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    token_obj = create_database_token(user.id, db=db)
+    tokens = await run_in_threadpool(issue_tokens, user, db, form_data.client_id)
     logger.info(f"User '{user.username}' logged in successfully")
-    return {"access_token": token_obj.token, "token_type": "bearer"}
+    return tokens
+
+
+@router.get("/token-cache", status_code=status.HTTP_200_OK)
+async def token_cache_stats(
+    current_user: User = Depends(get_current_superuser),
+) -> dict:
+    return token_cache.stats()
+
+
+@router.get("/password-pool", status_code=status.HTTP_200_OK)
+async def password_pool_stats(
+    current_user: User = Depends(get_current_superuser),
+) -> dict:
+    return password_pool.stats()
@@ -1,15 +1,23 @@
-from typing import Optional
+import csv
+import io
+from typing import Literal, Optional
 from datetime import date as date_type
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 from fastapi import APIRouter, status, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 
 
 from ..core.enums import VisitStatus
+from ..core.exceptions import InvalidCursorError
+from ..core.serialization import ListFormat, ListSerializer, list_format
+from ..core.pagination import NEXT_CURSOR_HEADER, decode_cursor, encode_cursor
 from ..core.logger import logger
-from ..core.db_setup import get_db
+from ..core.db_setup import get_async_db, get_async_read_db
 from ..crud.care_visit import (
     create_care_visit,
+    filter_care_visits,
     get_care_visits,
     get_care_visit_by_id,
     delete_care_visit,
@@ -17,29 +25,58 @@ from ..crud.care_visit import (
     get_upcoming_visits,
     get_completed_visits,
     get_overdue_visits,
+    generate_care_visits,
 )
 from ..schemas.care_visit import (
     CareVisitBaseSchema,
     CareVisitOutSchema,
     CareVisitUpdateSchema,
+    CareVisitGenerationOutSchema,
 )
 from ..models.auth import User
+from ..models.care_visit import CareVisit
 from ..dependencies import require_admin
 
 
 router = APIRouter(tags=["care_visit"], prefix="/care_visits")
 
+# Rows fetched per round trip while exporting
+EXPORT_BATCH_SIZE = 1000
+EXPORT_COLUMNS = list(CareVisitOutSchema.model_fields)
+care_visit_list = ListSerializer(CareVisitOutSchema)
+
+
+def visit_cursor(
+    cursor: Optional[str] = Query(
+        None, description=f"Opaque cursor from the {NEXT_CURSOR_HEADER} header"
+    ),
+) -> Optional[tuple[date_type, int]]:
+    if cursor is None:
+        return None
+    try:
+        return decode_cursor(cursor)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+def next_cursor_headers(care_visits: list[CareVisit], limit: int) -> dict[str, str]:
+    """A full page may have a successor: point the client at it"""
+    if not care_visits or len(care_visits) < limit:
+        return {}
+    last = care_visits[-1]
+    return {NEXT_CURSOR_HEADER: encode_cursor(last.date, last.id)}
+
 
 @router.post(
     "/", response_model=CareVisitOutSchema, status_code=status.HTTP_201_CREATED
 )
 async def create_care_visit_endpoint(
     data: CareVisitBaseSchema,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(require_admin),
 ):
     try:
-        new_care_visit = create_care_visit(db, data)
+        new_care_visit = await db.run_sync(create_care_visit, data)
         logger.info(
             f"{current_user.username} created a new care_visit: {new_care_visit.id}"
         )
@@ -49,6 +86,35 @@ async def create_care_visit_endpoint(
         raise HTTPException(status_code=status.HTTP_409_CONFLICT)
 
 
+@router.post(
+    "/generate",
+    response_model=CareVisitGenerationOutSchema,
+    status_code=status.HTTP_201_CREATED,
+)
+async def generate_care_visits_endpoint(
+    start_date: date_type = Query(..., description="First day to generate"),
+    end_date: date_type = Query(..., description="Last day to generate"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(require_admin),
+):
+    try:
+        result = await db.run_sync(
+            generate_care_visits, start_date=start_date, end_date=end_date
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except IntegrityError:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT, detail="Database constraint violation"
+        )
+
+    logger.info(
+        f"Admin {current_user.username} generated {result['visits_created']} care visits "
+        f"({start_date} - {end_date})"
+    )
+    return result
+
+
 @router.get(
     "/", response_model=list[CareVisitOutSchema], status_code=status.HTTP_200_OK
 )
@@ -61,11 +127,13 @@ async def list_care_visits(
     schedule_id: Optional[int] = Query(None, description="Filter by schedule"),
     skip: int = Query(0, ge=0, description="Number of records to skip for pagination"),
     limit: int = Query(100, le=1000, description="Max number of records to return"),
-    db: Session = Depends(get_db),
+    after: Optional[tuple[date_type, int]] = Depends(visit_cursor),
+    output: ListFormat = Depends(list_format),
+    db: AsyncSession = Depends(get_async_read_db),
     current_user: User = Depends(require_admin),
 ):
-    care_visits = get_care_visits(
-        db=db,
+    care_visits = await db.run_sync(
+        get_care_visits,
         date=date,
         start_date=start_date,
         end_date=end_date,
@@ -74,6 +142,7 @@ async def list_care_visits(
         schedule_id=schedule_id,
         skip=skip,
         limit=limit,
+        after=after,
     )
 
     logger.info(
@@ -81,7 +150,82 @@ async def list_care_visits(
         f"(skip={skip}, limit={limit})"
     )
 
-    return care_visits
+    return care_visit_list.response(
+        care_visits,
+        headers=next_cursor_headers(care_visits, limit),
+        format=output,
+    )
+
+
+def _export_lines(rows: list, format: str, header: bool) -> str:
+    visits = [CareVisitOutSchema.model_validate(row) for row in rows]
+    if format == "ndjson":
+        return "".join(f"{visit.model_dump_json()}\n" for visit in visits)
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow(EXPORT_COLUMNS)
+    writer.writerows(
+        [visit.model_dump(mode="json")[column] for column in EXPORT_COLUMNS]
+        for visit in visits
+    )
+    return buffer.getvalue()
+
+
+@router.get("/export", status_code=status.HTTP_200_OK)
+async def export_care_visits(
+    format: Literal["ndjson", "csv"] = Query("ndjson", description="Export format"),
+    date: Optional[date_type] = Query(None, description="Filter by exact date"),
+    start_date: Optional[date_type] = Query(None, description="Filter from date"),
+    end_date: Optional[date_type] = Query(None, description="Filter to date"),
+    status: Optional[VisitStatus] = Query(None, description="Filter by visit status"),
+    customer_id: Optional[int] = Query(None, description="Filter by customer"),
+    schedule_id: Optional[int] = Query(None, description="Filter by schedule"),
+    db: AsyncSession = Depends(get_async_read_db),
+    current_user: User = Depends(require_admin),
+) -> StreamingResponse:
+    """
+    Stream every matching visit, ordered by (date, id). Rows come from a
+    server-side cursor EXPORT_BATCH_SIZE at a time, so memory stays flat
+    however many rows are exported.
+    """
+    query = filter_care_visits(
+        select(*(getattr(CareVisit, column) for column in EXPORT_COLUMNS))
+        .order_by(CareVisit.date, CareVisit.id)
+        .execution_options(yield_per=EXPORT_BATCH_SIZE),
+        date=date,
+        start_date=start_date,
+        end_date=end_date,
+        status=status,
+        customer_id=customer_id,
+        schedule_id=schedule_id,
+    )
+
+    async def stream():
+        # The session dependency has already exited by the time the body is
+        # sent; the session reconnects for the stream and is closed here
+        try:
+            result = await db.stream(query)
+            exported = 0
+            async for rows in result.partitions():
+                yield _export_lines(rows, format, header=exported == 0)
+                exported += len(rows)
+            if format == "csv" and exported == 0:
+                yield _export_lines([], format, header=True)
+            logger.info(
+                f"Admin {current_user.username} exported {exported} care visits "
+                f"as {format}"
+            )
+        finally:
+            await db.close()
+
+    media_type = "text/csv" if format == "csv" else "application/x-ndjson"
+    return StreamingResponse(
+        stream(),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="care_visits.{format}"'},
+    )
 
 
 @router.get(
@@ -91,10 +235,10 @@ async def list_care_visits(
 )
 async def get_care_visit(
     care_visit_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
     current_user: User = Depends(require_admin),
 ):
-    care_visit = get_care_visit_by_id(db, care_visit_id=care_visit_id)
+    care_visit = await db.run_sync(get_care_visit_by_id, care_visit_id=care_visit_id)
 
     if not care_visit:
         raise HTTPException(
@@ -108,13 +252,13 @@ async def get_care_visit(
 @router.delete("/{care_visit_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_care_visit_endpoint(
     care_visit_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(require_admin),
 ):
     logger.info(f"Admin {current_user.username} is deleting measure {care_visit_id}")
 
     try:
-        success = delete_care_visit(db, care_visit_id=care_visit_id)
+        success = await db.run_sync(delete_care_visit, care_visit_id=care_visit_id)
 
         if not success:
             raise HTTPException(
@@ -139,10 +283,12 @@ async def delete_care_visit_endpoint(
 async def update_care_visit_endpoint(
     care_visit_id: int,
     data: CareVisitUpdateSchema,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(require_admin),
 ):
-    care_visit = update_care_visit(db, care_visit_id=care_visit_id, data=data)
+    care_visit = await db.run_sync(
+        update_care_visit, care_visit_id=care_visit_id, data=data
+    )
 
     if not care_visit:
         raise HTTPException(
@@ -166,22 +312,29 @@ async def list_upcoming_care_visits(
     days_ahead: int = Query(7, ge=1, le=90, description="Number of days ahead to look"),
     skip: int = Query(0, ge=0, description="Number of records to skip for pagination"),
     limit: int = Query(100, le=1000, description="Max number of records to return"),
-    db: Session = Depends(get_db),
+    after: Optional[tuple[date_type, int]] = Depends(visit_cursor),
+    output: ListFormat = Depends(list_format),
+    db: AsyncSession = Depends(get_async_read_db),
     current_user: User = Depends(require_admin),
 ):
-    care_visits = get_upcoming_visits(
-        db=db,
+    care_visits = await db.run_sync(
+        get_upcoming_visits,
         customer_id=customer_id,
         schedule_id=schedule_id,
         days_ahead=days_ahead,  # Pass the parameter through
         skip=skip,
         limit=limit,
+        after=after,
     )
     logger.info(
         f"Admin {current_user.username} listed {len(care_visits)} upcoming care visits "
         f"({days_ahead} days ahead, skip={skip}, limit={limit})"
     )
-    return care_visits
+    return care_visit_list.response(
+        care_visits,
+        headers=next_cursor_headers(care_visits, limit),
+        format=output,
+    )
 
 
 @router.get(
@@ -195,16 +348,19 @@ async def list_completed_care_visits(
     days_back: int = Query(30, ge=1, le=365, description="Number of days back to look"),
     skip: int = Query(0, ge=0, description="Number of records to skip for pagination"),
     limit: int = Query(100, le=1000, description="Max number of records to return"),
-    db: Session = Depends(get_db),
+    after: Optional[tuple[date_type, int]] = Depends(visit_cursor),
+    output: ListFormat = Depends(list_format),
+    db: AsyncSession = Depends(get_async_read_db),
     current_user: User = Depends(require_admin),
 ):
-    care_visits = get_completed_visits(
-        db=db,
+    care_visits = await db.run_sync(
+        get_completed_visits,
         customer_id=customer_id,
         schedule_id=schedule_id,
         days_back=days_back,
         skip=skip,
         limit=limit,
+        after=after,
     )
 
     logger.info(
@@ -212,7 +368,11 @@ async def list_completed_care_visits(
         f"({days_back} days back, skip={skip}, limit={limit})"
     )
 
-    return care_visits
+    return care_visit_list.response(
+        care_visits,
+        headers=next_cursor_headers(care_visits, limit),
+        format=output,
+    )
 
 
 @router.get(
@@ -223,15 +383,18 @@ async def list_overdue_care_visits(
     schedule_id: Optional[int] = Query(None, description="Filter by schedule"),
     skip: int = Query(0, ge=0, description="Number of records to skip for pagination"),
     limit: int = Query(100, le=1000, description="Max number of records to return"),
-    db: Session = Depends(get_db),
+    after: Optional[tuple[date_type, int]] = Depends(visit_cursor),
+    output: ListFormat = Depends(list_format),
+    db: AsyncSession = Depends(get_async_read_db),
     current_user: User = Depends(require_admin),
 ):
-    care_visits = get_overdue_visits(
-        db=db,
+    care_visits = await db.run_sync(
+        get_overdue_visits,
         customer_id=customer_id,
         schedule_id=schedule_id,
         skip=skip,
         limit=limit,
+        after=after,
     )
 
     logger.info(
@@ -239,4 +402,8 @@ async def list_overdue_care_visits(
         f"(skip={skip}, limit={limit})"
     )
 
-    return care_visits
+    return care_visit_list.response(
+        care_visits,
+        headers=next_cursor_headers(care_visits, limit),
+        format=output,
+    )
@@ -1,12 +1,14 @@
 from fastapi import APIRouter, status, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 
 from ..dependencies import require_admin
-from ..core.db_setup import get_db
+from ..core.db_setup import get_async_db, get_async_read_db
 from ..core.exceptions import CustomerNotFoundError
 from ..core.logger import logger
+from ..core.serialization import ListFormat, ListSerializer, list_format
 from ..core.enums import CareLevel
+from ..core.search import SEARCH_MIN_QUERY_LENGTH
 from ..schemas.customer import (
     CustomerOutSchema,
     CustomerBaseSchema,
@@ -28,14 +30,17 @@ from ..crud.customer_measure import (
     create_customer_measure,
     delete_customer_measure,
     get_customer_measures,
+    update_customer_measure,
 )
 from ..schemas.relations import (
     CustomerMeasureOutSchema,
     CustomerMeasureCreateSchema,
+    CustomerMeasureUpdateSchema,
 )
 
 
 router = APIRouter(tags=["customer"], prefix="/customers")
+customer_list = ListSerializer(CustomerOutSchema)
 
 
 @router.post(
@@ -45,11 +50,11 @@ router = APIRouter(tags=["customer"], prefix="/customers")
 )
 async def create_customer_endpoint(
     data: CustomerBaseSchema,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(require_admin),
 ):
     try:
-        new_customer = create_customer(db, data)
+        new_customer = await db.run_sync(create_customer, data)
         logger.info(f"New customer created with id={new_customer.id}")
 
         return new_customer
@@ -67,11 +72,12 @@ async def list_customers(
     limit: int = Query(100, le=1000, description="Max number of records to return"),
     include_inactive: bool = Query(False, description="Include inactive customers"),
     key_number: str | None = Query(None, description="Filter by customer key_number"),
-    db: Session = Depends(get_db),
+    output: ListFormat = Depends(list_format),
+    db: AsyncSession = Depends(get_async_read_db),
     current_user: User = Depends(require_admin),
 ):
-    customers = get_customers(
-        db=db,
+    customers = await db.run_sync(
+        get_customers,
         skip=skip,
         limit=limit,
         include_inactive=include_inactive,
@@ -81,6 +87,38 @@ async def list_customers(
         f"Admin {current_user.username} listed {len(customers)} customers "
         f"(skip={skip}, limit={limit}, include_inactive={include_inactive})"
     )
+    return customer_list.response(customers, format=output)
+
+
+@router.get(
+    "/search", response_model=list[CustomerOutSchema], status_code=status.HTTP_200_OK
+)
+async def search_customers_endpoint(
+    q: str | None = Query(
+        None,
+        description="Name or address, at least "
+        f"{SEARCH_MIN_QUERY_LENGTH} characters, or a key number",
+    ),
+    care_level: CareLevel | None = None,
+    is_active: bool | None = None,
+    skip: int = Query(0, ge=0, description="Number of records to skip for pagination"),
+    limit: int = Query(20, ge=1, le=100, description="Max number of records to return"),
+    db: AsyncSession = Depends(get_async_read_db),
+    current_user: User = Depends(require_admin),
+):
+    try:
+        customers = await db.run_sync(
+            search_customers,
+            query=q,
+            care_level=care_level,
+            is_active=is_active,
+            skip=skip,
+            limit=limit,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    logger.info(f"Customer search performed: {len(customers)} results")
     return customers
 
 
@@ -90,11 +128,11 @@ async def list_customers(
 async def get_customer(
     customer_id: int,
     include_inactive: bool = Query(False, description="Include inactive customers"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
     current_user: User = Depends(require_admin),
 ):
-    customer = get_customer_by_id(
-        db, customer_id=customer_id, include_inactive=include_inactive
+    customer = await db.run_sync(
+        get_customer_by_id, customer_id=customer_id, include_inactive=include_inactive
     )
 
     if not customer:
@@ -109,13 +147,13 @@ async def get_customer(
 @router.delete("/{customer_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_customer_endpoint(
     customer_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(require_admin),
 ):
     logger.info(f"Admin {current_user.username} is deleting customer {customer_id}")
 
     try:
-        success = delete_customer(db, customer_id=customer_id)
+        success = await db.run_sync(delete_customer, customer_id=customer_id)
         if not success:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -140,10 +178,10 @@ async def delete_customer_endpoint(
 async def update_customer_endpoint(
     customer_id: int,
     data: CustomerUpdateSchema,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(require_admin),
 ):
-    customer = update_customer(db, customer_id=customer_id, data=data)
+    customer = await db.run_sync(update_customer, customer_id=customer_id, data=data)
 
     if not customer:
         raise HTTPException(
@@ -158,31 +196,13 @@ async def update_customer_endpoint(
     return customer
 
 
-@router.get(
-    "/search", response_model=list[CustomerOutSchema], status_code=status.HTTP_200_OK
-)
-async def search_customers_endpoint(
-    q: str | None = None,
-    care_level: CareLevel | None = None,
-    is_active: bool | None = None,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(require_admin),
-):
-    customers = search_customers(
-        db, query=q, care_level=care_level, is_active=is_active
-    )
-
-    logger.info(f"Customer search performed: {len(customers)} results")
-    return customers
-
-
 @router.get("/exists/{key_number}", status_code=status.HTTP_200_OK)
 async def check_customer_exists(
     key_number: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
     current_user: User = Depends(require_admin),
 ):
-    exists = customer_exists(db, key_number=key_number)
+    exists = await db.run_sync(customer_exists, key_number=key_number)
     return {"exists": exists}
 
 
@@ -190,11 +210,13 @@ async def check_customer_exists(
 async def set_customer_status_endpoint(
     customer_id: int,
     status_data: CustomerStatusUpdateSchema,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(require_admin),
 ):
     try:
-        customer = set_customer_status(db, customer_id, status_data.is_active)
+        customer = await db.run_sync(
+            set_customer_status, customer_id, status_data.is_active
+        )
         return customer
     except CustomerNotFoundError:
         raise HTTPException(
@@ -216,7 +238,7 @@ async def set_customer_status_endpoint(
 )
 async def get_customer_measures_endpoint(
     customer_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
     current_user: User = Depends(require_admin),
 ):
     """
@@ -224,7 +246,7 @@ async def get_customer_measures_endpoint(
 
     Path: GET /customers/{customer_id}/measures
     """
-    measures = get_customer_measures(db, customer_id=customer_id)
+    measures = await db.run_sync(get_customer_measures, customer_id=customer_id)
 
     logger.info(
         f"Admin {current_user.username} retrieved {len(measures)} measures "
@@ -242,7 +264,7 @@ async def get_customer_measures_endpoint(
 async def create_customer_measure_endpoint(
     customer_id: int,
     data: CustomerMeasureCreateSchema,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(require_admin),
 ):
     """
@@ -251,8 +273,8 @@ async def create_customer_measure_endpoint(
     Path: POST /customers/{customer_id}/measures
     """
     try:
-        customer_measure = create_customer_measure(
-            db, customer_id=customer_id, data=data
+        customer_measure = await db.run_sync(
+            create_customer_measure, customer_id=customer_id, data=data
         )
 
         logger.info(
@@ -262,6 +284,8 @@ async def create_customer_measure_endpoint(
 
         return customer_measure
 
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except IntegrityError:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
@@ -270,6 +294,52 @@ async def create_customer_measure_endpoint(
         )
 
 
+@router.patch(
+    "/{customer_id}/measures/{customer_measure_id}",
+    response_model=CustomerMeasureOutSchema,
+    status_code=status.HTTP_200_OK,
+)
+async def update_customer_measure_endpoint(
+    customer_id: int,
+    customer_measure_id: int,
+    data: CustomerMeasureUpdateSchema,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(require_admin),
+):
+    """
+    Uppdaterar en kundinsats och planerar om kundens framtida besök.
+
+    Path: PATCH /customers/{customer_id}/measures/{customer_measure_id}
+    """
+    try:
+        customer_measure = await db.run_sync(
+            update_customer_measure,
+            customer_id=customer_id,
+            customer_measure_id=customer_measure_id,
+            data=data,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except IntegrityError:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Invalid measure_id for customer measure {customer_measure_id}",
+        )
+
+    if not customer_measure:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Customer measure with ID {customer_measure_id} not found",
+        )
+
+    logger.info(
+        f"Admin {current_user.username} updated customer_measure {customer_measure_id} "
+        f"for customer {customer_id}"
+    )
+
+    return customer_measure
+
+
 @router.delete(
     "/{customer_id}/measures/{customer_measure_id}",
     status_code=status.HTTP_204_NO_CONTENT,
@@ -277,7 +347,7 @@ async def create_customer_measure_endpoint(
 async def delete_customer_measure_endpoint(
     customer_id: int,
     customer_measure_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(require_admin),
 ):
     """
@@ -290,7 +360,12 @@ async def delete_customer_measure_endpoint(
         f"from customer {customer_id}"
     )
 
-    success = delete_customer_measure(db, customer_measure_id=customer_measure_id)
+    try:
+        success = await db.run_sync(
+            delete_customer_measure, customer_measure_id=customer_measure_id
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
     if not success:
         raise HTTPException(
@@ -0,0 +1,37 @@
+from datetime import date
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Depends, status, HTTPException, Query
+
+from ..dependencies import require_admin
+from ..models import User
+from ..core.db_setup import get_async_read_db
+from ..core.logger import logger
+from ..schemas.employee import EmployeeAvailabilityOutSchema
+from ..crud.user import get_employee_availability
+
+router = APIRouter(tags=["employees"], prefix="/employees")
+
+
+@router.get(
+    "/availability",
+    response_model=EmployeeAvailabilityOutSchema,
+    status_code=status.HTTP_200_OK,
+)
+async def get_employee_availability_endpoint(
+    start_date: date = Query(..., description="First day of the period"),
+    end_date: date = Query(..., description="Last day of the period"),
+    db: AsyncSession = Depends(get_async_read_db),
+    current_user: User = Depends(require_admin),
+):
+    try:
+        availability = await db.run_sync(
+            get_employee_availability, start_date, end_date
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    logger.info(
+        f"Admin {current_user.username} loaded availability for "
+        f"{len(availability['employees'])} employees from {start_date} to {end_date}"
+    )
+    return availability
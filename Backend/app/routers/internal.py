@@ -0,0 +1,21 @@
+from fastapi import APIRouter, Depends, status
+
+from ..core.db_setup import engine, async_engine, replica_engine
+from ..core.pool_metrics import pool_status
+from ..core.security import get_current_superuser
+from ..models import User
+
+router = APIRouter(tags=["internal"], prefix="/internal")
+
+
+@router.get("/db-pool", status_code=status.HTTP_200_OK)
+async def db_pool_stats(
+    current_user: User = Depends(get_current_superuser),
+) -> dict:
+    stats = {
+        "async": pool_status(async_engine.pool),
+        "sync": pool_status(engine.pool),
+    }
+    if replica_engine is not None:
+        stats["read"] = pool_status(replica_engine.pool)
+    return stats
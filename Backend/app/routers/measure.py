@@ -1,12 +1,13 @@
 from typing import Optional
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 from fastapi import APIRouter, status, Depends, HTTPException, Query
 
 from ..models.auth import User
 from ..core.logger import logger
+from ..core.serialization import ListSerializer
 from ..core.enums import TimeOfDay, TimeFlexibility
-from ..core.db_setup import get_db
+from ..core.db_setup import get_async_db, get_async_read_db
 from ..core.exceptions import MeasureNotFoundError
 from ..crud.measure import (
     create_measure,
@@ -26,6 +27,7 @@ from ..dependencies import require_admin
 
 
 router = APIRouter(tags=["measure"], prefix="/measures")
+measure_list = ListSerializer(MeasureOutSchema)
 
 
 @router.post(
@@ -35,11 +37,11 @@ router = APIRouter(tags=["measure"], prefix="/measures")
 )
 async def create_measure_endpoint(
     data: MeasureBaseSchema,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(require_admin),
 ):
     try:
-        new_measure = create_measure(db, data)
+        new_measure = await db.run_sync(create_measure, data)
         logger.info(
             f"{current_user.username} created a new measure: {new_measure.name}"
         )
@@ -64,11 +66,11 @@ async def list_measures(
     ),
     skip: int = Query(0, ge=0, description="Number of records to skip for pagination"),
     limit: int = Query(100, le=1000, description="Max number of records to return"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
     current_user: User = Depends(require_admin),
 ):
-    measures = get_measures(
-        db,
+    measures = await db.run_sync(
+        get_measures,
         query_str=query_str,
         time_of_day=time_of_day,
         time_flexibility=time_flexibility,
@@ -85,7 +87,7 @@ async def list_measures(
         f"is_active={is_active}, is_standard={is_standard})"
     )
 
-    return measures
+    return measure_list.response(measures)
 
 
 @router.get(
@@ -94,11 +96,11 @@ async def list_measures(
 async def get_measure(
     measure_id: int,
     include_inactive: bool = Query(False, description="Include inactive measures"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
     current_user: User = Depends(require_admin),
 ):
-    measure = get_measure_by_id(
-        db, measure_id=measure_id, include_inactive=include_inactive
+    measure = await db.run_sync(
+        get_measure_by_id, measure_id=measure_id, include_inactive=include_inactive
     )
 
     if not measure:
@@ -113,13 +115,13 @@ async def get_measure(
 @router.delete("/{measure_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_measure_endpoint(
     measure_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(require_admin),
 ):
     logger.info(f"Admin {current_user.username} is deleting measure {measure_id}")
 
     try:
-        success = delete_measure(db, measure_id=measure_id)
+        success = await db.run_sync(delete_measure, measure_id=measure_id)
 
         if not success:
             raise HTTPException(
@@ -142,10 +144,10 @@ async def delete_measure_endpoint(
 async def update_measure_endpoint(
     measure_id: int,
     data: MeasureUpdateSchema,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(require_admin),
 ):
-    measure = update_measure(db, measure_id=measure_id, data=data)
+    measure = await db.run_sync(update_measure, measure_id=measure_id, data=data)
 
     if not measure:
         raise HTTPException(
@@ -162,11 +164,13 @@ async def update_measure_endpoint(
 async def set_measure_status_endpoint(
     measure_id: int,
     status_data: MeasureStatusUpdateSchema,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(require_admin),
 ):
     try:
-        measure = set_measure_status(db, measure_id, status_data.is_active)
+        measure = await db.run_sync(
+            set_measure_status, measure_id, status_data.is_active
+        )
         logger.info(
             f"Admin {current_user.username} updated measure {measure_id} status"
         )
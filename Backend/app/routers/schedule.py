@@ -1,40 +1,61 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import APIRouter, status, Query, Depends, HTTPException
 from typing import Optional
 from datetime import date as date_type
 
 from ..dependencies import require_admin
 from ..core.logger import logger
+from ..core.serialization import ListFormat, ListSerializer, list_format
 from ..models.auth import User
-from ..schemas.relations import ScheduleMeasureCreateSchema, ScheduleMeasureOutSchema
+from ..schemas.relations import (
+    ScheduleMeasureCreateSchema,
+    ScheduleMeasureOutSchema,
+    ScheduleEmployeeBatchSchema,
+    ScheduleCustomerBatchSchema,
+    ScheduleMeasureBatchSchema,
+    ScheduleBatchAssignOutSchema,
+)
 from ..schemas.customer import CustomerOutSchema
 from ..schemas.employee import EmployeeOutSchema
 from ..schemas.schedule import (
     ScheduleOutSchema,
     ScheduleBaseSchema,
     ScheduleUpdateSchema,
+    ScheduleCopySchema,
+    ScheduleCopyOutSchema,
+    ScheduleCalendarDaySchema,
 )
-from ..core.db_setup import get_db
+from ..schemas.nested import ScheduleWithRelationsOutSchema
+from ..core.db_setup import get_async_db, get_async_read_db
 from ..core.enums import ShiftType
+from ..core.exceptions import ScheduleNotFoundError
 from ..crud.schedule import (
     get_schedules,
+    get_schedule_calendar,
     create_schedule,
     get_schedule_by_id,
+    get_schedule_with_relations,
+    get_schedule_with_relations_by_date,
     update_schedule,
     delete_schedule,
     duplicate_schedule,
+    copy_schedules,
     assign_employee_to_schedule,
+    assign_employees_to_schedule,
     remove_employee_from_schedule,
     get_schedule_employees,
     assign_customer_to_schedule,
+    assign_customers_to_schedule,
     remove_customer_from_schedule,
     get_schedule_customers,
     assign_measure_to_schedule,
+    assign_measures_to_schedule,
     remove_measure_from_schedule,
     get_schedule_measures,
 )
 
 router = APIRouter(tags=["schedules"], prefix="/schedules")
+schedule_list = ListSerializer(ScheduleOutSchema)
 
 
 @router.post(
@@ -44,11 +65,11 @@ router = APIRouter(tags=["schedules"], prefix="/schedules")
 )
 async def create_schedule_endpoint(
     data: ScheduleBaseSchema,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(require_admin),
 ):
     try:
-        new_schedule = create_schedule(db, data)
+        new_schedule = await db.run_sync(create_schedule, data)
         logger.info(
             f"New schedule {new_schedule.date} {new_schedule.shift_type} created"
         )
@@ -65,11 +86,12 @@ async def list_schedules(
     date: Optional[date_type] = Query(None, description="Filter by exact date"),
     start_date: Optional[date_type] = Query(None, description="Filter by start date"),
     end_date: Optional[date_type] = Query(None, description="Filter by end date"),
-    db: Session = Depends(get_db),
+    output: ListFormat = Depends(list_format),
+    db: AsyncSession = Depends(get_async_read_db),
     current_user: User = Depends(require_admin),
 ):
-    schedules = get_schedules(
-        db,
+    schedules = await db.run_sync(
+        get_schedules,
         skip=skip,
         limit=limit,
         shift_type=shift_type,
@@ -82,7 +104,27 @@ async def list_schedules(
         f"(skip={skip}, limit={limit}, shift_type={shift_type}, date={date}, "
         f"start_date={start_date}, end_date={end_date})"
     )
-    return schedules
+    return schedule_list.response(schedules, format=output)
+
+
+@router.get(
+    "/calendar",
+    response_model=list[ScheduleCalendarDaySchema],
+    status_code=status.HTTP_200_OK,
+)
+async def get_schedule_calendar_endpoint(
+    month: str = Query(
+        ..., pattern=r"^[1-9]\d{3}-(0[1-9]|1[0-2])$", description="Month as YYYY-MM"
+    ),
+    db: AsyncSession = Depends(get_async_read_db),
+    current_user: User = Depends(require_admin),
+):
+    year, month_number = (int(part) for part in month.split("-"))
+    days = await db.run_sync(get_schedule_calendar, year, month_number)
+    logger.info(
+        f"Admin {current_user.username} loaded calendar for {month} ({len(days)} days)"
+    )
+    return days
 
 
 @router.get(
@@ -90,10 +132,48 @@ async def list_schedules(
 )
 async def get_schedule(
     schedule_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
+    current_user: User = Depends(require_admin),
+):
+    schedule = await db.run_sync(get_schedule_by_id, schedule_id)
+    if not schedule:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Schedule with ID {schedule_id} not found",
+        )
+    return schedule
+
+
+@router.get(
+    "/by-date/{date}/full",
+    response_model=ScheduleWithRelationsOutSchema,
+    status_code=status.HTTP_200_OK,
+)
+async def get_full_schedule_by_date(
+    date: date_type,
+    db: AsyncSession = Depends(get_async_read_db),
+    current_user: User = Depends(require_admin),
+):
+    schedule = await db.run_sync(get_schedule_with_relations_by_date, date)
+    if not schedule:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Schedule for date {date} not found",
+        )
+    return schedule
+
+
+@router.get(
+    "/{schedule_id}/full",
+    response_model=ScheduleWithRelationsOutSchema,
+    status_code=status.HTTP_200_OK,
+)
+async def get_full_schedule(
+    schedule_id: int,
+    db: AsyncSession = Depends(get_async_read_db),
     current_user: User = Depends(require_admin),
 ):
-    schedule = get_schedule_by_id(db, schedule_id)
+    schedule = await db.run_sync(get_schedule_with_relations, schedule_id)
     if not schedule:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -108,10 +188,10 @@ async def get_schedule(
 async def update_schedule_endpoint(
     schedule_id: int,
     data: ScheduleUpdateSchema,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(require_admin),
 ):
-    schedule = update_schedule(db, schedule_id, data)
+    schedule = await db.run_sync(update_schedule, schedule_id, data)
     if not schedule:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -124,10 +204,10 @@ async def update_schedule_endpoint(
 @router.delete("/{schedule_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_schedule_endpoint(
     schedule_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(require_admin),
 ):
-    success = delete_schedule(db, schedule_id)
+    success = await db.run_sync(delete_schedule, schedule_id)
     if not success:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -144,12 +224,12 @@ async def delete_schedule_endpoint(
 async def duplicate_schedule_endpoint(
     source_date: date_type,
     target_date: date_type,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(require_admin),
 ):
     try:
-        new_schedule = duplicate_schedule(
-            db, source_date=source_date, target_date=target_date
+        new_schedule = await db.run_sync(
+            duplicate_schedule, source_date=source_date, target_date=target_date
         )
         logger.info(f"Duplicated schedule from {source_date} to {target_date}")
         return new_schedule
@@ -157,15 +237,65 @@ async def duplicate_schedule_endpoint(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
+@router.post(
+    "/copy",
+    response_model=ScheduleCopyOutSchema,
+    status_code=status.HTTP_201_CREATED,
+)
+async def copy_schedules_endpoint(
+    data: ScheduleCopySchema,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(require_admin),
+):
+    try:
+        result = await db.run_sync(copy_schedules, data)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    logger.info(
+        f"Admin {current_user.username} copied schedules from {data.source_start_date} "
+        f"to {data.target_start_date}: {len(result['schedules'])} schedules, "
+        f"{result['care_visits_copied']} care visits"
+    )
+    return result
+
+
+@router.post(
+    "/{schedule_id}/employees:batch",
+    response_model=ScheduleBatchAssignOutSchema,
+    status_code=status.HTTP_200_OK,
+)
+async def assign_employees_to_schedule_endpoint(
+    schedule_id: int,
+    data: ScheduleEmployeeBatchSchema,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(require_admin),
+):
+    try:
+        result = await db.run_sync(
+            assign_employees_to_schedule, schedule_id, data.employee_ids
+        )
+    except ScheduleNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    logger.info(
+        f"Admin {current_user.username} assigned {len(result['inserted'])} employees "
+        f"to schedule {schedule_id} ({len(result['already_assigned'])} already assigned)"
+    )
+    return result
+
+
 @router.post("/{schedule_id}/employees", status_code=status.HTTP_201_CREATED)
 async def assign_employee_to_schedule_endpoint(
     schedule_id: int,
     employee_id: int = Query(..., description="Employee ID to assign"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(require_admin),
 ):
     try:
-        assign_employee_to_schedule(db, schedule_id, employee_id)
+        await db.run_sync(assign_employee_to_schedule, schedule_id, employee_id)
         logger.info(
             f"Admin {current_user.username} assigned employee {employee_id} to schedule {schedule_id}"
         )
@@ -180,10 +310,10 @@ async def assign_employee_to_schedule_endpoint(
 async def remove_employee_from_schedule_endpoint(
     schedule_id: int,
     employee_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(require_admin),
 ):
-    success = remove_employee_from_schedule(db, schedule_id, employee_id)
+    success = await db.run_sync(remove_employee_from_schedule, schedule_id, employee_id)
     if not success:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -197,22 +327,49 @@ async def remove_employee_from_schedule_endpoint(
 @router.get("/{schedule_id}/employees", response_model=list[EmployeeOutSchema])
 async def get_schedule_employees_endpoint(
     schedule_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
     current_user: User = Depends(require_admin),
 ):
-    employees = get_schedule_employees(db, schedule_id)
+    employees = await db.run_sync(get_schedule_employees, schedule_id)
     return employees
 
 
+@router.post(
+    "/{schedule_id}/customers:batch",
+    response_model=ScheduleBatchAssignOutSchema,
+    status_code=status.HTTP_200_OK,
+)
+async def assign_customers_to_schedule_endpoint(
+    schedule_id: int,
+    data: ScheduleCustomerBatchSchema,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(require_admin),
+):
+    try:
+        result = await db.run_sync(
+            assign_customers_to_schedule, schedule_id, data.customer_ids
+        )
+    except ScheduleNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    logger.info(
+        f"Admin {current_user.username} assigned {len(result['inserted'])} customers "
+        f"to schedule {schedule_id} ({len(result['already_assigned'])} already assigned)"
+    )
+    return result
+
+
 @router.post("/{schedule_id}/customers", status_code=status.HTTP_201_CREATED)
 async def assign_customer_to_schedule_endpoint(
     schedule_id: int,
     customer_id: int = Query(..., description="Customer ID to assign"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(require_admin),
 ):
     try:
-        assign_customer_to_schedule(db, schedule_id, customer_id)
+        await db.run_sync(assign_customer_to_schedule, schedule_id, customer_id)
         logger.info(
             f"Admin {current_user.username} assigned customer {customer_id} to schedule {schedule_id}"
         )
@@ -227,10 +384,10 @@ async def assign_customer_to_schedule_endpoint(
 async def remove_customer_from_schedule_endpoint(
     schedule_id: int,
     customer_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(require_admin),
 ):
-    success = remove_customer_from_schedule(db, schedule_id, customer_id)
+    success = await db.run_sync(remove_customer_from_schedule, schedule_id, customer_id)
     if not success:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -244,23 +401,50 @@ async def remove_customer_from_schedule_endpoint(
 @router.get("/{schedule_id}/customers", response_model=list[CustomerOutSchema])
 async def get_schedule_customers_endpoint(
     schedule_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
     current_user: User = Depends(require_admin),
 ):
-    customers = get_schedule_customers(db, schedule_id)
+    customers = await db.run_sync(get_schedule_customers, schedule_id)
     return customers
 
 
 # Measure assignment endpoints
+@router.post(
+    "/{schedule_id}/measures:batch",
+    response_model=ScheduleBatchAssignOutSchema,
+    status_code=status.HTTP_200_OK,
+)
+async def assign_measures_to_schedule_endpoint(
+    schedule_id: int,
+    data: ScheduleMeasureBatchSchema,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(require_admin),
+):
+    try:
+        result = await db.run_sync(
+            assign_measures_to_schedule, schedule_id, data.measures
+        )
+    except ScheduleNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    logger.info(
+        f"Admin {current_user.username} assigned {len(result['inserted'])} measures "
+        f"to schedule {schedule_id} ({len(result['already_assigned'])} already assigned)"
+    )
+    return result
+
+
 @router.post("/{schedule_id}/measures", status_code=status.HTTP_201_CREATED)
 async def assign_measure_to_schedule_endpoint(
     schedule_id: int,
     data: ScheduleMeasureCreateSchema,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(require_admin),
 ):
     try:
-        assign_measure_to_schedule(db, schedule_id, data)
+        await db.run_sync(assign_measure_to_schedule, schedule_id, data)
         logger.info(
             f"Admin {current_user.username} assigned measure {data.measure_id} to schedule {schedule_id}"
         )
@@ -275,10 +459,10 @@ async def assign_measure_to_schedule_endpoint(
 async def remove_measure_from_schedule_endpoint(
     schedule_id: int,
     measure_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(require_admin),
 ):
-    success = remove_measure_from_schedule(db, schedule_id, measure_id)
+    success = await db.run_sync(remove_measure_from_schedule, schedule_id, measure_id)
     if not success:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -292,8 +476,8 @@ async def remove_measure_from_schedule_endpoint(
 @router.get("/{schedule_id}/measures", response_model=list[ScheduleMeasureOutSchema])
 async def get_schedule_measures_endpoint(
     schedule_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
     current_user: User = Depends(require_admin),
 ):
-    measures = get_schedule_measures(db, schedule_id)
+    measures = await db.run_sync(get_schedule_measures, schedule_id)
     return measures
@@ -0,0 +1,136 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import IntegrityError
+from fastapi import APIRouter, status, Query, Depends, HTTPException
+
+from ..dependencies import require_admin
+from ..core.logger import logger
+from ..core.db_setup import get_async_db, get_async_read_db
+from ..core.exceptions import (
+    ScheduleTemplateNotFoundError,
+    EmployeeNotFoundError,
+    MeasureNotFoundError,
+)
+from ..models.auth import User
+from ..schemas.schedule_template import (
+    ScheduleTemplateBaseSchema,
+    ScheduleTemplateOutSchema,
+    ScheduleTemplateApplySchema,
+    ScheduleTemplateApplyOutSchema,
+)
+from ..crud.schedule_template import (
+    create_schedule_template,
+    get_schedule_templates,
+    get_schedule_template_by_id,
+    delete_schedule_template,
+    apply_schedule_template,
+)
+
+router = APIRouter(tags=["schedule templates"], prefix="/schedule-templates")
+
+
+@router.post(
+    "/",
+    response_model=ScheduleTemplateOutSchema,
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_schedule_template_endpoint(
+    data: ScheduleTemplateBaseSchema,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(require_admin),
+):
+    try:
+        template = await db.run_sync(create_schedule_template, data)
+    except (EmployeeNotFoundError, MeasureNotFoundError) as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except IntegrityError:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT, detail="Database constraint violation"
+        )
+
+    logger.info(
+        f"Admin {current_user.username} created schedule template '{template.name}' "
+        f"({template.weeks} weeks, {len(template.shifts)} shifts)"
+    )
+    return template
+
+
+@router.get(
+    "/",
+    response_model=list[ScheduleTemplateOutSchema],
+    status_code=status.HTTP_200_OK,
+)
+async def list_schedule_templates(
+    skip: int = Query(0, ge=0, description="Number of records to skip for pagination"),
+    limit: int = Query(100, le=1000, description="Max number of records to return"),
+    db: AsyncSession = Depends(get_async_read_db),
+    current_user: User = Depends(require_admin),
+):
+    return await db.run_sync(get_schedule_templates, skip=skip, limit=limit)
+
+
+@router.get(
+    "/{template_id}",
+    response_model=ScheduleTemplateOutSchema,
+    status_code=status.HTTP_200_OK,
+)
+async def get_schedule_template(
+    template_id: int,
+    db: AsyncSession = Depends(get_async_read_db),
+    current_user: User = Depends(require_admin),
+):
+    template = await db.run_sync(get_schedule_template_by_id, template_id)
+    if not template:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Schedule template with ID {template_id} not found",
+        )
+    return template
+
+
+@router.delete("/{template_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_schedule_template_endpoint(
+    template_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(require_admin),
+):
+    success = await db.run_sync(delete_schedule_template, template_id)
+    if not success:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Schedule template with ID {template_id} not found",
+        )
+    logger.info(
+        f"Schedule template {template_id} deleted by admin {current_user.username}"
+    )
+
+
+@router.post(
+    "/{template_id}/apply",
+    response_model=ScheduleTemplateApplyOutSchema,
+    status_code=status.HTTP_201_CREATED,
+)
+async def apply_schedule_template_endpoint(
+    template_id: int,
+    data: ScheduleTemplateApplySchema,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(require_admin),
+):
+    try:
+        result = await db.run_sync(apply_schedule_template, template_id, data)
+    except ScheduleTemplateNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except IntegrityError:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT, detail="Database constraint violation"
+        )
+
+    logger.info(
+        f"Admin {current_user.username} applied schedule template {template_id} "
+        f"from {data.start_date} to {data.end_date}: "
+        f"{len(result['schedules'])} schedules created"
+    )
+    return result
@@ -1,12 +1,15 @@
 from typing import List
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import APIRouter, Depends, status, HTTPException, Query
 
 from ..dependencies import require_admin
 from ..models import User
 from ..core.enums import RoleType
-from ..core.db_setup import get_db
+from ..core.db_setup import get_db, get_async_db, get_async_read_db
 from ..core.logger import logger
+from ..core.search import SEARCH_MIN_QUERY_LENGTH
+from ..core.password_pool import password_pool
 from ..core.exceptions import UserNotFoundError
 from ..schemas.user import (
     UserOutSchema,
@@ -39,10 +42,12 @@ async def list_users(
     skip: int = Query(0, ge=0, description="Number of records to skip for pagination"),
     limit: int = Query(100, le=1000, description="Max number of records to return"),
     include_inactive: bool = Query(False, description="Include inactive users"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
     current_user: User = Depends(require_admin),
 ):
-    users = get_users(db, skip=skip, limit=limit, include_inactive=include_inactive)
+    users = await db.run_sync(
+        get_users, skip=skip, limit=limit, include_inactive=include_inactive
+    )
     logger.info(
         f"Admin {current_user.username} listed {len(users)} users "
         f"(skip={skip}, limit={limit}, include_inactive={include_inactive})"
@@ -50,14 +55,56 @@ async def list_users(
     return users
 
 
+@router.get(
+    "/search",
+    response_model=List[UserWithEmployeeOutSchema],
+    status_code=status.HTTP_200_OK,
+)
+async def search_users_endpoint(
+    q: str | None = Query(
+        None,
+        description="Email, username or employee name, at least "
+        f"{SEARCH_MIN_QUERY_LENGTH} characters",
+    ),
+    role: RoleType | None = None,
+    is_active: bool | None = None,
+    skip: int = Query(0, ge=0, description="Number of records to skip for pagination"),
+    limit: int = Query(20, ge=1, le=100, description="Max number of records to return"),
+    db: AsyncSession = Depends(get_async_read_db),
+):
+    try:
+        users = await db.run_sync(
+            search_users,
+            query=q,
+            role=role,
+            is_active=is_active,
+            skip=skip,
+            limit=limit,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    if not users:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No users found",
+        )
+
+    logger.info(f"Found {len(users)} user(s) for query='{q}'")
+
+    return [UserWithEmployeeOutSchema.from_user(user) for user in users]
+
+
 @router.get("/{user_id}", response_model=UserOutSchema, status_code=status.HTTP_200_OK)
 async def get_user(
     user_id: int,
     include_inactive: bool = Query(False, description="Include inactive users"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
     current_user: User = Depends(require_admin),
 ):
-    user = get_user_by_id(db, user_id=user_id, include_inactive=include_inactive)
+    user = await db.run_sync(
+        get_user_by_id, user_id=user_id, include_inactive=include_inactive
+    )
 
     if not user:
         raise HTTPException(
@@ -75,12 +122,12 @@ async def get_user(
 @router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_user_endpoint(
     user_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(require_admin),
 ):
     logger.info(f"Admin {current_user.username} is deleting user {user_id}")
 
-    success = delete_user(db, user_id=user_id)
+    success = await db.run_sync(delete_user, user_id=user_id)
     if not success:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -94,11 +141,11 @@ async def delete_user_endpoint(
 async def set_user_status_endpoint(
     user_id: int,
     status_data: UserStatusUpdateSchema,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(require_admin),
 ):
     try:
-        user = set_user_status(db, user_id, status_data.is_active)
+        user = await db.run_sync(set_user_status, user_id, status_data.is_active)
         logger.info(f"Admin {current_user.username} updated user {user_id} status")
         return user
     except UserNotFoundError:
@@ -116,12 +163,17 @@ async def set_user_status_endpoint(
 async def update_user_endpoint(
     user_id: int,
     update_data: EmployeeUpdateSchema,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     _current_user: User = Depends(require_admin),
 ):
-    user = update_user(db, user_id=user_id, update_data=update_data)
+    # from_user reads user.employee, so build the response inside run_sync
+    user = await db.run_sync(
+        lambda session: UserWithEmployeeOutSchema.from_user(
+            update_user(session, user_id=user_id, update_data=update_data)
+        )
+    )
     logger.info(f"Updated employee: {user.username}")
-    return UserWithEmployeeOutSchema.from_user(user)
+    return user
 
 
 @router.put("/{user_id}/change-password", status_code=status.HTTP_200_OK)
@@ -131,11 +183,8 @@ async def change_password_endpoint(
     db: Session = Depends(get_db),
     _current_user: User = Depends(require_admin),
 ):
-    success = change_password(
-        db,
-        user_id=user_id,
-        old_password=data.old_password,
-        new_password=data.new_password,
+    success = await password_pool.run(
+        change_password, db, user_id, data.old_password, data.new_password
     )
 
     if not success:
@@ -151,9 +200,9 @@ async def change_password_endpoint(
 @router.put("/request-reset-password", status_code=status.HTTP_200_OK)
 async def request_password_reset_endpoint(
     data: RequestPasswordResetSchema,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    success = request_password_reset(db, email=data.email)
+    success = await db.run_sync(request_password_reset, email=data.email)
 
     if not success:
         logger.info(f"No user with email {data.email} found")
@@ -172,7 +221,7 @@ async def reset_password_endpoint(
     data: ResetPasswordSchema,
     db: Session = Depends(get_db),
 ):
-    success = reset_password(db, token=data.token, new_password=data.new_password)
+    success = await password_pool.run(reset_password, db, data.token, data.new_password)
 
     if not success:
         raise HTTPException(
@@ -188,37 +237,13 @@ async def reset_password_endpoint(
 async def change_user_role_endpoints(
     user_id: int,
     data: ChangeRoleSchema,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(require_admin),
 ):
-    success = change_user_role(db, user_id=user_id, new_role=data.role)
+    success = await db.run_sync(change_user_role, user_id=user_id, new_role=data.role)
     if not success:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User or employee not found",
         )
     logger.info(f"Role of user {user_id} changed to {data.role}")
-
-
-@router.get(
-    "/search",
-    response_model=List[UserWithEmployeeOutSchema],
-    status_code=status.HTTP_200_OK,
-)
-async def search_users_endpoint(
-    q: str | None = None,
-    role: RoleType | None = None,
-    is_active: bool | None = None,
-    db: Session = Depends(get_db),
-):
-    users = search_users(db, query=q, role=role, is_active=is_active)
-
-    if not users:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="No users found",
-        )
-
-    logger.info(f"Found {len(users)} user(s) for query='{q}'")
-
-    return [UserWithEmployeeOutSchema.from_user(user) for user in users]
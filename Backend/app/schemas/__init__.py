@@ -7,6 +7,7 @@ from .nested import ScheduleWithRelationsOutSchema, CareVisitWithRelationsOutSch
 from .relations import (
     CustomerMeasureBaseSchema,
     CustomerMeasureCreateSchema,
+    CustomerMeasureUpdateSchema,
     CustomerMeasureOutSchema,
     ScheduleMeasureBaseSchema,
     ScheduleMeasureOutSchema,
@@ -55,6 +56,7 @@ __all__ = [
     "CareVisitWithRelationsOutSchema",
     "CustomerMeasureBaseSchema",
     "CustomerMeasureCreateSchema",
+    "CustomerMeasureUpdateSchema",
     "CustomerMeasureOutSchema",
     "ScheduleMeasureBaseSchema",
     "ScheduleMeasureOutSchema",
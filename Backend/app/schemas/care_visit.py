@@ -39,3 +39,12 @@ class CareVisitWithRelationsOutSchema(CareVisitOutSchema):
     measures: List[MeasureOutSchema] = []
     employees: List[EmployeeOutSchema] = []
     model_config = ConfigDict(from_attributes=True)
+
+
+class CareVisitGenerationOutSchema(BaseModel):
+    start_date: date_type
+    end_date: date_type
+    visits_created: int
+    measures_linked: int
+    schedules_created: int
+    skipped_existing: int
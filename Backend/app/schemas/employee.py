@@ -66,3 +66,19 @@ class EmployeeAdminCreateSchema(BaseModel):
     is_summer_worker: Optional[bool] = False
     start_date: Optional[date] = None
     end_date: Optional[date] = None
+
+
+class EmployeeAvailabilityRowSchema(BaseModel):
+    employee_id: int
+    user_id: int
+    first_name: Optional[str] = None
+    last_name: Optional[str] = None
+    available: str  # one character per day, "1" = employed and not absent
+    assigned: str  # one character per day, "1" = already on that day's schedule
+
+
+class EmployeeAvailabilityOutSchema(BaseModel):
+    start_date: date
+    end_date: date
+    days: int
+    employees: list[EmployeeAvailabilityRowSchema]
@@ -1,22 +1,57 @@
-from pydantic import ConfigDict
+from pydantic import ConfigDict, field_validator
 from .schedule import ScheduleOutSchema
 from .care_visit import CareVisitOutSchema
 from .employee import EmployeeOutSchema
 from .customer import CustomerOutSchema
 from .measure import MeasureOutSchema
+from .relations import ScheduleMeasureOutSchema
 from typing import List
 
 
+def _unwrap(items, attribute: str):
+    """Association rows (e.g. ScheduleEmployee) -> the entity they point to"""
+    return [getattr(item, attribute, item) for item in items or []]
+
+
+class ScheduleMeasureWithMeasureOutSchema(ScheduleMeasureOutSchema):
+    measure: MeasureOutSchema
+    model_config = ConfigDict(from_attributes=True)
+
+
+class CareVisitWithMeasuresOutSchema(CareVisitOutSchema):
+    measures: List[MeasureOutSchema] = []
+    employees: List[EmployeeOutSchema] = []
+    model_config = ConfigDict(from_attributes=True)
+
+    @field_validator("measures", mode="before")
+    @classmethod
+    def unwrap_measures(cls, value):
+        return _unwrap(value, "measure")
+
+    @field_validator("employees", mode="before")
+    @classmethod
+    def unwrap_employees(cls, value):
+        return _unwrap(value, "employee")
+
+
 class ScheduleWithRelationsOutSchema(ScheduleOutSchema):
     employees: List[EmployeeOutSchema] = []
     customers: List[CustomerOutSchema] = []
-    measures: List[MeasureOutSchema] = []
-    care_visits: List[CareVisitOutSchema] = []
+    measures: List[ScheduleMeasureWithMeasureOutSchema] = []
+    care_visits: List[CareVisitWithMeasuresOutSchema] = []
     model_config = ConfigDict(from_attributes=True)
 
+    @field_validator("employees", mode="before")
+    @classmethod
+    def unwrap_employees(cls, value):
+        return _unwrap(value, "employee")
 
-class CareVisitWithRelationsOutSchema(CareVisitOutSchema):
+    @field_validator("customers", mode="before")
+    @classmethod
+    def unwrap_customers(cls, value):
+        return _unwrap(value, "customer")
+
+
+class CareVisitWithRelationsOutSchema(CareVisitWithMeasuresOutSchema):
     schedule: ScheduleOutSchema
-    measures: List[MeasureOutSchema] = []
-    employees: List[EmployeeOutSchema] = []
     model_config = ConfigDict(from_attributes=True)
@@ -1,7 +1,24 @@
-from pydantic import BaseModel, ConfigDict
+from pydantic import AfterValidator, BaseModel, ConfigDict, field_validator
 from datetime import datetime
 from ..core.enums import TimeFlexibility, TimeOfDay
-from typing import Optional, List
+from ..services.visit_planner import parse_days_of_week, parse_frequency
+from typing import Annotated, Optional, List
+
+
+def _plannable_frequency(value: str) -> str:
+    parse_frequency(value)
+    return value
+
+
+def _plannable_days_of_week(value: List[str]) -> List[str]:
+    parse_days_of_week(value)
+    return value
+
+
+# Plan fields the visit planner has to be able to expand, e.g. "weekly" and
+# ["monday", "Thu"]; anything else is rejected before it is stored
+PlanFrequency = Annotated[str, AfterValidator(_plannable_frequency)]
+PlanDaysOfWeek = Annotated[List[str], AfterValidator(_plannable_days_of_week)]
 
 
 class CustomerMeasureBaseSchema(BaseModel):
@@ -20,8 +37,8 @@ class CustomerMeasureBaseSchema(BaseModel):
 class CustomerMeasureCreateSchema(BaseModel):
     measure_id: int
     customer_duration: Optional[int] = None
-    frequency: str
-    days_of_week: Optional[List[str]] = None
+    frequency: PlanFrequency
+    days_of_week: Optional[PlanDaysOfWeek] = None
     occurrences_per_week: Optional[int] = None
     customer_notes: Optional[str] = None
     customer_time_of_day: Optional[TimeOfDay] = None
@@ -29,6 +46,26 @@ class CustomerMeasureCreateSchema(BaseModel):
     schedule_info: Optional[str] = None
 
 
+class CustomerMeasureUpdateSchema(BaseModel):
+    measure_id: Optional[int] = None
+    customer_duration: Optional[int] = None
+    frequency: Optional[PlanFrequency] = None
+    days_of_week: Optional[PlanDaysOfWeek] = None
+    occurrences_per_week: Optional[int] = None
+    customer_notes: Optional[str] = None
+    customer_time_of_day: Optional[TimeOfDay] = None
+    customer_time_flexibility: Optional[TimeFlexibility] = None
+    schedule_info: Optional[str] = None
+
+    @field_validator("measure_id", "frequency")
+    @classmethod
+    def not_null(cls, value):
+        # May be left out, but the columns can't be cleared
+        if value is None:
+            raise ValueError("Cannot be null")
+        return value
+
+
 class CustomerMeasureOutSchema(CustomerMeasureBaseSchema):
     id: int
     created: datetime
@@ -63,6 +100,10 @@ class ScheduleMeasureCreateSchema(BaseModel):
     notes: str | None = None
 
 
+class ScheduleMeasureBatchSchema(BaseModel):
+    measures: List[ScheduleMeasureCreateSchema]
+
+
 class ScheduleCustomerBaseSchema(BaseModel):
     schedule_id: int
     customer_id: int
@@ -81,6 +122,19 @@ class ScheduleEmployeeOutSchema(ScheduleEmployeeBaseSchema):
     model_config = ConfigDict(from_attributes=True)
 
 
+class ScheduleCustomerBatchSchema(BaseModel):
+    customer_ids: List[int]
+
+
+class ScheduleEmployeeBatchSchema(BaseModel):
+    employee_ids: List[int]
+
+
+class ScheduleBatchAssignOutSchema(BaseModel):
+    inserted: List[int]
+    already_assigned: List[int]
+
+
 class MeasureCareVisitBaseSchema(BaseModel):
     measure_id: int
     care_visit_id: int
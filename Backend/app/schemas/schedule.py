@@ -1,7 +1,7 @@
 from pydantic import BaseModel, ConfigDict, model_validator
-from datetime import datetime
+from datetime import datetime, date
 from typing import Optional
-from ..core.enums import ShiftType
+from ..core.enums import ShiftType, VisitStatus
 
 
 class ScheduleBaseSchema(BaseModel):
@@ -38,3 +38,29 @@ class ScheduleOutSchema(BaseModel):
     created: datetime
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class ScheduleCopySchema(BaseModel):
+    source_start_date: date
+    source_end_date: Optional[date] = None
+    target_start_date: date
+    target_end_date: Optional[date] = None
+    include_care_visits: bool = True
+    skip_absent_employees: bool = False
+
+
+class ScheduleCopyOutSchema(BaseModel):
+    schedules: list[ScheduleOutSchema]
+    employees_copied: int
+    employees_skipped: int
+    customers_copied: int
+    measures_copied: int
+    care_visits_copied: int
+
+
+class ScheduleCalendarDaySchema(ScheduleOutSchema):
+    employee_count: int
+    customer_count: int
+    measure_count: int
+    visit_count: int
+    visits_by_status: dict[VisitStatus, int]
@@ -0,0 +1,91 @@
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+from datetime import datetime, date
+from typing import Optional
+from ..core.enums import ShiftType
+from .relations import ScheduleMeasureCreateSchema
+from .schedule import ScheduleOutSchema
+
+
+class ScheduleTemplateShiftSchema(BaseModel):
+    week_offset: int = Field(0, ge=0)
+    weekday: int = Field(..., ge=0, le=6, description="0 = Monday, 6 = Sunday")
+    shift_type: Optional[ShiftType] = None
+    custom_shift: Optional[str] = None
+    employee_ids: list[int] = []
+    measures: list[ScheduleMeasureCreateSchema] = []
+
+    @model_validator(mode="after")
+    def validate_shift(cls, values):
+        if not values.shift_type and not values.custom_shift:
+            raise ValueError("Either shift_type or custom_shift must be provided")
+        if values.shift_type and values.custom_shift:
+            raise ValueError("Only one of shift_type or custom_shift can be set")
+        measure_ids = [measure.measure_id for measure in values.measures]
+        if len(measure_ids) != len(set(measure_ids)):
+            raise ValueError("A measure can only be added once per shift")
+        return values
+
+
+class ScheduleTemplateBaseSchema(BaseModel):
+    name: str
+    weeks: int = Field(1, ge=1, le=12, description="Length of the rotation in weeks")
+    shifts: list[ScheduleTemplateShiftSchema] = []
+
+    @model_validator(mode="after")
+    def validate_shifts(cls, values):
+        slots = set()
+        for shift in values.shifts:
+            if shift.week_offset >= values.weeks:
+                raise ValueError(
+                    f"week_offset {shift.week_offset} is outside a {values.weeks} week rotation"
+                )
+            slot = (shift.week_offset, shift.weekday)
+            if slot in slots:
+                raise ValueError(
+                    f"Duplicate shift for week_offset {shift.week_offset}, weekday {shift.weekday}"
+                )
+            slots.add(slot)
+        return values
+
+
+class ScheduleTemplateMeasureOutSchema(ScheduleMeasureCreateSchema):
+    id: int
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ScheduleTemplateShiftOutSchema(BaseModel):
+    id: int
+    week_offset: int
+    weekday: int
+    shift_type: Optional[ShiftType] = None
+    custom_shift: Optional[str] = None
+    employee_ids: list[int] = []
+    measures: list[ScheduleTemplateMeasureOutSchema] = []
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ScheduleTemplateOutSchema(BaseModel):
+    id: int
+    name: str
+    weeks: int
+    shifts: list[ScheduleTemplateShiftOutSchema] = []
+    created: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ScheduleTemplateApplySchema(BaseModel):
+    start_date: date
+    end_date: date
+    rotation_start_date: Optional[date] = Field(
+        None,
+        description="Any day in the week the rotation starts (week_offset 0). Defaults to start_date",
+    )
+
+
+class ScheduleTemplateApplyOutSchema(BaseModel):
+    schedules: list[ScheduleOutSchema]
+    employees_assigned: int
+    measures_assigned: int
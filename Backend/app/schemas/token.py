@@ -8,3 +8,7 @@ class Token(BaseModel):
 
 class TokenData(BaseModel):
     username: str | None = None
+
+
+class RefreshTokenSchema(BaseModel):
+    refresh_token: str
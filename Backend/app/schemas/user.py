@@ -1,5 +1,7 @@
+import csv
+import io
 from pydantic import BaseModel, Field, EmailStr, ConfigDict
-from ..core.enums import Gender, RoleType
+from ..core.enums import Gender, InviteStatus, RoleType
 from datetime import datetime, date
 from typing import Optional
 
@@ -9,6 +11,34 @@ class UserInviteSchema(BaseModel):
     is_superuser: bool = False
 
 
+class UserInviteBatchSchema(BaseModel):
+    # Plain strings: each address is validated on its own and reported back,
+    # so one typo doesn't reject the whole batch
+    emails: list[str] = Field(..., min_length=1, max_length=500)
+    is_superuser: bool = False
+
+    @classmethod
+    def from_csv(cls, text: str) -> "UserInviteBatchSchema":
+        """Emails from the first column; a leading "email" header is skipped"""
+        emails = [
+            row[0].strip() for row in csv.reader(io.StringIO(text)) if row and row[0]
+        ]
+        emails = [email for email in emails if email]
+        if emails and emails[0].lower() == "email":
+            emails = emails[1:]
+        return cls(emails=emails)
+
+
+class UserInviteResultSchema(BaseModel):
+    email: str
+    status: InviteStatus
+
+
+class UserInviteBatchOutSchema(BaseModel):
+    invited: int
+    results: list[UserInviteResultSchema]
+
+
 class UserRegisterSchema(BaseModel):
     username: str = Field(..., min_length=3, max_length=20)
     password: str = Field(..., min_length=8)
@@ -42,6 +72,7 @@ class UserOutSchema(BaseModel):
     registration_completed: bool
     created: datetime
     updated: datetime
+    last_seen: Optional[datetime] = None
     model_config = ConfigDict(from_attributes=True)
 
 
@@ -65,6 +96,7 @@ class UserWithEmployeeOutSchema(UserOutSchema):
             "registration_completed": user.registration_completed,
             "created": user.created,
             "updated": user.updated,
+            "last_seen": user.last_seen,
         }
 
         if user.employee:
@@ -85,6 +117,7 @@ class UserWithEmployeeOutSchema(UserOutSchema):
 class UserLoginSchema(BaseModel):
     username: str
     password: str
+    client_id: Optional[str] = Field(default=None, max_length=64)
 
 
 class ChangePasswordSchema(BaseModel):
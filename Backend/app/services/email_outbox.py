@@ -0,0 +1,77 @@
+import asyncio
+import smtplib
+from sqlalchemy.orm import Session
+
+from ..core.db_setup import SessionLocal
+from ..core.logger import logger
+from ..core.settings import settings
+from ..crud.email_outbox import claim_outbox_batch, mark_email_failed, mark_email_sent
+from .email_service import SmtpSender, smtp_sender
+
+# Longest wait between delivery attempts while SMTP or the database is down
+MAX_BACKOFF_SECONDS = 300
+
+
+def deliver_outbox(db: Session, sender: SmtpSender) -> int:
+    """
+    Send one batch of due emails over the sender's connection; returns the
+    number claimed. An email the server rejects is retried later with
+    backoff. A broken connection counts against the email being sent, ends
+    the batch and is raised, so the caller backs off; when the connection
+    can't be opened at all, no email is charged an attempt.
+    """
+    emails = claim_outbox_batch(db, settings.EMAIL_BATCH_SIZE)
+    if not emails:
+        db.commit()
+        return 0
+
+    retry = (settings.EMAIL_MAX_ATTEMPTS, settings.EMAIL_RETRY_BASE_SECONDS)
+    current = None
+    try:
+        sender.open()
+        for current in emails:
+            try:
+                sender.send(current)
+            except (smtplib.SMTPResponseException, smtplib.SMTPRecipientsRefused) as e:
+                mark_email_failed(current, str(e), *retry)
+            else:
+                mark_email_sent(current)
+    except OSError as e:
+        sender.close()
+        if current is not None:
+            mark_email_failed(current, str(e), *retry)
+        raise
+    finally:
+        db.commit()
+    return len(emails)
+
+
+def run_outbox_delivery() -> int:
+    with SessionLocal() as db:
+        return deliver_outbox(db, smtp_sender)
+
+
+async def deliver_outbox_periodically() -> None:
+    """
+    Drain the outbox until cancelled: full batches are followed straight
+    away by the next one, otherwise the worker waits EMAIL_OUTBOX_POLL_SECONDS.
+    Failures back off exponentially, up to MAX_BACKOFF_SECONDS. When
+    cancelled mid-batch, the batch is finished first.
+    """
+    poll = settings.EMAIL_OUTBOX_POLL_SECONDS
+    delay = poll
+    while True:
+        await asyncio.sleep(delay)
+        delivery = asyncio.ensure_future(asyncio.to_thread(run_outbox_delivery))
+        try:
+            claimed = await asyncio.shield(delivery)
+        except asyncio.CancelledError:
+            # Cancelling doesn't stop the thread; let the batch in flight
+            # finish before shutdown closes the shared SMTP connection
+            await asyncio.gather(delivery, return_exceptions=True)
+            raise
+        except Exception as e:
+            delay = min(max(delay, poll) * 2, MAX_BACKOFF_SECONDS)
+            logger.error(f"❌ Email outbox delivery failed, retrying in {delay}s: {e}")
+            continue
+        delay = 0 if claimed >= settings.EMAIL_BATCH_SIZE else poll
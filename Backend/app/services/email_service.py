@@ -1,28 +1,75 @@
-from fastapi_mail import FastMail, MessageSchema, ConnectionConfig, MessageType
+import smtplib
+import ssl
+from email.message import EmailMessage
+from typing import Optional
 from ..core.settings import settings
+from ..models import EmailOutbox
 
 
-class EmailService:
+def invitation_email(token: str) -> tuple[str, str]:
+    """Subject and body of the registration invitation"""
+    return (
+        "Timepiece invitation",
+        f"Registration link: {settings.BASE_URL}/register?token={token}",
+    )
+
+
+class SmtpSender:
+    """
+    Sends outbox emails over one SMTP connection that is kept open between
+    batches. The connection is checked with NOOP at the start of a batch and
+    reopened when the server has dropped it.
+    """
+
     def __init__(self):
-        self.conf = ConnectionConfig(
-            MAIL_USERNAME=settings.SMTP_USERNAME,
-            MAIL_PASSWORD=settings.SMTP_PASSWORD,
-            MAIL_FROM=settings.SMTP_FROM,
-            MAIL_PORT=settings.SMTP_PORT,
-            MAIL_SERVER=settings.SMTP_SERVER,
-            MAIL_STARTTLS=True,
-            MAIL_SSL_TLS=False,
-            USE_CREDENTIALS=True,
-            VALIDATE_CERTS=True,
-        )
+        self._smtp: Optional[smtplib.SMTP] = None
 
-    async def send_invitation_email(self, to_email: str, token: str):
-        message = MessageSchema(
-            subject="Timepiece invitation",
-            recipients=[to_email],
-            body=f"Registration link: {settings.BASE_URL}/register?token={token}",
-            subtype=MessageType.html,
+    def _connect(self) -> smtplib.SMTP:
+        smtp = smtplib.SMTP(
+            settings.SMTP_SERVER,
+            settings.SMTP_PORT,
+            timeout=settings.SMTP_TIMEOUT_SECONDS,
         )
+        try:
+            if settings.SMTP_STARTTLS:
+                smtp.starttls(context=ssl.create_default_context())
+            if settings.SMTP_USE_CREDENTIALS:
+                smtp.login(
+                    settings.SMTP_USERNAME, settings.SMTP_PASSWORD.get_secret_value()
+                )
+        except Exception:
+            smtp.close()
+            raise
+        return smtp
+
+    def open(self) -> None:
+        if self._smtp is not None:
+            try:
+                if self._smtp.noop()[0] == 250:
+                    return
+            except OSError:
+                pass
+            self.close()
+        self._smtp = self._connect()
+
+    def send(self, email: EmailOutbox) -> None:
+        if self._smtp is None:
+            self.open()
+        message = EmailMessage()
+        message["From"] = settings.SMTP_FROM
+        message["To"] = email.recipient
+        message["Subject"] = email.subject
+        message.set_content(email.body, subtype=email.subtype)
+        self._smtp.send_message(message)  # type: ignore[union-attr]
+
+    def close(self) -> None:
+        if self._smtp is None:
+            return
+        try:
+            self._smtp.quit()
+        except OSError:
+            self._smtp.close()
+        self._smtp = None
+
 
-        fm = FastMail(self.conf)
-        await fm.send_message(message)
+smtp_sender = SmtpSender()
@@ -0,0 +1,36 @@
+import asyncio
+
+from ..core.db_setup import SessionLocal
+from ..core.last_seen import last_seen
+from ..core.logger import logger
+from ..crud.user import record_last_seen
+
+# How often the flusher checks whether the buffer is due
+POLL_SECONDS = 1
+
+
+def flush_last_seen() -> int:
+    """Write everything buffered; returns the number of entries written"""
+    users, tokens = last_seen.drain()
+    if not users and not tokens:
+        return 0
+
+    try:
+        with SessionLocal() as db:
+            record_last_seen(db, users, tokens)
+    except Exception:
+        last_seen.merge(users, tokens)
+        raise
+    return len(users) + len(tokens)
+
+
+async def flush_last_seen_periodically() -> None:
+    """Flush the last-seen buffer whenever it is due, until cancelled"""
+    while True:
+        await asyncio.sleep(POLL_SECONDS)
+        if not last_seen.is_due():
+            continue
+        try:
+            await asyncio.to_thread(flush_last_seen)
+        except Exception as e:
+            logger.error(f"❌ Flushing last-seen times failed: {e}")
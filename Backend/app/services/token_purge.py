@@ -0,0 +1,23 @@
+import asyncio
+
+from ..core.db_setup import SessionLocal
+from ..core.logger import logger
+from ..core.settings import settings
+from ..crud.user import purge_expired_tokens
+
+
+def run_token_purge() -> int:
+    with SessionLocal() as db:
+        return purge_expired_tokens(db, batch_size=settings.TOKEN_PURGE_BATCH_SIZE)
+
+
+async def purge_tokens_periodically(interval_seconds: int) -> None:
+    """Purge expired tokens every interval_seconds until cancelled"""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            purged = await asyncio.to_thread(run_token_purge)
+            if purged:
+                logger.info(f"Purged {purged} expired tokens")
+        except Exception as e:
+            logger.error(f"❌ Token purge failed: {e}")
@@ -0,0 +1,89 @@
+import calendar
+from datetime import date, timedelta
+
+
+WEEKDAYS = {
+    "monday": 0,
+    "tuesday": 1,
+    "wednesday": 2,
+    "thursday": 3,
+    "friday": 4,
+    "saturday": 5,
+    "sunday": 6,
+}
+FREQUENCIES = ("DAILY", "WEEKLY", "MONTHLY")
+
+
+def parse_frequency(frequency: str) -> str:
+    """Normalise a plan frequency (e.g. "weekly") to one of FREQUENCIES"""
+    name = frequency.strip().upper()
+    if name not in FREQUENCIES:
+        raise ValueError(f"Unknown frequency: {frequency}")
+    return name
+
+
+def parse_days_of_week(days_of_week: list[str] | None) -> set[int]:
+    """Translate day names (e.g. ["monday", "Thu"]) to weekday numbers"""
+    result: set[int] = set()
+    for day in days_of_week or []:
+        name = day.strip().lower()
+        for full_name, weekday in WEEKDAYS.items():
+            if len(name) >= 3 and full_name.startswith(name):
+                result.add(weekday)
+                break
+        else:
+            raise ValueError(f"Unknown day of week: {day}")
+    return result
+
+
+def _spread(count: int, length: int) -> set[int]:
+    """Spread `count` occurrences evenly over `length` slots"""
+    count = max(1, min(count, length))
+    return {i * length // count for i in range(count)}
+
+
+def expand_occurrences(
+    frequency: str,
+    days_of_week: list[str] | None,
+    occurrences_per_week: int | None,
+    start_date: date,
+    end_date: date,
+) -> list[date]:
+    """
+    Expand a customer measure plan into the dates it occurs on within
+    [start_date, end_date].
+
+    - DAILY: every day, or only the given days_of_week
+    - WEEKLY: the given days_of_week, otherwise occurrences_per_week
+      spread evenly from Monday
+    - MONTHLY: occurrences_per_week is read as occurrences per month,
+      spread evenly from the first of the month
+    """
+    if start_date > end_date:
+        raise ValueError("Start date cannot be after end date")
+
+    frequency = parse_frequency(frequency)
+    weekdays = parse_days_of_week(days_of_week)
+    occurrences = occurrences_per_week or 1
+
+    if frequency == "DAILY":
+        weekdays = weekdays or set(range(7))
+    elif frequency == "WEEKLY":
+        weekdays = weekdays or _spread(occurrences, 7)
+
+    dates = []
+    month_days: dict[tuple[int, int], set[int]] = {}
+    current = start_date
+    while current <= end_date:
+        if frequency == "MONTHLY":
+            key = (current.year, current.month)
+            if key not in month_days:
+                days_in_month = calendar.monthrange(*key)[1]
+                month_days[key] = _spread(occurrences, days_in_month)
+            if current.day - 1 in month_days[key]:
+                dates.append(current)
+        elif current.weekday() in weekdays:
+            dates.append(current)
+        current += timedelta(days=1)
+
+    return dates
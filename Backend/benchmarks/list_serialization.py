@@ -0,0 +1,76 @@
+"""
+Serialization cost of a 1,000-row care visit page: FastAPI's response_model
+path against the precompiled ListSerializer. No database is needed.
+
+    uv run python -m Backend.benchmarks.list_serialization
+"""
+
+import asyncio
+import json
+import timeit
+from datetime import date, datetime, timedelta
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from Backend.app.core.serialization import ListSerializer
+from Backend.app.models import CareVisit
+from Backend.app.schemas.care_visit import CareVisitOutSchema
+
+ROWS = 1000
+REPEAT = 7
+NUMBER = 20
+
+
+def page() -> list[CareVisit]:
+    start = date(2025, 1, 1)
+    return [
+        CareVisit(
+            id=i,
+            date=start + timedelta(days=i // 50),
+            status="planned",
+            duration=30,
+            notes=None if i % 2 else "Ring the bell twice",
+            schedule_id=1 + i // 50,
+            customer_id=1 + i % 50,
+            created=datetime(2024, 12, 1, 8, 30),
+        )
+        for i in range(ROWS)
+    ]
+
+
+def main() -> None:
+    rows = page()
+    loop = asyncio.new_event_loop()
+    field = create_model_field(
+        name="response", type_=list[CareVisitOutSchema], mode="serialization"
+    )
+    serializer = ListSerializer(CareVisitOutSchema)
+
+    def response_model() -> bytes:
+        content = loop.run_until_complete(
+            serialize_response(field=field, response_content=rows, is_coroutine=True)
+        )
+        return JSONResponse(content).body
+
+    def list_serializer() -> bytes:
+        return serializer.response(rows).body
+
+    # Same document either way, only the bytes may differ in whitespace
+    assert json.loads(response_model()) == json.loads(list_serializer())
+    results = {}
+    for name, func in (
+        ("response_model", response_model),
+        ("ListSerializer", list_serializer),
+    ):
+        best = min(timeit.repeat(func, number=NUMBER, repeat=REPEAT)) / NUMBER
+        results[name] = best
+        print(f"{name:>15}: {best * 1000:6.2f} ms per {ROWS}-row page")
+    speedup = results["response_model"] / results["ListSerializer"]
+    print(f"{'speedup':>15}: {speedup:6.2f}x")
+    loop.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,11 @@
 import pytest
+from fastapi import Request
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 from Backend.app.core.base import Base
+from Backend.app.core.db_setup import async_url, track_writes
 from Backend.app.core.settings import settings
 
 
@@ -18,3 +22,32 @@ def db():
 
     session.close()
     Base.metadata.drop_all(engine)
+
+
+@pytest.fixture
+def async_engine(db):
+    # NullPool: every TestClient / asyncio.run() has its own event loop
+    return create_async_engine(
+        async_url(settings.DATABASE_URL_TEST), poolclass=NullPool
+    )
+
+
+@pytest.fixture
+def override_get_async_db(async_engine):
+    async def _get_async_db_override(request: Request):
+        async with AsyncSession(async_engine, expire_on_commit=False) as session:
+            track_writes(session, request)
+            yield session
+
+    return _get_async_db_override
+
+
+@pytest.fixture
+def override_get_async_read_db(async_engine):
+    read_engine = async_engine.execution_options(postgresql_readonly=True)
+
+    async def _get_async_read_db_override():
+        async with AsyncSession(read_engine, expire_on_commit=False) as session:
+            yield session
+
+    return _get_async_read_db_override
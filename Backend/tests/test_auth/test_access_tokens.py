@@ -0,0 +1,94 @@
+import pytest
+from fastapi.testclient import TestClient
+from Backend.app.main import app
+from Backend.app.core.db_setup import get_db, get_async_db, get_async_read_db
+from Backend.app.core.settings import settings
+from Backend.app.core.security import get_password_hash
+from Backend.app.core.token_cache import revocation_list
+from Backend.app.core.enums import RoleType
+from Backend.app.models import User, Employee
+
+
+@pytest.fixture
+def jwt_client(db, override_get_async_db, override_get_async_read_db, monkeypatch):
+    monkeypatch.setattr(settings, "TOKEN_MODE", "jwt")
+    revocation_list.clear()
+
+    def _get_db_override():
+        yield db
+
+    app.dependency_overrides[get_db] = _get_db_override
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    app.dependency_overrides[get_async_read_db] = override_get_async_read_db
+    with TestClient(app) as c:
+        yield c
+    app.dependency_overrides.clear()
+    revocation_list.clear()
+
+
+@pytest.fixture
+def admin(db):
+    user = User(
+        email="jwtadmin@example.com",
+        username="jwtadmin",
+        hashed_password=get_password_hash("secret123"),
+        is_active=True,
+        registration_completed=True,
+        employee=Employee(role=RoleType.ADMIN),
+    )
+    db.add(user)
+    db.commit()
+    return user
+
+
+def _login(client):
+    response = client.post(
+        "/auth/login", json={"username": "jwtadmin", "password": "secret123"}
+    )
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_signed_token_authenticates_and_refreshes(jwt_client, admin):
+    tokens = _login(jwt_client)
+    assert tokens["access_token"].count(".") == 2
+    assert tokens["refresh_token"]
+
+    headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+    assert jwt_client.get("/users/", headers=headers).status_code == 200
+
+    refreshed = jwt_client.post(
+        "/auth/refresh", json={"refresh_token": tokens["refresh_token"]}
+    )
+    assert refreshed.status_code == 200
+    headers = {"Authorization": f"Bearer {refreshed.json()['access_token']}"}
+    assert jwt_client.get("/users/", headers=headers).status_code == 200
+
+
+def test_logout_revokes_signed_token_and_refresh_token(jwt_client, admin):
+    tokens = _login(jwt_client)
+    headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+
+    assert jwt_client.delete("/auth/logout", headers=headers).status_code == 204
+
+    response = jwt_client.get("/users/", headers=headers)
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Token has been revoked"
+
+    # Another process only sees the revocation through the table
+    revocation_list.clear()
+    assert jwt_client.get("/users/", headers=headers).status_code == 401
+
+    response = jwt_client.post(
+        "/auth/refresh", json={"refresh_token": tokens["refresh_token"]}
+    )
+    assert response.status_code == 401
+
+
+def test_tampered_signed_token_is_rejected(jwt_client, admin):
+    tokens = _login(jwt_client)
+    header, payload, signature = tokens["access_token"].split(".")
+    forged = f"{header}.{payload}.{signature[::-1]}"
+
+    response = jwt_client.get("/users/", headers={"Authorization": f"Bearer {forged}"})
+    assert response.status_code == 401
@@ -0,0 +1,92 @@
+import asyncio
+from sqlalchemy.ext.asyncio import AsyncSession
+import datetime
+from Backend.app.core.last_seen import LastSeenBuffer, last_seen
+from Backend.app.core.security import get_current_user, create_database_token
+from Backend.app.core.token_cache import token_cache
+from Backend.app.crud.user import record_last_seen
+from Backend.app.models import User, Token
+
+
+def _current_user(async_engine, token_str):
+    async def _load():
+        async with AsyncSession(async_engine, expire_on_commit=False) as session:
+            return await get_current_user(token_str, session)
+
+    return asyncio.run(_load())
+
+
+def test_buffer_is_due_by_size_or_age():
+    buffer = LastSeenBuffer(flush_seconds=3600, max_entries=3)
+    assert not buffer.is_due()
+
+    buffer.touch(1, 10)
+    buffer.touch(1, 10)
+    assert len(buffer) == 2
+    assert not buffer.is_due()
+
+    buffer.touch(2)
+    assert buffer.is_due()
+
+    users, tokens = buffer.drain()
+    assert set(users) == {1, 2}
+    assert set(tokens) == {10}
+    assert len(buffer) == 0
+
+    buffer.flush_seconds = 0
+    buffer.touch(3)
+    assert buffer.is_due()
+
+
+def test_failed_flush_is_merged_back_keeping_newest():
+    buffer = LastSeenBuffer(flush_seconds=60, max_entries=100)
+    old = datetime.datetime(2025, 1, 1)
+    buffer.touch(1, 10)
+    users, tokens = buffer.drain()
+
+    buffer.merge({1: old, 2: old}, {10: old})
+    users, tokens = buffer.drain()
+    assert users[1] == old
+    buffer.merge(users, tokens)
+
+    buffer.touch(1, 10)
+    users, tokens = buffer.drain()
+    assert users[1] > old
+    assert users[2] == old
+    assert tokens[10] > old
+
+
+def test_authentication_records_last_seen_without_writing(db, async_engine):
+    token_cache.clear()
+    last_seen.drain()
+    user = User(email="seen@example.com", is_active=True)
+    db.add(user)
+    db.commit()
+    token = create_database_token(user.id, db)
+
+    _current_user(async_engine, token.token)
+    asyncio.run(get_current_user(token.token, None))
+    assert db.get(User, user.id).last_seen is None
+
+    users, tokens = last_seen.drain()
+    assert set(users) == {user.id}
+    assert set(tokens) == {token.id}
+    token_cache.clear()
+
+
+def test_record_last_seen_keeps_newer_times(db):
+    user = User(email="seen@example.com")
+    db.add(user)
+    db.commit()
+    token = create_database_token(user.id, db)
+    updated = user.updated
+    early = datetime.datetime(2025, 3, 3, 8, 0)
+    late = datetime.datetime(2025, 3, 3, 9, 0)
+
+    record_last_seen(db, {user.id: late}, {token.id: late})
+    record_last_seen(db, {user.id: early}, {token.id: early})
+    db.expire_all()
+
+    assert db.get(User, user.id).last_seen == late
+    assert db.get(User, user.id).updated == updated
+    assert db.get(Token, token.id).last_seen == late
@@ -0,0 +1,56 @@
+import asyncio
+import threading
+from Backend.app.core.password_pool import PasswordPool
+from Backend.app.core.security import get_password_hash, verify_password
+
+
+def test_pool_caps_concurrency_and_reports_queue_depth():
+    pool = PasswordPool(max_workers=1)
+    release = threading.Event()
+
+    async def scenario():
+        tasks = [asyncio.create_task(pool.run(release.wait, 5)) for _ in range(3)]
+        while pool.stats()["running"] == 0:
+            await asyncio.sleep(0.01)
+        busy = pool.stats()
+        release.set()
+        await asyncio.gather(*tasks)
+        return busy
+
+    busy = asyncio.run(scenario())
+    assert busy["running"] == 1
+    assert busy["queued"] == 2
+    assert pool.stats() == {
+        "max_workers": 1,
+        "running": 0,
+        "queued": 0,
+        "completed": 3,
+    }
+    pool.shutdown()
+
+
+def test_hashing_does_not_block_event_loop():
+    pool = PasswordPool(max_workers=2)
+    hashed = get_password_hash("secret123")
+
+    async def scenario():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.005)
+
+        ticking = asyncio.create_task(ticker())
+        results = await asyncio.gather(
+            pool.run(verify_password, "secret123", hashed),
+            pool.run(verify_password, "wrong", hashed),
+        )
+        ticking.cancel()
+        return results, ticks
+
+    results, ticks = asyncio.run(scenario())
+    assert results == [True, False]
+    assert ticks > 1
+    pool.shutdown()
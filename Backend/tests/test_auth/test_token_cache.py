@@ -0,0 +1,96 @@
+import asyncio
+from sqlalchemy.ext.asyncio import AsyncSession
+import pytest
+from datetime import datetime, timedelta, UTC
+from Backend.app.core.security import get_current_user, create_database_token
+from Backend.app.core.token_cache import TokenCache, CachedPrincipal, token_cache
+from Backend.app.core.enums import RoleType
+from Backend.app.crud.user import change_user_role, logout_user
+from Backend.app.models import User, Employee
+
+
+def _principal(user_id, expire_date=None):
+    return CachedPrincipal(
+        user_id=user_id,
+        username=f"user{user_id}",
+        email=f"user{user_id}@example.com",
+        is_superuser=False,
+        is_active=True,
+        employee_id=user_id,
+        role="admin",
+        expire_date=expire_date or datetime.now(UTC) + timedelta(hours=1),
+    )
+
+
+@pytest.fixture(autouse=True)
+def empty_token_cache():
+    token_cache.clear()
+    yield
+    token_cache.clear()
+
+
+def _current_user(async_engine, token_str):
+    async def _load():
+        async with AsyncSession(async_engine, expire_on_commit=False) as session:
+            return await get_current_user(token_str, session)
+
+    return asyncio.run(_load())
+
+
+def test_cache_evicts_least_recently_used():
+    cache = TokenCache(maxsize=2, ttl_seconds=60)
+    cache.set("a", _principal(1))
+    cache.set("b", _principal(2))
+    assert cache.get("a").user_id == 1
+    cache.set("c", _principal(3))
+
+    assert cache.get("b") is None
+    assert cache.get("a").user_id == 1
+    assert cache.get("c").user_id == 3
+    assert cache.stats()["hits"] == 3
+    assert cache.stats()["misses"] == 1
+
+
+def test_cache_drops_expired_tokens_and_invalidated_users():
+    cache = TokenCache(maxsize=10, ttl_seconds=60)
+    cache.set("old", _principal(1, datetime.now(UTC) - timedelta(seconds=1)))
+    cache.set("first", _principal(2))
+    cache.set("second", _principal(2))
+    cache.set("other", _principal(3))
+
+    assert cache.get("old") is None
+    cache.invalidate_user(2)
+    assert cache.get("first") is None
+    assert cache.get("second") is None
+    assert cache.get("other").user_id == 3
+
+
+def test_current_user_served_from_cache(db, async_engine):
+    user = User(
+        email="cached@example.com",
+        username="cached",
+        is_active=True,
+        employee=Employee(role=RoleType.ADMIN),
+    )
+    db.add(user)
+    db.commit()
+    token = create_database_token(user.id, db)
+    token_str = token.token
+
+    first = _current_user(async_engine, token_str)
+    assert first.username == "cached"
+    assert token_cache.stats()["misses"] == 1
+
+    # A hit never touches the session
+    cached = asyncio.run(get_current_user(token_str, None))
+    assert cached.id == user.id
+    assert cached.employee.role == RoleType.ADMIN
+    assert token_cache.stats()["hits"] == 1
+
+    change_user_role(db, user.id, RoleType.EMPLOYEE)
+    assert token_cache.get(token_str) is None
+    refreshed = _current_user(async_engine, token_str)
+    assert refreshed.employee.role == RoleType.EMPLOYEE
+
+    logout_user(db, token)
+    assert token_cache.get(token_str) is None
@@ -0,0 +1,86 @@
+import pytest
+from datetime import date
+from sqlalchemy.exc import IntegrityError
+from Backend.app.crud.absence import create_absence, get_absences, update_absence
+from Backend.app.schemas.absence import AbsenceBaseSchema, AbsenceUpdateSchema
+from Backend.app.core.enums import AbsenceType
+from Backend.app.models import Absence, Employee, User
+
+
+@pytest.fixture
+def employee(db):
+    employee = Employee(user=User(email="absent@example.com"))
+    db.add(employee)
+    db.commit()
+    return employee
+
+
+def _absence(employee_id, start, end):
+    return AbsenceBaseSchema(
+        employee_id=employee_id,
+        start_date=start,
+        end_date=end,
+        absence_type=AbsenceType.SICK,
+    )
+
+
+def test_create_absence_reports_overlapping_period(db, employee):
+    create_absence(db, _absence(employee.id, date(2025, 3, 3), date(2025, 3, 7)))
+
+    with pytest.raises(ValueError, match="from 2025-03-03 to 2025-03-07"):
+        create_absence(db, _absence(employee.id, date(2025, 3, 7), date(2025, 3, 9)))
+
+    # Adjacent periods do not overlap
+    create_absence(db, _absence(employee.id, date(2025, 3, 8), date(2025, 3, 9)))
+
+
+def test_exclusion_constraint_blocks_overlap_without_check(db, employee):
+    create_absence(db, _absence(employee.id, date(2025, 3, 3), date(2025, 3, 7)))
+
+    db.add(
+        Absence(
+            employee_id=employee.id,
+            start_date=date(2025, 3, 5),
+            end_date=date(2025, 3, 6),
+            absence_type="vab",
+        )
+    )
+    with pytest.raises(IntegrityError):
+        db.commit()
+    db.rollback()
+
+
+def test_update_absence_into_overlap(db, employee):
+    create_absence(db, _absence(employee.id, date(2025, 3, 3), date(2025, 3, 7)))
+    later = create_absence(
+        db, _absence(employee.id, date(2025, 3, 10), date(2025, 3, 12))
+    )
+
+    with pytest.raises(ValueError, match="from 2025-03-03 to 2025-03-07"):
+        update_absence(
+            db, later.id, AbsenceUpdateSchema(start_date=date(2025, 3, 6), hours=8)
+        )
+
+
+def test_get_absences_by_range(db, employee):
+    create_absence(db, _absence(employee.id, date(2025, 3, 3), date(2025, 3, 7)))
+    create_absence(db, _absence(employee.id, date(2025, 3, 20), date(2025, 3, 25)))
+
+    assert len(get_absences(db, start_date=date(2025, 3, 7))) == 2
+    assert len(get_absences(db, end_date=date(2025, 3, 6))) == 1
+    assert (
+        len(get_absences(db, start_date=date(2025, 3, 8), end_date=date(2025, 3, 19)))
+        == 0
+    )
+    assert (
+        len(get_absences(db, start_date=date(2025, 3, 8), end_date=date(2025, 3, 20)))
+        == 1
+    )
+
+
+def test_get_absences_inverted_range_is_empty(db, employee):
+    create_absence(db, _absence(employee.id, date(2025, 3, 3), date(2025, 3, 7)))
+
+    assert (
+        get_absences(db, start_date=date(2025, 3, 10), end_date=date(2025, 3, 1)) == []
+    )
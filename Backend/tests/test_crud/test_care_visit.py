@@ -0,0 +1,207 @@
+import pytest
+from datetime import date, timedelta
+from sqlalchemy import select, func
+from Backend.app.crud.care_visit import generate_care_visits, get_care_visits
+from Backend.app.core.exceptions import InvalidCursorError
+from Backend.app.core.pagination import decode_cursor, encode_cursor
+from Backend.app.crud.customer_measure import (
+    update_customer_measure,
+    delete_customer_measure,
+)
+from Backend.app.schemas.relations import CustomerMeasureUpdateSchema
+from Backend.app.models import (
+    Customer,
+    CustomerMeasure,
+    Measure,
+    MeasureCareVisit,
+    CareVisit,
+    Schedule,
+)
+
+
+@pytest.fixture
+def customer_plan(db):
+    customer = Customer(
+        first_name="Anna",
+        last_name="Svensson",
+        key_number=1001,
+        address="Storgatan 1",
+        is_active=True,
+    )
+    shower = Measure(name="Dusch", default_duration=30)
+    meal = Measure(name="Matlagning", default_duration=20)
+    db.add_all([customer, shower, meal])
+    db.flush()
+    db.add_all(
+        [
+            CustomerMeasure(
+                customer_id=customer.id,
+                measure_id=shower.id,
+                frequency="WEEKLY",
+                days_of_week=["monday", "thursday"],
+                customer_duration=45,
+            ),
+            CustomerMeasure(
+                customer_id=customer.id, measure_id=meal.id, frequency="DAILY"
+            ),
+        ]
+    )
+    db.commit()
+    return customer
+
+
+def test_generate_care_visits(db, customer_plan):
+    # 2025-03-03 is a Monday
+    result = generate_care_visits(db, date(2025, 3, 3), date(2025, 3, 9))
+
+    assert result["visits_created"] == 7
+    assert result["measures_linked"] == 9
+    assert result["schedules_created"] == 7
+
+    monday_visit = db.execute(
+        select(CareVisit).where(CareVisit.date == date(2025, 3, 3))
+    ).scalar_one()
+    assert monday_visit.duration == 65
+    assert monday_visit.status == "planned"
+
+
+def test_generate_care_visits_reuses_schedules_and_is_idempotent(db, customer_plan):
+    db.add(Schedule(date=date(2025, 3, 3)))
+    db.commit()
+
+    generate_care_visits(db, date(2025, 3, 3), date(2025, 3, 4))
+    result = generate_care_visits(db, date(2025, 3, 3), date(2025, 3, 4))
+
+    assert result["visits_created"] == 0
+    assert result["skipped_existing"] == 2
+    assert db.execute(select(func.count(Schedule.id))).scalar_one() == 2
+    assert db.execute(select(func.count(MeasureCareVisit.id))).scalar_one() == 3
+
+
+def test_generate_care_visits_skips_inactive_customers(db, customer_plan):
+    customer_plan.is_active = False
+    db.commit()
+
+    result = generate_care_visits(db, date(2025, 3, 3), date(2025, 3, 9))
+    assert result["visits_created"] == 0
+
+
+def test_generate_care_visits_invalid_range(db):
+    with pytest.raises(ValueError, match="Start date cannot be after end date"):
+        generate_care_visits(db, date(2025, 3, 9), date(2025, 3, 3))
+
+
+def _shower_plan(db, customer):
+    return db.execute(
+        select(CustomerMeasure)
+        .join(Measure)
+        .where(CustomerMeasure.customer_id == customer.id, Measure.name == "Dusch")
+    ).scalar_one()
+
+
+def _visits_by_date(db):
+    visits = db.execute(select(CareVisit).order_by(CareVisit.date)).scalars().all()
+    return {visit.date: visit for visit in visits}
+
+
+def test_update_customer_measure_replans_future_visits(db, customer_plan):
+    today = date.today()
+    generate_care_visits(db, today, today + timedelta(days=13))
+    shower = _shower_plan(db, customer_plan)
+
+    update_customer_measure(
+        db,
+        customer_id=customer_plan.id,
+        customer_measure_id=shower.id,
+        data=CustomerMeasureUpdateSchema(days_of_week=["tuesday"]),
+    )
+
+    db.expire_all()
+    for visit_date, visit in _visits_by_date(db).items():
+        measure_ids = {link.measure_id for link in visit.measures}
+        has_shower = shower.measure_id in measure_ids
+        assert has_shower == (visit_date.weekday() == 1)
+        assert visit.duration == (65 if has_shower else 20)
+
+
+def test_replan_leaves_completed_visits_untouched(db, customer_plan):
+    today = date.today()
+    generate_care_visits(db, today, today + timedelta(days=13))
+    shower = _shower_plan(db, customer_plan)
+
+    visits = _visits_by_date(db)
+    completed = next(
+        visit
+        for visit in visits.values()
+        if shower.measure_id in {link.measure_id for link in visit.measures}
+    )
+    completed.status = "completed"
+    db.commit()
+
+    delete_customer_measure(db, customer_measure_id=shower.id)
+
+    db.expire_all()
+    for visit in _visits_by_date(db).values():
+        measure_ids = {link.measure_id for link in visit.measures}
+        if visit.id == completed.id:
+            assert shower.measure_id in measure_ids
+            assert visit.duration == 65
+        else:
+            assert shower.measure_id not in measure_ids
+            assert visit.duration == 20
+
+
+def test_get_care_visits_keyset_pages(db, customer_plan):
+    # A second customer gives two visits per date, so pages split ties
+    other = Customer(
+        first_name="Bo", last_name="Berg", key_number=1002, address="Kyrkgatan 2"
+    )
+    db.add(other)
+    db.flush()
+    meal = db.execute(select(Measure).where(Measure.name == "Matlagning")).scalar_one()
+    db.add(CustomerMeasure(customer_id=other.id, measure_id=meal.id, frequency="DAILY"))
+    db.commit()
+    generate_care_visits(db, date(2025, 3, 3), date(2025, 3, 9))
+    everything = get_care_visits(db, limit=100)
+
+    pages, after = [], None
+    while True:
+        page = get_care_visits(db, limit=3, after=after)
+        if not page:
+            break
+        pages.extend(page)
+        after = decode_cursor(encode_cursor(page[-1].date, page[-1].id))
+
+    assert len(everything) == 14
+    assert [visit.id for visit in pages] == [visit.id for visit in everything]
+    assert [(v.date, v.id) for v in everything] == sorted(
+        (v.date, v.id) for v in everything
+    )
+
+
+def test_decode_cursor_rejects_garbage():
+    with pytest.raises(InvalidCursorError):
+        decode_cursor("not a cursor")
+
+
+def test_replan_refuses_a_plan_it_cannot_read(db, customer_plan):
+    today = date.today()
+    generate_care_visits(db, today, today + timedelta(days=13))
+    links = db.execute(select(func.count(MeasureCareVisit.id))).scalar_one()
+
+    # Stored before plans were validated, the schema rejects it today
+    shower = _shower_plan(db, customer_plan)
+    shower.frequency = "BIWEEKLY"
+    db.commit()
+
+    with pytest.raises(ValueError, match="Unknown frequency"):
+        update_customer_measure(
+            db,
+            customer_id=customer_plan.id,
+            customer_measure_id=shower.id,
+            data=CustomerMeasureUpdateSchema(customer_notes="Morgon"),
+        )
+
+    db.expire_all()
+    assert db.execute(select(func.count(MeasureCareVisit.id))).scalar_one() == links
+    assert _shower_plan(db, customer_plan).customer_notes is None
@@ -1,5 +1,7 @@
 import pytest
+from sqlalchemy import text
 from Backend.app.schemas.customer import CustomerBaseSchema
+from Backend.app.core.search import _trigram_support
 from Backend.app.crud.customer import (
     create_customer,
     get_customers,
@@ -215,6 +217,72 @@ def test_search_customers(db):
     assert results == []
 
 
+def test_search_customers_pages_and_escapes(db):
+    for i, address in enumerate(["Main St 1", "Main St 2", "Side St 100%"]):
+        create_customer(
+            db,
+            CustomerBaseSchema(
+                first_name="Carl",
+                last_name=f"Smith{i}",
+                key_number=i + 1,
+                address=address,
+                care_level=CareLevel.LOW,
+                gender=Gender.MALE,
+                approved_hours=10.0,
+                is_active=True,
+            ),
+        )
+
+    first = search_customers(db, query="main st", limit=1)
+    second = search_customers(db, query="main st", skip=1, limit=1)
+    assert [c.last_name for c in first + second] == ["Smith0", "Smith1"]
+
+    # % is matched literally rather than as a wildcard
+    assert [c.last_name for c in search_customers(db, query="0%")] == ["Smith2"]
+
+    # A single digit is still a key number, other short queries are refused
+    assert [c.last_name for c in search_customers(db, query="2")] == ["Smith1"]
+    with pytest.raises(ValueError):
+        search_customers(db, query=" M ")
+
+
+@pytest.fixture
+def trigram(db):
+    available = db.execute(
+        text("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+    ).scalar()
+    if available:
+        db.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        db.commit()
+    installed = db.execute(
+        text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+    ).scalar()
+    if not installed:
+        pytest.skip("pg_trgm is not installed")
+
+
+def test_search_customers_ranks_by_similarity(db, trigram):
+    for i, last_name in enumerate(["Andersson", "Johanson", "Johansson"]):
+        create_customer(
+            db,
+            CustomerBaseSchema(
+                first_name="Eva",
+                last_name=last_name,
+                key_number=i + 1,
+                address="Storgatan 1",
+                care_level=CareLevel.LOW,
+                gender=Gender.FEMALE,
+                approved_hours=10.0,
+                is_active=True,
+            ),
+        )
+
+    # The exact match ranks above the misspelling, which ILIKE would miss
+    results = search_customers(db, query="johansson")
+    assert [c.last_name for c in results] == ["Johansson", "Johanson"]
+    assert _trigram_support[db.get_bind()] is True
+
+
 def test_customer_exists(db):
     # Create a customer with a specific key_number
     customer_data = CustomerBaseSchema(
@@ -1,8 +1,29 @@
 import pytest
-from datetime import datetime, timedelta
-from Backend.app.crud.schedule import create_schedule, get_schedules
-from Backend.app.schemas.schedule import ScheduleBaseSchema
+from datetime import date, datetime, timedelta
+from sqlalchemy import select
+from Backend.app.crud.schedule import (
+    create_schedule,
+    get_schedules,
+    copy_schedules,
+    assign_employee_to_schedule,
+)
+from Backend.app.schemas.schedule import ScheduleBaseSchema, ScheduleCopySchema
 from Backend.app.core.enums import ShiftType
+from Backend.app.core.exceptions import EmployeeNotFoundError, ScheduleNotFoundError
+from Backend.app.models import (
+    Absence,
+    CareVisit,
+    Customer,
+    Employee,
+    Measure,
+    MeasureCareVisit,
+    Schedule,
+    ScheduleCustomer,
+    ScheduleEmployee,
+    ScheduleMeasure,
+    User,
+)
+from Backend.app.models.employee import EmployeeCareVisit
 
 
 @pytest.fixture
@@ -35,9 +56,132 @@ def test_filter_by_exact_date(db, sample_schedules):
     assert all(s.date == target_date for s in results)
 
 
+def test_create_schedule_duplicate_date(db, sample_schedules):
+    schema = ScheduleBaseSchema(
+        date=sample_schedules[0].date, shift_type=ShiftType.EVENING
+    )
+    with pytest.raises(ValueError, match="already exists"):
+        create_schedule(db, schema)
+    assert len(get_schedules(db)) == 3
+
+
+def test_assign_employee_to_schedule(db, sample_schedules):
+    schedule_id = sample_schedules[0].id
+    employee = Employee(user=User(email="assign@example.com"))
+    db.add(employee)
+    db.commit()
+
+    assign_employee_to_schedule(db, schedule_id, employee.id)
+    assert db.execute(
+        select(ScheduleEmployee.employee_id).where(
+            ScheduleEmployee.schedule_id == schedule_id
+        )
+    ).scalars().all() == [employee.id]
+
+    with pytest.raises(ValueError, match="already assigned"):
+        assign_employee_to_schedule(db, schedule_id, employee.id)
+    with pytest.raises(EmployeeNotFoundError):
+        assign_employee_to_schedule(db, schedule_id, 99999)
+    with pytest.raises(ScheduleNotFoundError):
+        assign_employee_to_schedule(db, 99999, employee.id)
+
+
 def test_filter_by_date_range(db, sample_schedules):
     start = sample_schedules[0].date
     end = sample_schedules[-1].date
     results = get_schedules(db, date=None)  # normal get
     in_range = [s for s in results if start <= s.date <= end]
     assert len(in_range) >= 3
+
+
+@pytest.fixture
+def staffed_week(db):
+    # 2025-03-03 is a Monday
+    customer = Customer(
+        first_name="Karl", last_name="Berg", key_number=2001, address="Gatan 2"
+    )
+    measure = Measure(name="Tillsyn", default_duration=15)
+    present = Employee(user=User(email="present@example.com"))
+    absent = Employee(user=User(email="absent@example.com"))
+    db.add_all([customer, measure, present, absent])
+    db.flush()
+
+    for day in range(7):
+        schedule = Schedule(date=date(2025, 3, 3) + timedelta(days=day))
+        db.add(schedule)
+        db.flush()
+        db.add_all(
+            [
+                ScheduleEmployee(schedule_id=schedule.id, employee_id=present.id),
+                ScheduleEmployee(schedule_id=schedule.id, employee_id=absent.id),
+                ScheduleCustomer(schedule_id=schedule.id, customer_id=customer.id),
+                ScheduleMeasure(schedule_id=schedule.id, measure_id=measure.id),
+            ]
+        )
+        visit = CareVisit(
+            date=schedule.date,
+            status="completed",
+            duration=15,
+            schedule_id=schedule.id,
+            customer_id=customer.id,
+        )
+        db.add(visit)
+        db.flush()
+        db.add_all(
+            [
+                MeasureCareVisit(measure_id=measure.id, care_visit_id=visit.id),
+                EmployeeCareVisit(employee_id=absent.id, care_visit_id=visit.id),
+            ]
+        )
+
+    db.add(
+        Absence(
+            employee_id=absent.id,
+            start_date=date(2025, 3, 10),
+            end_date=date(2025, 3, 12),
+            absence_type="sick",
+        )
+    )
+    db.commit()
+    return absent
+
+
+def test_copy_schedules_week_with_relations(db, staffed_week):
+    result = copy_schedules(
+        db,
+        ScheduleCopySchema(
+            source_start_date=date(2025, 3, 3),
+            source_end_date=date(2025, 3, 9),
+            target_start_date=date(2025, 3, 10),
+            target_end_date=date(2025, 3, 23),
+            skip_absent_employees=True,
+        ),
+    )
+
+    assert len(result["schedules"]) == 14
+    assert result["customers_copied"] == 14
+    assert result["measures_copied"] == 14
+    assert result["care_visits_copied"] == 14
+    assert result["employees_copied"] == 25
+    assert result["employees_skipped"] == 3
+
+    copied_visits = (
+        db.execute(select(CareVisit).where(CareVisit.date >= date(2025, 3, 10)))
+        .scalars()
+        .all()
+    )
+    assert all(visit.status == "planned" for visit in copied_visits)
+    assert all(len(visit.measures) == 1 for visit in copied_visits)
+    assert sum(len(visit.employees) for visit in copied_visits) == 11
+
+
+def test_copy_schedules_rejects_existing_target(db, staffed_week):
+    data = ScheduleCopySchema(
+        source_start_date=date(2025, 3, 3),
+        source_end_date=date(2025, 3, 9),
+        target_start_date=date(2025, 3, 10),
+    )
+    copy_schedules(db, data)
+
+    with pytest.raises(ValueError, match="Schedules already exist"):
+        copy_schedules(db, data)
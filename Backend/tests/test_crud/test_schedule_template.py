@@ -0,0 +1,172 @@
+import pytest
+from datetime import date
+from sqlalchemy import select
+from Backend.app.crud.schedule_template import (
+    create_schedule_template,
+    apply_schedule_template,
+    delete_schedule_template,
+)
+from Backend.app.schemas.schedule_template import (
+    ScheduleTemplateBaseSchema,
+    ScheduleTemplateApplySchema,
+)
+from Backend.app.core.enums import ShiftType
+from Backend.app.core.exceptions import EmployeeNotFoundError
+from Backend.app.models import (
+    Employee,
+    Measure,
+    Schedule,
+    ScheduleEmployee,
+    ScheduleMeasure,
+    ScheduleTemplateShift,
+    User,
+)
+
+
+@pytest.fixture
+def rotation(db):
+    # Two week rotation: week 0 Anna works Monday, week 1 Bo works Monday.
+    # Wednesday has a day shift with a measure every week.
+    anna = Employee(user=User(email="anna@example.com"))
+    bo = Employee(user=User(email="bo@example.com"))
+    measure = Measure(name="Dusch", default_duration=30)
+    db.add_all([anna, bo, measure])
+    db.commit()
+
+    template = create_schedule_template(
+        db,
+        ScheduleTemplateBaseSchema(
+            name="Rotation A",
+            weeks=2,
+            shifts=[
+                {
+                    "week_offset": 0,
+                    "weekday": 0,
+                    "shift_type": ShiftType.MORNING,
+                    "employee_ids": [anna.id],
+                },
+                {
+                    "week_offset": 1,
+                    "weekday": 0,
+                    "shift_type": ShiftType.EVENING,
+                    "employee_ids": [bo.id],
+                },
+                {
+                    "week_offset": 0,
+                    "weekday": 2,
+                    "shift_type": ShiftType.DAY,
+                    "measures": [{"measure_id": measure.id, "time_of_day": "morning"}],
+                },
+                {
+                    "week_offset": 1,
+                    "weekday": 2,
+                    "shift_type": ShiftType.DAY,
+                    "measures": [{"measure_id": measure.id, "time_of_day": "morning"}],
+                },
+            ],
+        ),
+    )
+    return template, anna, bo
+
+
+def test_create_template_with_unknown_employee(db):
+    data = ScheduleTemplateBaseSchema(
+        name="Broken",
+        shifts=[{"weekday": 0, "shift_type": ShiftType.DAY, "employee_ids": [999]}],
+    )
+    with pytest.raises(EmployeeNotFoundError):
+        create_schedule_template(db, data)
+
+
+def test_template_rejects_week_offset_outside_rotation():
+    with pytest.raises(ValueError):
+        ScheduleTemplateBaseSchema(
+            name="Too short",
+            weeks=1,
+            shifts=[{"week_offset": 1, "weekday": 0, "shift_type": ShiftType.DAY}],
+        )
+
+
+def test_template_rejects_duplicate_measure_in_shift():
+    with pytest.raises(ValueError):
+        ScheduleTemplateBaseSchema(
+            name="Twice",
+            shifts=[
+                {
+                    "weekday": 0,
+                    "shift_type": ShiftType.DAY,
+                    "measures": [{"measure_id": 1}, {"measure_id": 1}],
+                }
+            ],
+        )
+
+
+def test_apply_template_rotates_weeks(db, rotation):
+    template, anna, bo = rotation
+
+    # 2025-03-03 is a Monday, apply four weeks starting mid rotation
+    result = apply_schedule_template(
+        db,
+        template.id,
+        ScheduleTemplateApplySchema(
+            start_date=date(2025, 3, 3),
+            end_date=date(2025, 3, 30),
+            rotation_start_date=date(2025, 2, 24),
+        ),
+    )
+
+    assert [s.date for s in result["schedules"]] == [
+        date(2025, 3, 3),
+        date(2025, 3, 5),
+        date(2025, 3, 10),
+        date(2025, 3, 12),
+        date(2025, 3, 17),
+        date(2025, 3, 19),
+        date(2025, 3, 24),
+        date(2025, 3, 26),
+    ]
+    assert result["employees_assigned"] == 4
+    assert result["measures_assigned"] == 4
+
+    mondays = db.execute(
+        select(Schedule.date, Schedule.shift_type, ScheduleEmployee.employee_id)
+        .join(ScheduleEmployee, ScheduleEmployee.schedule_id == Schedule.id)
+        .order_by(Schedule.date)
+    ).all()
+    # 2025-02-24 starts week 0, so 2025-03-03 falls in week 1
+    assert mondays == [
+        (date(2025, 3, 3), ShiftType.EVENING, bo.id),
+        (date(2025, 3, 10), ShiftType.MORNING, anna.id),
+        (date(2025, 3, 17), ShiftType.EVENING, bo.id),
+        (date(2025, 3, 24), ShiftType.MORNING, anna.id),
+    ]
+    measure_dates = db.execute(
+        select(Schedule.date)
+        .join(ScheduleMeasure, ScheduleMeasure.schedule_id == Schedule.id)
+        .where(ScheduleMeasure.time_of_day == "morning")
+    ).scalars()
+    assert {d.weekday() for d in measure_dates} == {2}
+
+
+def test_apply_template_refuses_existing_schedules(db, rotation):
+    template, _, _ = rotation
+    db.add(Schedule(date=date(2025, 3, 5), shift_type=ShiftType.NIGHT))
+    db.commit()
+
+    with pytest.raises(ValueError, match="already exist"):
+        apply_schedule_template(
+            db,
+            template.id,
+            ScheduleTemplateApplySchema(
+                start_date=date(2025, 3, 3), end_date=date(2025, 3, 9)
+            ),
+        )
+
+    assert db.execute(select(Schedule)).scalars().all()[0].date == date(2025, 3, 5)
+    assert len(db.execute(select(Schedule)).scalars().all()) == 1
+
+
+def test_delete_template_removes_shifts(db, rotation):
+    template, _, _ = rotation
+    assert delete_schedule_template(db, template.id)
+    assert db.execute(select(ScheduleTemplateShift)).scalars().all() == []
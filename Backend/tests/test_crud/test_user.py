@@ -3,21 +3,36 @@ import datetime
 from Backend.app.crud.user import (
     authenticate_user,
     invite_user,
+    invite_users,
     complete_registration,
     logout_user,
     delete_user,
     get_users,
     get_user_by_id,
     login_user,
+    get_employee_availability,
+    purge_expired_tokens,
+    search_users,
+    get_employees_by_role,
+)
+from Backend.app.models import (
+    User,
+    Employee,
+    Token,
+    Absence,
+    Schedule,
+    ScheduleEmployee,
+    EmailOutbox,
 )
-from Backend.app.models import User, Employee, Token
 from Backend.app.schemas.user import (
     UserLoginSchema,
     UserInviteSchema,
+    UserInviteBatchSchema,
     UserCompleteRegistrationSchema,
 )
-from Backend.app.core.security import get_password_hash
-from Backend.app.core.enums import Gender, RoleType
+from Backend.app.core.security import get_password_hash, create_database_token
+from Backend.app.core.settings import settings
+from Backend.app.core.enums import Gender, InviteStatus, RoleType
 
 
 def test_authenticate_user(db):
@@ -51,6 +66,50 @@ def test_invite_user(db):
     assert result.email == "test@example.com"
 
 
+def test_invite_users_reports_each_email(db):
+    invite_user(db, UserInviteSchema(email="taken@example.com"))
+    batch = UserInviteBatchSchema(
+        emails=[
+            "a@example.com",
+            "taken@example.com",
+            "not-an-email",
+            " b@example.com ",
+            "a@example.com",
+        ]
+    )
+
+    results = invite_users(db, batch)
+
+    assert results == [
+        ("a@example.com", InviteStatus.INVITED),
+        ("taken@example.com", InviteStatus.EXISTS),
+        ("not-an-email", InviteStatus.INVALID),
+        ("b@example.com", InviteStatus.INVITED),
+        ("a@example.com", InviteStatus.DUPLICATE),
+    ]
+    invited = db.query(User).filter(User.email.in_(["a@example.com", "b@example.com"]))
+    assert all(user.employee and user.registration_token for user in invited)
+    assert sorted(email.recipient for email in db.query(EmailOutbox)) == [
+        "a@example.com",
+        "b@example.com",
+        "taken@example.com",
+    ]
+
+
+def test_invite_users_nothing_valid(db):
+    results = invite_users(db, UserInviteBatchSchema(emails=["nope"]))
+
+    assert results == [("nope", InviteStatus.INVALID)]
+    assert db.query(User).count() == 0
+
+
+def test_invite_batch_from_csv():
+    batch = UserInviteBatchSchema.from_csv(
+        "Email\na@example.com,Anna\n\nb@example.com\n"
+    )
+    assert batch.emails == ["a@example.com", "b@example.com"]
+
+
 def test_complete_registration_success(db):
     user = User(
         email="test@example.com",
@@ -269,3 +328,119 @@ def test_get_user_by_id_inactive_included(db):
 
     assert result is not None
     assert result.email == "inactive@example.com"
+
+
+def test_get_employee_availability(db):
+    start = datetime.date(2025, 3, 3)
+    steady = Employee(
+        first_name="Anna",
+        last_name="A",
+        user=User(email="a@example.com", is_active=True),
+    )
+    leaving = Employee(
+        first_name="Bo",
+        last_name="B",
+        end_date=datetime.date(2025, 3, 5),
+        user=User(email="b@example.com", is_active=True),
+    )
+    inactive = Employee(
+        first_name="Cia",
+        last_name="C",
+        user=User(email="c@example.com", is_active=False),
+    )
+    schedule = Schedule(date=datetime.date(2025, 3, 4))
+    db.add_all([steady, leaving, inactive, schedule])
+    db.flush()
+    db.add_all(
+        [
+            Absence(
+                employee_id=steady.id,
+                start_date=datetime.date(2025, 3, 1),
+                end_date=datetime.date(2025, 3, 3),
+                absence_type="sick",
+            ),
+            Absence(
+                employee_id=steady.id,
+                start_date=datetime.date(2025, 3, 9),
+                end_date=datetime.date(2025, 3, 20),
+                absence_type="vacation",
+            ),
+            ScheduleEmployee(schedule_id=schedule.id, employee_id=leaving.id),
+        ]
+    )
+    db.commit()
+
+    result = get_employee_availability(db, start, datetime.date(2025, 3, 9))
+
+    assert result["days"] == 7
+    rows = {row["employee_id"]: row for row in result["employees"]}
+    assert set(rows) == {steady.id, leaving.id}
+    assert rows[steady.id]["available"] == "0111110"
+    assert rows[steady.id]["assigned"] == "0000000"
+    assert rows[leaving.id]["available"] == "1110000"
+    assert rows[leaving.id]["assigned"] == "0100000"
+
+
+def test_get_employee_availability_invalid_range(db):
+    with pytest.raises(ValueError):
+        get_employee_availability(
+            db, datetime.date(2025, 3, 9), datetime.date(2025, 3, 3)
+        )
+
+
+def test_purge_expired_tokens_in_batches(db):
+    user = User(email="purge@example.com")
+    db.add(user)
+    db.commit()
+    expired = datetime.datetime.now(datetime.UTC) - datetime.timedelta(hours=1)
+    db.add_all(
+        [Token(token=f"old{i}", user_id=user.id, expire_date=expired) for i in range(5)]
+    )
+    db.add(Token(token="fresh", user_id=user.id))
+    db.commit()
+
+    assert purge_expired_tokens(db, batch_size=2) == 5
+    assert [t.token for t in db.query(Token).all()] == ["fresh"]
+    assert purge_expired_tokens(db, batch_size=2) == 0
+
+
+def test_login_reuses_token_per_client(db, monkeypatch):
+    monkeypatch.setattr(settings, "TOKEN_REUSE", True)
+    user = User(email="reuse@example.com")
+    db.add(user)
+    db.commit()
+
+    phone = create_database_token(user.id, db, client_id="phone")
+    assert create_database_token(user.id, db, client_id="phone").id == phone.id
+    assert create_database_token(user.id, db, client_id="tablet").id != phone.id
+    assert create_database_token(user.id, db).id != phone.id
+
+    phone.expire_date = datetime.datetime.now(datetime.UTC) + datetime.timedelta(
+        minutes=10
+    )
+    db.commit()
+    assert create_database_token(user.id, db, client_id="phone").id != phone.id
+
+
+def test_search_users(db):
+    for name, role in [("anna", RoleType.ADMIN), ("bertil", RoleType.EMPLOYEE)]:
+        db.add(
+            User(
+                email=f"{name}@example.com",
+                username=name,
+                is_active=True,
+                employee=Employee(
+                    first_name=name.title(), last_name="Larsson", role=role
+                ),
+            )
+        )
+    db.add(User(email="pending@example.com", employee=Employee()))
+    db.commit()
+
+    assert [u.username for u in search_users(db, query="larss")] == ["anna", "bertil"]
+    assert [u.username for u in search_users(db, query="BERT")] == ["bertil"]
+    assert [u.email for u in search_users(db, query="pend")] == ["pending@example.com"]
+    assert [u.username for u in search_users(db, query="larss", skip=1)] == ["bertil"]
+    assert [u.username for u in get_employees_by_role(db, RoleType.ADMIN)] == ["anna"]
+    with pytest.raises(ValueError):
+        search_users(db, query="a")
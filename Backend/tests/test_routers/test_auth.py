@@ -0,0 +1,59 @@
+import pytest
+from fastapi.testclient import TestClient
+from Backend.app.main import app
+from Backend.app.core.db_setup import get_async_db
+from Backend.app.core.security import get_current_superuser
+from Backend.app.models import User
+
+
+def override_superuser():
+    return User(id=999, username="root", email="root@example.com", is_superuser=True)
+
+
+@pytest.fixture
+def client(db, override_get_async_db):
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    app.dependency_overrides[get_current_superuser] = override_superuser
+    with TestClient(app) as c:
+        yield c
+    app.dependency_overrides.clear()
+
+
+def test_invite_batch_json(client):
+    response = client.post(
+        "/auth/invite:batch",
+        json={"emails": ["a@example.com", "bad", "a@example.com"]},
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "invited": 1,
+        "results": [
+            {"email": "a@example.com", "status": "invited"},
+            {"email": "bad", "status": "invalid"},
+            {"email": "a@example.com", "status": "duplicate"},
+        ],
+    }
+
+
+def test_invite_batch_csv(client):
+    client.post("/auth/invite", json={"email": "old@example.com"})
+
+    response = client.post(
+        "/auth/invite:batch",
+        content="email\nold@example.com\nnew@example.com\n",
+        headers={"Content-Type": "text/csv"},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["results"] == [
+        {"email": "old@example.com", "status": "exists"},
+        {"email": "new@example.com", "status": "invited"},
+    ]
+
+
+def test_invite_batch_rejects_oversized_batch(client):
+    emails = [f"user{i}@example.com" for i in range(501)]
+    response = client.post("/auth/invite:batch", json={"emails": emails})
+
+    assert response.status_code == 422
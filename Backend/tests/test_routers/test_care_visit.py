@@ -0,0 +1,169 @@
+import csv
+import io
+import json
+import msgpack
+import pytest
+from datetime import date
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+from Backend.app.main import app
+from Backend.app.core.db_setup import get_async_db, get_async_read_db
+from Backend.app.core.enums import VisitStatus
+from Backend.app.core.pagination import NEXT_CURSOR_HEADER
+from Backend.app.core.serialization import (
+    COLUMNAR_MEDIA_TYPE,
+    MSGPACK_MEDIA_TYPE,
+    ListSerializer,
+)
+from Backend.app.dependencies import require_admin
+from Backend.app.models import CareVisit, Customer, Schedule, User
+from Backend.app.routers import care_visit as care_visit_router
+from Backend.app.schemas.care_visit import CareVisitOutSchema
+
+
+def override_require_admin():
+    return User(id=999, username="adminuser", email="admin@example.com")
+
+
+@pytest.fixture
+def client(db, override_get_async_db, override_get_async_read_db):
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    app.dependency_overrides[get_async_read_db] = override_get_async_read_db
+    app.dependency_overrides[require_admin] = override_require_admin
+    with TestClient(app) as c:
+        yield c
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def visits(db):
+    customer = Customer(
+        first_name="Anna", last_name="Svensson", key_number=1001, address="Storgatan 1"
+    )
+    db.add(customer)
+    db.flush()
+    for day in range(1, 8):
+        schedule = Schedule(date=date(2025, 3, day))
+        db.add(schedule)
+        db.flush()
+        for status in (VisitStatus.PLANNED, VisitStatus.COMPLETED):
+            db.add(
+                CareVisit(
+                    date=schedule.date,
+                    status=status.value,
+                    duration=30,
+                    schedule_id=schedule.id,
+                    customer_id=customer.id,
+                )
+            )
+    db.commit()
+
+
+def test_export_ndjson_streams_every_row(client, visits, monkeypatch):
+    monkeypatch.setattr(care_visit_router, "EXPORT_BATCH_SIZE", 3)
+
+    response = client.get("/care_visits/export")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert len(rows) == 14
+    assert [(row["date"], row["id"]) for row in rows] == sorted(
+        (row["date"], row["id"]) for row in rows
+    )
+
+
+def test_export_csv_applies_filters(client, visits):
+    response = client.get(
+        "/care_visits/export",
+        params={"format": "csv", "status": "completed", "end_date": "2025-03-03"},
+    )
+
+    assert response.status_code == 200
+    assert "care_visits.csv" in response.headers["content-disposition"]
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [row["date"] for row in rows] == ["2025-03-01", "2025-03-02", "2025-03-03"]
+    assert {row["status"] for row in rows} == {"completed"}
+
+
+def test_export_csv_without_rows_has_header(client):
+    response = client.get("/care_visits/export", params={"format": "csv"})
+
+    assert response.status_code == 200
+    assert response.text.strip().split(",")[0] == "date"
+
+
+def test_list_pages_with_cursor_header(client, visits):
+    response = client.get("/care_visits/", params={"limit": 10})
+
+    assert response.status_code == 200
+    first = response.json()
+    assert len(first) == 10
+    assert set(first[0]) == set(CareVisitOutSchema.model_fields)
+
+    cursor = response.headers[NEXT_CURSOR_HEADER]
+    response = client.get("/care_visits/", params={"limit": 10, "cursor": cursor})
+    rest = response.json()
+    assert len(rest) == 4
+    assert NEXT_CURSOR_HEADER not in response.headers
+    assert {row["id"] for row in first}.isdisjoint(row["id"] for row in rest)
+
+
+def test_list_serializer_matches_response_model(db, visits):
+    rows = db.execute(select(CareVisit).order_by(CareVisit.id)).scalars().all()
+    db.expire(rows[0])  # read through attributes rather than __dict__
+
+    data = json.loads(ListSerializer(CareVisitOutSchema).dump_json(rows))
+
+    assert data == [
+        CareVisitOutSchema.model_validate(row).model_dump(mode="json") for row in rows
+    ]
+
+
+def test_list_columnar_format(client, visits):
+    plain = client.get("/care_visits/", params={"limit": 5}).json()
+
+    response = client.get("/care_visits/", params={"limit": 5, "format": "columnar"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == COLUMNAR_MEDIA_TYPE
+    assert response.headers["vary"] == "Accept"
+    assert NEXT_CURSOR_HEADER in response.headers
+    data = response.json()
+    assert [dict(zip(data["fields"], row)) for row in data["rows"]] == plain
+
+
+def test_list_msgpack_negotiated_by_accept(client, visits):
+    plain = client.get("/care_visits/", params={"limit": 5}).json()
+
+    response = client.get(
+        "/care_visits/",
+        params={"limit": 5},
+        headers={"Accept": f"{MSGPACK_MEDIA_TYPE}, application/json;q=0.5"},
+    )
+
+    assert response.headers["content-type"] == MSGPACK_MEDIA_TYPE
+    data = msgpack.unpackb(response.content)
+    assert [dict(zip(data["fields"], row)) for row in data["rows"]] == plain
+    assert len(response.content) < len(json.dumps(plain))
+
+
+@pytest.mark.parametrize(
+    "accept, media_type",
+    [
+        (f"{MSGPACK_MEDIA_TYPE};q=0, application/json", "application/json"),
+        (f"application/json, {MSGPACK_MEDIA_TYPE}", "application/json"),
+        (
+            f"{COLUMNAR_MEDIA_TYPE};q=0.5, {MSGPACK_MEDIA_TYPE};q=0.8",
+            MSGPACK_MEDIA_TYPE,
+        ),
+        (f"{MSGPACK_MEDIA_TYPE}, */*;q=0.1", MSGPACK_MEDIA_TYPE),
+    ],
+)
+def test_list_accept_honours_q_values(client, visits, accept, media_type):
+    response = client.get(
+        "/care_visits/", params={"limit": 5}, headers={"Accept": accept}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == media_type
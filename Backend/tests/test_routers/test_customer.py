@@ -1,11 +1,27 @@
 import pytest
+from datetime import date, timedelta
 from fastapi.testclient import TestClient
+from sqlalchemy import func, select
 
 from Backend.app.crud.customer import create_customer
+from Backend.app.crud.care_visit import generate_care_visits
+from Backend.app import main
 from Backend.app.main import app
-from Backend.app.models import User, Employee
+from Backend.app.models import (
+    User,
+    Employee,
+    Measure,
+    CustomerMeasure,
+    MeasureCareVisit,
+)
 from Backend.app.core.enums import CareLevel, Gender, RoleType
-from Backend.app.core.db_setup import get_db
+from Backend.app.core.db_setup import (
+    READ_PRIMARY_COOKIE,
+    get_db,
+    get_async_db,
+    get_async_read_db,
+    reads_from_primary,
+)
 from Backend.app.schemas.customer import CustomerBaseSchema
 from Backend.app.dependencies import require_admin
 
@@ -30,8 +46,10 @@ def override_require_admin():
 
 
 @pytest.fixture
-def client(db):
+def client(db, override_get_async_db, override_get_async_read_db):
     app.dependency_overrides[get_db] = override_get_db(db)
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    app.dependency_overrides[get_async_read_db] = override_get_async_read_db
     app.dependency_overrides[require_admin] = override_require_admin
     with TestClient(app) as c:
         yield c
@@ -67,3 +85,126 @@ def test_update_customer_not_found(client):
     assert response.status_code == 404
     data = response.json()
     assert data["detail"] == "Customer with ID 99999 not found"
+
+
+def test_write_keeps_reads_on_primary(db, client, monkeypatch):
+    monkeypatch.setattr(main, "replica_engine", object())
+    customer = create_customer(
+        db,
+        CustomerBaseSchema(
+            first_name="Jane",
+            last_name="Doe",
+            key_number=54321,
+            address="Main St",
+            care_level=CareLevel.LOW,
+            gender=Gender.FEMALE,
+            approved_hours=10.0,
+            is_active=True,
+        ),
+    )
+
+    response = client.get(f"/customers/{customer.id}")
+    assert response.status_code == 200
+    assert READ_PRIMARY_COOKIE not in response.cookies
+
+    response = client.patch(f"/customers/{customer.id}", json={"approved_hours": 12.0})
+    assert response.status_code == 200
+    assert reads_from_primary(response.cookies[READ_PRIMARY_COOKIE])
+
+
+def test_search_is_not_shadowed_by_customer_id(db, client):
+    create_customer(
+        db,
+        CustomerBaseSchema(
+            first_name="Greta",
+            last_name="Garbo",
+            key_number=4242,
+            address="Film Rd",
+            care_level=CareLevel.LOW,
+            gender=Gender.FEMALE,
+            approved_hours=5.0,
+            is_active=True,
+        ),
+    )
+
+    response = client.get("/customers/search", params={"q": "garb"})
+    assert response.status_code == 200
+    assert [c["key_number"] for c in response.json()] == [4242]
+
+    response = client.get("/customers/search", params={"q": "g"})
+    assert response.status_code == 400
+
+
+def test_update_customer_measure_rejects_unplannable_values(db, client):
+    customer = create_customer(
+        db,
+        CustomerBaseSchema(
+            first_name="Stina",
+            last_name="Berg",
+            key_number=778,
+            address="Hill Rd",
+            care_level=CareLevel.LOW,
+            gender=Gender.FEMALE,
+            approved_hours=5.0,
+            is_active=True,
+        ),
+    )
+    measure = Measure(name="Dusch", default_duration=30)
+    db.add(measure)
+    db.commit()
+    customer_measure = CustomerMeasure(
+        customer_id=customer.id,
+        measure_id=measure.id,
+        frequency="WEEKLY",
+        days_of_week=["monday", "thursday"],
+    )
+    db.add(customer_measure)
+    db.commit()
+    today = date.today()
+    generate_care_visits(db, today, today + timedelta(days=27))
+    links = db.execute(select(func.count(MeasureCareVisit.id))).scalar_one()
+    assert links > 0
+    url = f"/customers/{customer.id}/measures/{customer_measure.id}"
+
+    for body in ({"frequency": "biweekly"}, {"days_of_week": ["m\u00e5n"]}):
+        assert client.patch(url, json=body).status_code == 422
+
+    response = client.post(
+        f"/customers/{customer.id}/measures",
+        json={"measure_id": measure.id, "frequency": "fortnightly"},
+    )
+    assert response.status_code == 422
+
+    db.expire_all()
+    assert db.execute(select(func.count(MeasureCareVisit.id))).scalar_one() == links
+
+
+def test_update_customer_measure_rejects_null_frequency(db, client):
+    customer = create_customer(
+        db,
+        CustomerBaseSchema(
+            first_name="Nils",
+            last_name="Holm",
+            key_number=777,
+            address="Lake Rd",
+            care_level=CareLevel.LOW,
+            gender=Gender.MALE,
+            approved_hours=5.0,
+            is_active=True,
+        ),
+    )
+    measure = Measure(name="Lunch", default_duration=30)
+    db.add(measure)
+    db.commit()
+    customer_measure = CustomerMeasure(
+        customer_id=customer.id, measure_id=measure.id, frequency="WEEKLY"
+    )
+    db.add(customer_measure)
+    db.commit()
+    url = f"/customers/{customer.id}/measures/{customer_measure.id}"
+
+    assert client.patch(url, json={"frequency": None}).status_code == 422
+
+    response = client.patch(url, json={"frequency": "DAILY"})
+    assert response.status_code == 200
+    assert response.json()["frequency"] == "DAILY"
@@ -0,0 +1,110 @@
+import asyncio
+import time
+import pytest
+from fastapi import Request
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, exc
+from sqlalchemy.pool import QueuePool
+from Backend.app.main import app
+from Backend.app.core import db_setup
+from Backend.app.core.db_setup import get_async_read_db, reads_from_primary
+from Backend.app.core.pool_metrics import PoolMetrics, pool_status, timed_pool
+from Backend.app.core.security import get_current_superuser
+from Backend.app.core.settings import settings
+from Backend.app.dependencies import require_admin
+from Backend.app.models import User
+
+
+def override_superuser():
+    return User(id=999, username="root", email="root@example.com", is_superuser=True)
+
+
+@pytest.fixture
+def client():
+    app.dependency_overrides[get_current_superuser] = override_superuser
+    app.dependency_overrides[require_admin] = override_superuser
+    with TestClient(app) as c:
+        yield c
+    app.dependency_overrides.clear()
+
+
+def test_timed_pool_records_waits_and_timeouts(db):
+    metrics = PoolMetrics()
+    engine = create_engine(
+        settings.DATABASE_URL_TEST,
+        poolclass=timed_pool(QueuePool, metrics),
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+    try:
+        with engine.connect():
+            status = pool_status(engine.pool)
+            assert status["checked_out"] == 1
+            with pytest.raises(exc.TimeoutError):
+                engine.connect()
+        engine.dispose()
+        with engine.connect():
+            pass
+    finally:
+        engine.dispose()
+
+    stats = metrics.stats()
+    assert stats["checkouts"] == 2
+    assert stats["timeouts"] == 1
+    assert stats["wait_max_ms"] >= stats["wait_avg_ms"] > 0
+
+
+def test_exhausted_pool_answers_503(client):
+    async def _exhausted():
+        raise exc.TimeoutError("QueuePool limit reached")
+        yield
+
+    app.dependency_overrides[get_async_read_db] = _exhausted
+    response = client.get("/customers/")
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+
+
+def test_db_pool_stats(client):
+    response = client.get("/internal/db-pool")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert set(data) == {"async", "sync"}
+    assert {"size", "checked_out", "overflow", "wait_avg_ms", "timeouts"} <= set(
+        data["async"]
+    )
+
+
+def test_reads_from_primary_only_within_window():
+    assert reads_from_primary(str(time.time() + 5))
+    assert not reads_from_primary(str(time.time() - 1))
+    assert not reads_from_primary(None)
+    assert not reads_from_primary("garbage")
+
+
+def _read_bind(cookie: str = "") -> object:
+    headers = [(b"cookie", f"{db_setup.READ_PRIMARY_COOKIE}={cookie}".encode())]
+    request = Request({"type": "http", "headers": headers if cookie else []})
+
+    async def scenario():
+        sessions = get_async_read_db(request)
+        session = await sessions.__anext__()
+        await sessions.aclose()
+        return session.bind
+
+    return asyncio.run(scenario())
+
+
+def test_read_session_routing(monkeypatch):
+    assert _read_bind() is db_setup.async_read_engine
+    assert db_setup.async_read_engine.get_execution_options()["postgresql_readonly"]
+
+    replica = db_setup.async_engine.execution_options(postgresql_readonly=True)
+    monkeypatch.setattr(db_setup, "replica_engine", replica)
+    monkeypatch.setattr(db_setup, "async_read_engine", replica)
+    assert _read_bind() is replica
+    assert _read_bind(str(time.time() + 5)) is db_setup.primary_read_engine
+    assert _read_bind(str(time.time() - 1)) is replica
@@ -1,9 +1,21 @@
 import pytest
+from sqlalchemy import event
 from datetime import date, timedelta, datetime, time
 from fastapi.testclient import TestClient
 from Backend.app.main import app
-from Backend.app.core.db_setup import get_db
-from Backend.app.models import User, Employee
+from Backend.app.core.db_setup import get_db, get_async_db, get_async_read_db
+from Backend.app.models import (
+    User,
+    Employee,
+    Customer,
+    Measure,
+    CareVisit,
+    MeasureCareVisit,
+    ScheduleCustomer,
+    ScheduleEmployee,
+    ScheduleMeasure,
+)
+from Backend.app.models.employee import EmployeeCareVisit
 from Backend.app.core.enums import RoleType, ShiftType
 from Backend.app.crud.schedule import create_schedule
 from Backend.app.schemas.schedule import ScheduleBaseSchema
@@ -30,8 +42,10 @@ def override_require_admin():
 
 
 @pytest.fixture
-def client(db):
+def client(db, override_get_async_db, override_get_async_read_db):
     app.dependency_overrides[get_db] = override_get_db(db)
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    app.dependency_overrides[get_async_read_db] = override_get_async_read_db
     app.dependency_overrides[require_admin] = override_require_admin
     with TestClient(app) as c:
         yield c
@@ -72,3 +86,195 @@ def test_filter_by_date(client, setup_schedules):
     assert response.status_code == 200
     data = response.json()
     assert all(s["date"].startswith(target_date.split("T")[0]) for s in data)
+
+
+def test_batch_assign_customers(client, db, setup_schedules):
+    schedule_id = setup_schedules[0].id
+    customers = [
+        Customer(
+            first_name="Kund", last_name=str(i), key_number=3000 + i, address="Vagen 1"
+        )
+        for i in range(3)
+    ]
+    db.add_all(customers)
+    db.commit()
+    ids = [c.id for c in customers]
+
+    response = client.post(
+        f"/schedules/{schedule_id}/customers:batch", json={"customer_ids": ids[:2]}
+    )
+    assert response.status_code == 200
+    assert response.json() == {"inserted": ids[:2], "already_assigned": []}
+
+    response = client.post(
+        f"/schedules/{schedule_id}/customers:batch", json={"customer_ids": ids}
+    )
+    assert response.status_code == 200
+    assert response.json() == {"inserted": ids[2:], "already_assigned": ids[:2]}
+
+
+def test_batch_assign_employees_and_measures(client, db, setup_schedules):
+    schedule_id = setup_schedules[0].id
+    employee = Employee(user=User(email="batch@example.com"))
+    measure = Measure(name="Stadning", default_duration=45)
+    db.add_all([employee, measure])
+    db.commit()
+
+    response = client.post(
+        f"/schedules/{schedule_id}/employees:batch",
+        json={"employee_ids": [employee.id, employee.id]},
+    )
+    assert response.json() == {"inserted": [employee.id], "already_assigned": []}
+
+    response = client.post(
+        f"/schedules/{schedule_id}/measures:batch",
+        json={"measures": [{"measure_id": measure.id, "time_of_day": "evening"}]},
+    )
+    assert response.json() == {"inserted": [measure.id], "already_assigned": []}
+
+
+def test_batch_assign_unknown_ids(client, setup_schedules):
+    response = client.post(
+        f"/schedules/{setup_schedules[0].id}/employees:batch",
+        json={"employee_ids": [9998, 9999]},
+    )
+    assert response.status_code == 400
+    assert "9998, 9999" in response.json()["detail"]
+
+    response = client.post(
+        "/schedules/999999/customers:batch", json={"customer_ids": [1]}
+    )
+    assert response.status_code == 404
+
+
+def _staff_schedule(db, schedule, size):
+    for i in range(size):
+        key = schedule.id * 100 + i
+        employee = Employee(user=User(email=f"full{key}@example.com"))
+        customer = Customer(
+            first_name="Full",
+            last_name=str(i),
+            key_number=key,
+            address="Vagen 2",
+            care_level="low",
+            gender="female",
+            approved_hours=2.0,
+        )
+        measure = Measure(name=f"Insats {key}", default_duration=10)
+        db.add_all([employee, customer, measure])
+        db.flush()
+        visit = CareVisit(
+            date=schedule.date,
+            status="planned",
+            duration=10,
+            schedule_id=schedule.id,
+            customer_id=customer.id,
+        )
+        db.add(visit)
+        db.flush()
+        db.add_all(
+            [
+                ScheduleEmployee(schedule_id=schedule.id, employee_id=employee.id),
+                ScheduleCustomer(schedule_id=schedule.id, customer_id=customer.id),
+                ScheduleMeasure(schedule_id=schedule.id, measure_id=measure.id),
+                MeasureCareVisit(measure_id=measure.id, care_visit_id=visit.id),
+                EmployeeCareVisit(employee_id=employee.id, care_visit_id=visit.id),
+            ]
+        )
+    db.commit()
+
+
+def _count_queries(db, async_engine, call):
+    statements = []
+
+    def _count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = async_engine.sync_engine
+    event.listen(engine, "before_cursor_execute", _count)
+    try:
+        response = call()
+    finally:
+        event.remove(engine, "before_cursor_execute", _count)
+    db.expire_all()
+    return response, len(statements)
+
+
+def test_get_full_schedule_query_count_is_constant(
+    client, db, setup_schedules, async_engine
+):
+    small, large = setup_schedules[0], setup_schedules[1]
+    _staff_schedule(db, small, 1)
+    _staff_schedule(db, large, 6)
+    small_id, large_id, large_date = small.id, large.id, large.date
+
+    response, small_queries = _count_queries(
+        db, async_engine, lambda: client.get(f"/schedules/{small_id}/full")
+    )
+    assert response.status_code == 200
+    assert len(response.json()["employees"]) == 1
+
+    response, large_queries = _count_queries(
+        db, async_engine, lambda: client.get(f"/schedules/{large_id}/full")
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data["employees"]) == 6
+    assert len(data["customers"]) == 6
+    assert data["measures"][0]["measure"]["name"].startswith("Insats")
+    assert len(data["care_visits"]) == 6
+    assert data["care_visits"][0]["employees"][0]["email"].startswith("full")
+    assert data["care_visits"][0]["measures"][0]["name"].startswith("Insats")
+
+    assert small_queries == large_queries
+
+    response = client.get(f"/schedules/by-date/{large_date.isoformat()}/full")
+    assert response.status_code == 200
+    assert response.json()["id"] == large_id
+
+
+def test_get_full_schedule_not_found(client):
+    assert client.get("/schedules/999999/full").status_code == 404
+    assert client.get("/schedules/by-date/1999-01-01/full").status_code == 404
+
+
+def test_schedule_calendar_counts(client, db, setup_schedules, async_engine):
+    small, large = setup_schedules[0], setup_schedules[1]
+    _staff_schedule(db, small, 1)
+    _staff_schedule(db, large, 3)
+    db.add(
+        CareVisit(
+            date=large.date,
+            status="completed",
+            duration=10,
+            schedule_id=large.id,
+            customer_id=large.customers[0].customer_id,
+        )
+    )
+    db.commit()
+    month = large.date.strftime("%Y-%m")
+
+    response, queries = _count_queries(
+        db,
+        async_engine,
+        lambda: client.get("/schedules/calendar", params={"month": month}),
+    )
+    assert response.status_code == 200
+    assert queries == 1
+
+    days = {day["id"]: day for day in response.json()}
+    assert days[large.id]["employee_count"] == 3
+    assert days[large.id]["customer_count"] == 3
+    assert days[large.id]["measure_count"] == 3
+    assert days[large.id]["visit_count"] == 4
+    assert days[large.id]["visits_by_status"]["planned"] == 3
+    assert days[large.id]["visits_by_status"]["completed"] == 1
+    assert days[large.id]["visits_by_status"]["canceled"] == 0
+    if small.date.month == large.date.month:
+        assert days[small.id]["visit_count"] == 1
+
+
+def test_schedule_calendar_rejects_bad_month(client):
+    for month in ("2025-13", "0000-01"):
+        response = client.get("/schedules/calendar", params={"month": month})
+        assert response.status_code == 422
@@ -4,7 +4,7 @@ from fastapi.testclient import TestClient
 from Backend.app.main import app
 from Backend.app.models import User, Employee
 from Backend.app.core.enums import RoleType
-from Backend.app.core.db_setup import get_db
+from Backend.app.core.db_setup import get_db, get_async_db, get_async_read_db
 from Backend.app.routers import user as user_router
 from Backend.app.core.security import get_password_hash
 
@@ -29,8 +29,10 @@ def override_require_admin():
 
 
 @pytest.fixture
-def client(db):
+def client(db, override_get_async_db, override_get_async_read_db):
     app.dependency_overrides[get_db] = override_get_db(db)
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    app.dependency_overrides[get_async_read_db] = override_get_async_read_db
     app.dependency_overrides[user_router.require_admin] = override_require_admin
     with TestClient(app) as c:
         yield c
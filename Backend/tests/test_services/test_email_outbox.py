@@ -0,0 +1,180 @@
+import asyncio
+import datetime
+import socket
+import threading
+import pytest
+from aiosmtpd.controller import Controller
+from sqlalchemy import select
+from Backend.app.core.enums import OutboxStatus
+from Backend.app.core.settings import settings
+from Backend.app.crud.email_outbox import enqueue_email
+from Backend.app.crud.user import invite_user
+from Backend.app.models import EmailOutbox
+from Backend.app.schemas.user import UserInviteSchema
+from Backend.app.services import email_outbox
+from Backend.app.services.email_outbox import (
+    deliver_outbox,
+    deliver_outbox_periodically,
+)
+from Backend.app.services.email_service import SmtpSender
+
+
+class RecordingHandler:
+    """Accepts everything except recipients at reject.example.com"""
+
+    def __init__(self):
+        self.connections = 0
+        self.messages = []
+
+    async def handle_EHLO(self, server, session, envelope, hostname, responses):
+        self.connections += 1
+        session.host_name = hostname
+        return responses
+
+    async def handle_RCPT(self, server, session, envelope, address, rcpt_options):
+        if address.endswith("@reject.example.com"):
+            return "550 Mailbox unavailable"
+        envelope.rcpt_tos.append(address)
+        return "250 OK"
+
+    async def handle_DATA(self, server, session, envelope):
+        self.messages.append((envelope.rcpt_tos, envelope.content.decode()))
+        return "250 Message accepted"
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+@pytest.fixture
+def smtp_settings(monkeypatch):
+    monkeypatch.setattr(settings, "SMTP_SERVER", "127.0.0.1")
+    monkeypatch.setattr(settings, "SMTP_PORT", _free_port())
+    monkeypatch.setattr(settings, "SMTP_STARTTLS", False)
+    monkeypatch.setattr(settings, "SMTP_USE_CREDENTIALS", False)
+    monkeypatch.setattr(settings, "EMAIL_RETRY_BASE_SECONDS", 30)
+    monkeypatch.setattr(settings, "EMAIL_MAX_ATTEMPTS", 2)
+
+
+@pytest.fixture
+def smtp_server(smtp_settings):
+    handler = RecordingHandler()
+    controller = Controller(
+        handler, hostname=settings.SMTP_SERVER, port=settings.SMTP_PORT
+    )
+    controller.start()
+    yield handler
+    controller.stop()
+
+
+@pytest.fixture
+def sender():
+    sender = SmtpSender()
+    yield sender
+    sender.close()
+
+
+def _outbox(db):
+    db.expire_all()
+    return db.execute(select(EmailOutbox).order_by(EmailOutbox.id)).scalars().all()
+
+
+def test_invite_queues_email_in_same_transaction(db):
+    invite_user(db, UserInviteSchema(email="new@example.com", is_superuser=False))
+
+    [email] = _outbox(db)
+    assert email.recipient == "new@example.com"
+    assert email.status == OutboxStatus.PENDING.value
+    assert "/register?token=" in email.body
+
+    with pytest.raises(ValueError):
+        invite_user(db, UserInviteSchema(email="new@example.com", is_superuser=False))
+    assert len(_outbox(db)) == 1
+
+
+def test_deliver_outbox_reuses_one_connection(db, smtp_server, sender):
+    for i in range(3):
+        enqueue_email(db, f"user{i}@example.com", "Hello", f"Body {i}")
+    db.commit()
+
+    assert deliver_outbox(db, sender) == 3
+    enqueue_email(db, "late@example.com", "Hello", "Late")
+    db.commit()
+    assert deliver_outbox(db, sender) == 1
+    assert deliver_outbox(db, sender) == 0
+
+    assert smtp_server.connections == 1
+    assert [rcpt for rcpt, _ in smtp_server.messages] == [
+        ["user0@example.com"],
+        ["user1@example.com"],
+        ["user2@example.com"],
+        ["late@example.com"],
+    ]
+    assert "Subject: Hello" in smtp_server.messages[0][1]
+    assert all(
+        email.status == OutboxStatus.SENT.value and email.sent_at
+        for email in _outbox(db)
+    )
+
+
+def test_rejected_email_backs_off_then_fails(db, smtp_server, sender):
+    enqueue_email(db, "nobody@reject.example.com", "Hello", "Body")
+    enqueue_email(db, "ok@example.com", "Hello", "Body")
+    db.commit()
+
+    assert deliver_outbox(db, sender) == 2
+    rejected, accepted = _outbox(db)
+    assert accepted.status == OutboxStatus.SENT.value
+    assert rejected.status == OutboxStatus.PENDING.value
+    assert rejected.attempts == 1
+    assert "Mailbox unavailable" in rejected.last_error
+    now = datetime.datetime.now(datetime.UTC).replace(tzinfo=None)
+    assert rejected.next_attempt_at > now + datetime.timedelta(seconds=25)
+
+    # Not due yet
+    assert deliver_outbox(db, sender) == 0
+
+    rejected.next_attempt_at = now
+    db.commit()
+    assert deliver_outbox(db, sender) == 1
+    [rejected, _] = _outbox(db)
+    assert rejected.attempts == 2
+    assert rejected.status == OutboxStatus.FAILED.value
+
+
+def test_unreachable_server_charges_no_attempt(db, smtp_settings, sender):
+    enqueue_email(db, "user@example.com", "Hello", "Body")
+    db.commit()
+
+    with pytest.raises(OSError):
+        deliver_outbox(db, sender)
+
+    [email] = _outbox(db)
+    assert email.status == OutboxStatus.PENDING.value
+    assert email.attempts == 0
+
+
+def test_cancel_waits_for_batch_in_flight(monkeypatch):
+    started, release = threading.Event(), threading.Event()
+    finished = []
+
+    def slow_delivery():
+        started.set()
+        release.wait(5)
+        finished.append(True)
+        return 0
+
+    monkeypatch.setattr(email_outbox, "run_outbox_delivery", slow_delivery)
+    monkeypatch.setattr(settings, "EMAIL_OUTBOX_POLL_SECONDS", 0)
+
+    async def cancel_mid_batch():
+        worker = asyncio.create_task(deliver_outbox_periodically())
+        await asyncio.to_thread(started.wait, 5)
+        worker.cancel()
+        threading.Timer(0.1, release.set).start()
+        await asyncio.gather(worker, return_exceptions=True)
+        return worker.cancelled(), list(finished)
+
+    assert asyncio.run(cancel_mid_batch()) == (True, [True])
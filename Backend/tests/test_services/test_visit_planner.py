@@ -0,0 +1,51 @@
+import pytest
+from datetime import date
+from Backend.app.services.visit_planner import expand_occurrences, parse_days_of_week
+
+
+def test_parse_days_of_week():
+    assert parse_days_of_week(["Monday", "thu", "sun"]) == {0, 3, 6}
+    assert parse_days_of_week(None) == set()
+
+
+def test_parse_days_of_week_unknown_day():
+    with pytest.raises(ValueError, match="Unknown day of week"):
+        parse_days_of_week(["someday"])
+
+
+def test_expand_daily():
+    dates = expand_occurrences("DAILY", None, None, date(2025, 3, 3), date(2025, 3, 9))
+    assert len(dates) == 7
+
+
+def test_expand_weekly_days_of_week():
+    # 2025-03-03 is a Monday
+    dates = expand_occurrences(
+        "WEEKLY", ["monday", "thursday"], None, date(2025, 3, 3), date(2025, 3, 16)
+    )
+    assert dates == [
+        date(2025, 3, 3),
+        date(2025, 3, 6),
+        date(2025, 3, 10),
+        date(2025, 3, 13),
+    ]
+
+
+def test_expand_weekly_occurrences_spread():
+    dates = expand_occurrences("weekly", None, 3, date(2025, 3, 3), date(2025, 3, 9))
+    assert [d.weekday() for d in dates] == [0, 2, 4]
+
+
+def test_expand_monthly():
+    dates = expand_occurrences("MONTHLY", None, 2, date(2025, 2, 1), date(2025, 3, 31))
+    assert dates == [
+        date(2025, 2, 1),
+        date(2025, 2, 15),
+        date(2025, 3, 1),
+        date(2025, 3, 16),
+    ]
+
+
+def test_expand_unknown_frequency():
+    with pytest.raises(ValueError, match="Unknown frequency"):
+        expand_occurrences("YEARLY", None, None, date(2025, 1, 1), date(2025, 1, 2))
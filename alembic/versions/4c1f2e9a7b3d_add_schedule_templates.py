@@ -0,0 +1,87 @@
+"""add schedule templates
+
+Revision ID: 4c1f2e9a7b3d
+Revises: 731ba0d68488
+Create Date: 2026-10-18 09:12:41.512377
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "4c1f2e9a7b3d"
+down_revision: Union[str, Sequence[str], None] = "731ba0d68488"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+shift_enum = postgresql.ENUM(
+    "MORNING", "DAY", "EVENING", "NIGHT", name="shifttype", create_type=False
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "schedule_templates",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(length=100), nullable=False),
+        sa.Column("weeks", sa.Integer(), nullable=False),
+        sa.Column(
+            "created", sa.DateTime(), server_default=sa.text("now()"), nullable=False
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("name"),
+    )
+    op.create_table(
+        "schedule_template_shifts",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("template_id", sa.Integer(), nullable=False),
+        sa.Column("week_offset", sa.Integer(), nullable=False),
+        sa.Column("weekday", sa.Integer(), nullable=False),
+        sa.Column("shift_type", shift_enum, nullable=True),
+        sa.Column("custom_shift", sa.String(length=50), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["template_id"], ["schedule_templates.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("template_id", "week_offset", "weekday"),
+    )
+    op.create_table(
+        "schedule_template_employee",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("template_shift_id", sa.Integer(), nullable=False),
+        sa.Column("employee_id", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["employee_id"], ["employee.id"]),
+        sa.ForeignKeyConstraint(
+            ["template_shift_id"], ["schedule_template_shifts.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("template_shift_id", "employee_id"),
+    )
+    op.create_table(
+        "schedule_template_measure",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("template_shift_id", sa.Integer(), nullable=False),
+        sa.Column("measure_id", sa.Integer(), nullable=False),
+        sa.Column("time_of_day", sa.String(length=20), nullable=True),
+        sa.Column("custom_duration", sa.Integer(), nullable=True),
+        sa.Column("notes", sa.String(length=255), nullable=True),
+        sa.ForeignKeyConstraint(["measure_id"], ["measures.id"]),
+        sa.ForeignKeyConstraint(
+            ["template_shift_id"], ["schedule_template_shifts.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("schedule_template_measure")
+    op.drop_table("schedule_template_employee")
+    op.drop_table("schedule_template_shifts")
+    op.drop_table("schedule_templates")
@@ -0,0 +1,42 @@
+"""add unique constraints to schedule assignments
+
+Revision ID: 9a3e5d71c2f8
+Revises: 4c1f2e9a7b3d
+Create Date: 2026-10-18 10:04:17.220931
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9a3e5d71c2f8"
+down_revision: Union[str, Sequence[str], None] = "4c1f2e9a7b3d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ASSIGNMENT_TABLES = [
+    ("schedule_employee", "employee_id"),
+    ("schedule_customer", "customer_id"),
+    ("schedule_measure", "measure_id"),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, column in ASSIGNMENT_TABLES:
+        # Keep the oldest row of any duplicated assignment
+        op.execute(
+            f"DELETE FROM {table} a USING {table} b "
+            f"WHERE a.schedule_id = b.schedule_id AND a.{column} = b.{column} "
+            f"AND a.id > b.id"
+        )
+        op.create_unique_constraint(f"uq_{table}", table, ["schedule_id", column])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, _ in reversed(ASSIGNMENT_TABLES):
+        op.drop_constraint(f"uq_{table}", table, type_="unique")
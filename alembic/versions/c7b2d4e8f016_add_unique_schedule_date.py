@@ -0,0 +1,48 @@
+"""add unique constraint to schedules.date
+
+Revision ID: c7b2d4e8f016
+Revises: 9a3e5d71c2f8
+Create Date: 2026-10-18 11:31:52.804119
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c7b2d4e8f016"
+down_revision: Union[str, Sequence[str], None] = "9a3e5d71c2f8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Duplicated schedules may already carry visits and assignments, so they
+    # have to be merged by hand rather than dropped here.
+    duplicates = (
+        op.get_bind()
+        .execute(
+            sa.text(
+                "SELECT date FROM schedules GROUP BY date HAVING count(*) > 1 "
+                "ORDER BY date"
+            )
+        )
+        .scalars()
+        .all()
+    )
+    if duplicates:
+        raise RuntimeError(
+            "Cannot add unique constraint, multiple schedules exist for: "
+            + ", ".join(str(d) for d in duplicates)
+        )
+
+    op.create_unique_constraint("schedules_date_key", "schedules", ["date"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint("schedules_date_key", "schedules", type_="unique")
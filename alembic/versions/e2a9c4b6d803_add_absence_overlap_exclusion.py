@@ -0,0 +1,63 @@
+"""add absence overlap exclusion constraint
+
+Revision ID: e2a9c4b6d803
+Revises: c7b2d4e8f016
+Create Date: 2026-10-18 13:47:05.338410
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e2a9c4b6d803"
+down_revision: Union[str, Sequence[str], None] = "c7b2d4e8f016"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Overlapping absences have to be resolved by hand, there is no safe
+    # way to decide which one to keep.
+    overlapping = (
+        op.get_bind()
+        .execute(
+            sa.text(
+                "SELECT DISTINCT a.employee_id FROM absences a JOIN absences b "
+                "ON a.employee_id = b.employee_id AND a.id < b.id "
+                "AND daterange(a.start_date, a.end_date, '[]') "
+                "&& daterange(b.start_date, b.end_date, '[]') "
+                "ORDER BY a.employee_id"
+            )
+        )
+        .scalars()
+        .all()
+    )
+    if overlapping:
+        raise RuntimeError(
+            "Cannot add exclusion constraint, overlapping absences exist for "
+            "employees: " + ", ".join(str(e) for e in overlapping)
+        )
+
+    op.create_index(
+        "ix_absence_period",
+        "absences",
+        [sa.text("daterange(start_date, end_date, '[]')")],
+        postgresql_using="gist",
+    )
+    op.execute(
+        "ALTER TABLE absences ADD CONSTRAINT ex_absence_employee_period "
+        "EXCLUDE USING gist ("
+        "int4range(employee_id, employee_id, '[]') WITH &&, "
+        "daterange(start_date, end_date, '[]') WITH &&)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("ALTER TABLE absences DROP CONSTRAINT ex_absence_employee_period")
+    op.drop_index("ix_absence_period", table_name="absences")